@@ -20,18 +20,35 @@
 # https://github.com/pylast/pylast
 from __future__ import annotations
 
+import abc
+import atexit
+import collections
+import concurrent.futures
+import functools
+import gzip
 import hashlib
+import heapq
 import html
+import itertools
+import json
 import logging
+import math
+import mmap
 import os
+import pathlib
 import re
 import shelve
+import socket
 import ssl
+import struct
 import tempfile
+import threading
 import time
 import typing
+import weakref
 import xml.parsers
-from urllib.parse import quote_plus
+import zlib
+from urllib.parse import quote_plus, unquote, urlsplit
 from xml.dom import Node, minidom
 
 import httpx2 as httpx
@@ -40,7 +57,7 @@ from ._version import __version__
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import Callable, Generator, Iterator
 
 
 __author__ = "Amr Hassan, hugovk, Mice Pápai"
@@ -105,6 +122,14 @@ SIZE_LARGE = 2
 SIZE_EXTRA_LARGE = 3
 SIZE_MEGA = 4
 
+# Why a scrobble was ignored, from its ignoredMessage
+SCROBBLE_ACCEPTED = 0
+SCROBBLE_IGNORED_ARTIST = 1
+SCROBBLE_IGNORED_TRACK = 2
+SCROBBLE_IGNORED_TIMESTAMP_TOO_OLD = 3
+SCROBBLE_IGNORED_TIMESTAMP_TOO_NEW = 4
+SCROBBLE_IGNORED_DAILY_LIMIT = 5
+
 IMAGES_ORDER_POPULARITY = "popularity"
 IMAGES_ORDER_DATE = "dateadded"
 
@@ -185,9 +210,24 @@ class _Network:
         self.domain_names = domain_names
         self.urls = urls
         self.proxy = None
-        self.cache_backend: _ShelfCacheBackend | None = None
+        self.cache_backend: _CacheBackend | None = None
+        self.cache_negative_ttl: float | None = None
+        self.cache_records = False
+        self.cache_policies: dict[str, _CachePolicy] = {}
+        self.stats = _RequestStats()
+        # How many seconds objects keep their getInfo fields, or None for ever
+        self.info_max_age: float | None = None
+        self.identity_map: _IdentityMap | None = None
+        self.mbid_index: _MbidIndex | None = None
+        self.correction_cache: _CorrectionCache | None = None
         self.last_call_time: float = 0.0
         self.limit_rate = False
+        self._rate_limit_lock = threading.Lock()
+        self._cache_refreshes: set[str] = set()
+        self._cache_refresh_lock = threading.Lock()
+        self._cache_refresh_executor: concurrent.futures.ThreadPoolExecutor | None = (
+            None
+        )
 
         if isinstance(proxy, str):
             self.proxy = {"https://": httpx.HTTPTransport(proxy=proxy)}
@@ -220,6 +260,31 @@ class _Network:
     def __str__(self) -> str:
         return f"{self.name} Network"
 
+    def __getstate__(self) -> dict:
+        # Locks and worker threads belong to the pickling process
+        state = self.__dict__.copy()
+        del state["_rate_limit_lock"], state["_cache_refresh_lock"]
+        state["_cache_refreshes"] = set()
+        state["_cache_refresh_executor"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # Networks pickled by older versions lack the newer attributes
+        self.cache_negative_ttl = None
+        self.cache_records = False
+        self.cache_policies = {}
+        self.stats = _RequestStats()
+        self.info_max_age = None
+        self.identity_map = None
+        self.mbid_index = None
+        self.correction_cache = None
+        self._cache_refreshes = set()
+        self._cache_refresh_executor = None
+
+        self.__dict__.update(state)
+        self._rate_limit_lock = threading.Lock()
+        self._cache_refresh_lock = threading.Lock()
+
     def get_artist(self, artist_name: str) -> Artist:
         """
         Return an Artist object
@@ -291,14 +356,15 @@ class _Network:
         """
         Makes sure that web service calls are at least 0.2 seconds apart.
         """
-        now = time.time()
+        with self._rate_limit_lock:
+            now = time.time()
 
-        time_since_last = now - self.last_call_time
+            time_since_last = now - self.last_call_time
 
-        if time_since_last < DELAY_TIME:
-            time.sleep(DELAY_TIME - time_since_last)
+            if time_since_last < DELAY_TIME:
+                time.sleep(DELAY_TIME - time_since_last)
 
-        self.last_call_time = now
+            self.last_call_time = time.time()
 
     def get_top_artists(
         self, limit: int | None = None, cacheable: bool = True
@@ -309,9 +375,11 @@ class _Network:
         if limit:
             params["limit"] = limit
 
-        doc = _Request(self, "chart.getTopArtists", params).execute(cacheable)
+        records = _Request(self, "chart.getTopArtists", params).execute_records(
+            _global_top_artist_records, cacheable
+        )
 
-        return _extract_top_artists(doc, self)
+        return _top_artists_from_records(records, self)
 
     def get_top_tracks(
         self, limit: int | None = None, cacheable: bool = True
@@ -328,7 +396,8 @@ class _Network:
         for node in doc.getElementsByTagName("track"):
             title = _extract(node, "name")
             artist = _extract(node, "name", 1)
-            track = Track(artist, title, self)
+            info = _extract_info(node, stats=True)
+            track = Track(artist, title, self, info=info)
             weight = _number(_extract(node, "playcount"))
             seq.append(TopItem(track, weight))
 
@@ -368,9 +437,11 @@ class _Network:
         if limit:
             params["limit"] = limit
 
-        doc = _Request(self, "geo.getTopArtists", params).execute(cacheable)
+        records = _Request(self, "geo.getTopArtists", params).execute_records(
+            _top_artist_records, cacheable
+        )
 
-        return _extract_top_artists(doc, self)
+        return _top_artists_from_records(records, self)
 
     def get_geo_top_tracks(
         self,
@@ -437,22 +508,334 @@ class _Network:
         """Return True if web service calls are rate limited"""
         return self.limit_rate
 
-    def enable_caching(self, file_path=None) -> None:
+    def enable_identity_map(self) -> None:
+        """Makes equal artists, albums, tracks and tags created for this
+        network resolve to one shared instance, while it is in use.
+
+        Names are compared case-insensitively, so the shared instance keeps
+        the capitalization it was first created with. Info filled in from
+        later list responses is merged into it.
+        """
+        if self.identity_map is None:
+            self.identity_map = _IdentityMap()
+
+    def disable_identity_map(self) -> None:
+        """Stops sharing instances of equal artists, albums, tracks and tags"""
+        self.identity_map = None
+
+    def enable_mbid_index(self, file_path=None) -> None:
+        """Keeps an index of the MusicBrainz IDs of artists, albums and tracks,
+        filled in from every response that carries them. Looking up an MBID,
+        or the MBID of an object, then needs no request when it is indexed.
+
+        * file_path: A file to keep the index in across runs. If None, it is
+        kept in memory.
+        """
+        self.disable_mbid_index()
+        self.mbid_index = _MbidIndex(file_path)
+
+    def disable_mbid_index(self) -> None:
+        """Stops indexing MusicBrainz IDs, and closes the index file."""
+        if self.mbid_index is not None:
+            self.mbid_index.close()
+        self.mbid_index = None
+
+    def _record_mbid(self, obj) -> None:
+        mbid = obj.info.get("mbid")
+        if self.mbid_index is not None and mbid:
+            self.mbid_index.add(obj.ws_prefix, tuple(obj._get_params().values()), mbid)
+
+    def enable_correction_cache(
+        self, ttl: float | None = 30 * 24 * 60 * 60, memory_max_entries: int = 10000
+    ) -> None:
+        """Remembers the corrections of artist and track names, keyed by the
+        casefolded names, so get_correction() asks for each name once.
+
+        * ttl: For how many seconds a correction is used, or None for ever.
+        * memory_max_entries: How many corrections to keep in memory. With
+        caching enabled, all of them are also kept in the cache's storage.
+        """
+        self.correction_cache = _CorrectionCache(ttl, memory_max_entries)
+
+    def disable_correction_cache(self) -> None:
+        """Stops remembering the corrections of artist and track names."""
+        self.correction_cache = None
+
+    def _get_correction(self, obj) -> str | None:
+        cache = self.correction_cache
+        if cache is None:
+            return _extract(obj._request(obj.ws_prefix + ".getCorrection"), "name")
+
+        identity = obj._get_identity()
+        found, correction = cache.get(identity)
+        if found:
+            return correction
+
+        key = _CorrectionCache.make_key(identity)
+        backend = self.cache_backend
+        if backend is not None:
+            entry = backend.get_entry(key)
+            if entry is not None and entry.xml is not None and not entry.is_expired():
+                correction = json.loads(entry.xml)
+                cache.set(identity, correction)
+                return correction
+
+        correction = _extract(obj._request(obj.ws_prefix + ".getCorrection"), "name")
+        cache.set(identity, correction)
+        if backend is not None:
+            expires = time.time() + cache.ttl if cache.ttl is not None else None
+            backend.set_entry(key, _CacheEntry(json.dumps(correction), expires))
+        return correction
+
+    def _lookup_mbid(self, obj) -> str | None:
+        if self.mbid_index is None:
+            return None
+        return self.mbid_index.get_mbid(
+            obj.ws_prefix, tuple(obj._get_params().values())
+        )
+
+    def enable_caching(
+        self,
+        file_path=None,
+        memory_max_entries: int | None = None,
+        memory_max_bytes: int | None = None,
+        compression: str | None = "zlib",
+        compression_level: int | None = None,
+        compression_threshold: int = 512,
+        negative_ttl: float | None = None,
+        max_bytes: int | None = None,
+        eviction: str = "lru",
+        write_buffer_entries: int | None = None,
+        write_buffer_bytes: int | None = None,
+        write_buffer_seconds: float | None = None,
+        snapshot_path=None,
+        records: bool = False,
+        redis_url: str | None = None,
+    ) -> None:
         """Enables caching request-wide for all cacheable calls.
 
         * file_path: A file path for the backend storage file. If
         None set, a temp file would probably be created, according the backend.
+        * memory_max_entries: If set, keep up to this many parsed responses in
+        an in-memory LRU tier in front of the backend storage.
+        * memory_max_bytes: If set, bound the in-memory LRU tier by the total
+        size of the cached responses.
+        * compression: "zlib", "zstd" (needs Python 3.14+ or the zstandard
+        package) or None to store responses uncompressed.
+        * compression_level: The codec's compression level, or None for its
+        default.
+        * compression_threshold: Responses shorter than this many characters
+        are stored uncompressed.
+        * negative_ttl: If set, "invalid parameters" and "invalid resource"
+        errors (such as a misspelled artist name) are cached for this many
+        seconds and raised again on a hit.
+        * max_bytes: If set, evict entries to keep the cached responses within
+        this many bytes.
+        * eviction: Which entries to evict first: "lru" for the least recently
+        used or "lfu" for the least frequently used.
+        * write_buffer_entries, write_buffer_bytes, write_buffer_seconds: If
+        any is set, buffer writes to the backend storage and commit them as a
+        group once the buffer holds that many entries or bytes, or is that
+        many seconds old, and when caching is disabled. A crash loses at most
+        the buffered writes.
+        * snapshot_path: A snapshot written by write_cache_snapshot(), to serve
+        as a read-only tier in front of the backend storage. Processes on one
+        host reading the same snapshot share it through the page cache.
+        * records: If True, also cache the records extracted from responses,
+        such as the names and play counts behind top lists, so a hit skips
+        parsing the XML.
+        * redis_url: A redis://[[username]:password@]host[:port][/db] URL of a
+        server speaking the Redis protocol, to share the backend storage
+        between hosts instead of using a file. max_bytes, eviction and the
+        write buffer only apply to files.
         """
-        if not file_path:
-            self.cache_backend = _ShelfCacheBackend.create_shelf()
-            return
+        if redis_url and file_path:
+            msg = "Pass either file_path or redis_url, not both"
+            raise ValueError(msg)
+
+        # Commits the buffered writes of the cache being replaced
+        self.disable_caching()
+
+        compressor = None
+        if compression:
+            compressor = _CacheCompressor(
+                compression, compression_level, compression_threshold
+            )
+
+        shelf_options: dict[str, typing.Any] = {
+            "compressor": compressor,
+            "max_bytes": max_bytes,
+            "eviction": eviction,
+            "write_buffer_entries": write_buffer_entries,
+            "write_buffer_bytes": write_buffer_bytes,
+            "write_buffer_seconds": write_buffer_seconds,
+        }
+        backend: _CacheBackend
+        if redis_url:
+            backend = _RedisCacheBackend.from_url(redis_url, compressor=compressor)
+        elif not file_path:
+            backend = _ShelfCacheBackend.create_shelf(**shelf_options)
+        else:
+            backend = _ShelfCacheBackend(file_path, **shelf_options)
+
+        if snapshot_path:
+            backend = _LayeredCacheBackend(
+                _SnapshotCacheBackend(snapshot_path), backend
+            )
 
-        self.cache_backend = _ShelfCacheBackend(file_path)
+        if memory_max_entries is not None or memory_max_bytes is not None:
+            backend = _MemoryCacheBackend(
+                backend, max_entries=memory_max_entries, max_bytes=memory_max_bytes
+            )
+
+        self.cache_backend = backend
+        self.cache_negative_ttl = negative_ttl
+        self.cache_records = records
+
+    def set_cache_policy(
+        self, method_name: str, ttl: float | None = None, max_stale: float | None = None
+    ) -> None:
+        """Sets how long cached responses of a web service method stay fresh.
+
+        * method_name: The web service method, such as "user.getTopArtists".
+        * ttl: For how many seconds a cached response is fresh. If None, it
+        never expires.
+        * max_stale: If set, a response that expired less than this many
+        seconds ago is returned at once, while it is refreshed in the
+        background.
+        """
+        self.cache_policies[method_name] = _CachePolicy(ttl, max_stale)
+
+    def _refresh_cache_entry(self, request: _Request, cache_key: str) -> None:
+        """Refreshes a stale cache entry in the background, once per key."""
+
+        with self._cache_refresh_lock:
+            if cache_key in self._cache_refreshes:
+                return
+            self._cache_refreshes.add(cache_key)
+
+            if self._cache_refresh_executor is None:
+                self._cache_refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="pylast-cache-refresh"
+                )
+
+        self._cache_refresh_executor.submit(self._do_refresh, request, cache_key)
+
+    def _do_refresh(self, request: _Request, cache_key: str) -> None:
+        try:
+            request._update_cache(cache_key)
+        except Exception:
+            logger.warning("Cache refresh failed", exc_info=True)
+        finally:
+            with self._cache_refresh_lock:
+                self._cache_refreshes.discard(cache_key)
 
     def disable_caching(self) -> None:
         """Disables all caching features."""
+        with self._cache_refresh_lock:
+            executor, self._cache_refresh_executor = self._cache_refresh_executor, None
+        if executor is not None:
+            # Let running refreshes finish writing before the backend closes
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if self.cache_backend is not None:
+            self.cache_backend.close()
         self.cache_backend = None
 
+    def export_cache(self, file_path) -> int:
+        """Writes all cached responses to a file, to warm up other caches
+        with import_cache(). Returns the number of entries written.
+
+        The file is gzip-compressed JSON Lines, one entry per line, so it can
+        be streamed.
+        """
+        backend = self._require_cache()
+
+        count = 0
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(_CACHE_EXPORT_HEADER) + "\n")
+            for key, entry in backend.iter_entries():
+                record: dict[str, typing.Any] = {
+                    "key": key,
+                    "xml": entry.xml,
+                    "expires": entry.expires,
+                }
+                if entry.error is not None:
+                    record["error"] = list(entry.error)
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def import_cache(self, file_path) -> int:
+        """Adds the entries of a file written by export_cache() to the cache,
+        keeping their expiry times. Entries already in the cache are skipped.
+        Returns the number of entries added.
+        """
+        backend = self._require_cache()
+
+        count = 0
+        with gzip.open(file_path, "rt", encoding="utf-8") as f:
+            if json.loads(f.readline()) != _CACHE_EXPORT_HEADER:
+                msg = f"Not a pylast cache export: {file_path}"
+                raise PyLastError(msg)
+
+            for line in f:
+                record = json.loads(line)
+                if record["key"] in backend:
+                    continue
+                error = record.get("error")
+                backend.set_entry(
+                    record["key"],
+                    _CacheEntry(
+                        record["xml"],
+                        record["expires"],
+                        tuple(error) if error else None,
+                    ),
+                )
+                count += 1
+
+        backend.flush()
+        return count
+
+    def write_cache_snapshot(
+        self, file_path, compression: str | None = "zlib", compression_level=None
+    ) -> int:
+        """Writes all cached responses to a compact, read-only snapshot file,
+        for use with enable_caching(snapshot_path=...). Returns the number of
+        entries written.
+        """
+        backend = self._require_cache()
+        compressor = None
+        if compression:
+            compressor = _CacheCompressor(compression, compression_level)
+
+        return _SnapshotCacheBackend.write(
+            file_path, backend.iter_entries(), compressor
+        )
+
+    def _require_cache(self) -> _CacheBackend:
+        if self.cache_backend is None:
+            msg = "Caching is not enabled"
+            raise PyLastError(msg)
+        return self.cache_backend
+
+    def get_cache_usage(self) -> dict[str, int | None]:
+        """Returns the cache's size and eviction counters, such as
+        {"size": ..., "max_bytes": ..., "evictions": ..., "evicted_bytes": ...}.
+        """
+        if self.cache_backend is None:
+            return {}
+        return self.cache_backend.usage()
+
+    def get_stats(self) -> dict[str, dict[str, float | None]]:
+        """Returns the cache and request counters by web service method, such
+        as {"artist.getInfo": {"hits": ..., "misses": ..., ...}}.
+
+        See _RequestStats.snapshot() for the counters. Clear them with
+        stats.reset().
+        """
+        return self.stats.snapshot()
+
     def is_caching_enabled(self) -> bool:
         """Returns True if caching is enabled."""
         return self.cache_backend is not None
@@ -480,29 +863,271 @@ class _Network:
     def get_track_by_mbid(self, mbid: str) -> Track:
         """Looks up a track by its MusicBrainz ID"""
 
-        params = {"mbid": mbid}
-
-        doc = _Request(self, "track.getInfo", params).execute(True)
-
-        return Track(_extract(doc, "name", 1), _extract(doc, "name"), self)
+        return self._get_by_mbid("track", mbid)
 
     def get_artist_by_mbid(self, mbid: str) -> Artist:
         """Looks up an artist by its MusicBrainz ID"""
 
-        params = {"mbid": mbid}
-
-        doc = _Request(self, "artist.getInfo", params).execute(True)
-
-        return Artist(_extract(doc, "name"), self)
+        return self._get_by_mbid("artist", mbid)
 
     def get_album_by_mbid(self, mbid: str) -> Album:
         """Looks up an album by its MusicBrainz ID"""
 
-        params = {"mbid": mbid}
+        return self._get_by_mbid("album", mbid)
+
+    def resolve_mbids(
+        self, mbids, kind: str = "artist", max_workers: int = 4
+    ) -> list[MbidResult]:
+        """Looks up many artists, albums or tracks by their MusicBrainz IDs.
+
+        * kind: "artist", "album" or "track".
+
+        IDs in the MBID index need no request. The others are fetched once
+        each, with up to max_workers requests at a time, rate limited if
+        enabled. Returns an MbidResult per ID, in order, with either the
+        object or the error its request failed with.
+        """
+        if kind not in _MBID_KINDS:
+            msg = f"Unknown kind: {kind}"
+            raise ValueError(msg)
+
+        mbids = list(mbids)
+        found: dict[str, typing.Any] = {}
+        errors: dict[str, PyLastError] = {}
+
+        unknown = []
+        for mbid in dict.fromkeys(mbids):
+            obj = self._get_indexed_by_mbid(kind, mbid)
+            if obj is None:
+                unknown.append(mbid)
+            else:
+                found[mbid] = obj
+
+        if unknown:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pylast-mbid"
+            ) as executor:
+                futures = {
+                    executor.submit(self._get_by_mbid, kind, mbid): mbid
+                    for mbid in unknown
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    mbid = futures[future]
+                    try:
+                        found[mbid] = future.result()
+                    except PyLastError as e:
+                        errors[mbid] = e
+
+        return [MbidResult(mbid, found.get(mbid), errors.get(mbid)) for mbid in mbids]
+
+    def _get_by_mbid(self, kind: str, mbid: str):
+        obj = self._get_indexed_by_mbid(kind, mbid)
+        if obj is not None:
+            return obj
+
+        doc = _Request(self, kind + ".getInfo", {"mbid": mbid}).execute(True)
+
+        if kind == "track":
+            obj = Track(_extract(doc, "name", 1), _extract(doc, "name"), self)
+        elif kind == "album":
+            obj = Album(_extract(doc, "artist"), _extract(doc, "name"), self)
+        else:
+            obj = Artist(_extract(doc, "name"), self)
+
+        obj._set_info(doc)
+        # Responses to lookups by MBID don't always repeat it
+        if not obj.info.get("mbid"):
+            obj.info["mbid"] = mbid
+        if self.mbid_index is not None:
+            # Also index the ID asked for, in case it redirects to another
+            self.mbid_index.add(kind, tuple(obj._get_params().values()), mbid)
+        return obj
+
+    def _get_indexed_by_mbid(self, kind: str, mbid: str):
+        if self.mbid_index is None:
+            return None
+
+        names = self.mbid_index.get_names(kind, mbid)
+        if names is None:
+            return None
+
+        entity = {"artist": Artist, "album": Album, "track": Track}[kind]
+        # Set after construction, which would index the MBID again
+        obj = entity(*names, self)
+        if not obj.info.get("mbid"):
+            obj.info["mbid"] = mbid
+        return obj
+
+    def get_info_many(self, objs, max_workers: int = 4) -> list[InfoResult]:
+        """Fetches the info of many artists, albums, tracks and users at once,
+        and fills each object's info with it.
+
+        Equal objects are fetched once. With caching enabled, the cache is
+        checked for all of them in one go, and only the misses are fetched,
+        with up to max_workers requests at a time, rate limited if enabled.
+
+        Returns an InfoResult per object, in order, with the error its
+        request failed with, if any.
+        """
+        objs = list(objs)
+        for obj in objs:
+            if not isinstance(obj, (Artist, _Opus, User)):
+                msg = "get_info_many() takes artists, albums, tracks and users"
+                raise ValueError(msg)
+
+        keys = [(type(obj), obj._get_identity()) for obj in objs]
+        requests = {
+            key: _Request(self, obj.ws_prefix + ".getInfo", obj._get_params())
+            for key, obj in zip(keys, objs)
+        }
+        docs: dict[tuple, minidom.Document] = {}
+        errors: dict[tuple, PyLastError] = {}
+
+        if self.cache_backend is not None:
+            cache_keys = {
+                key: request._get_cache_key() for key, request in requests.items()
+            }
+            entries = self.cache_backend.get_entries(cache_keys.values())
+            for key, request in requests.items():
+                entry = entries.get(cache_keys[key])
+                if entry is None or entry.is_expired():
+                    continue
+                if entry.error is not None:
+                    self.stats.add(request.params["method"], negative_hits=1)
+                    errors[key] = WSError(self, *entry.error)
+                elif entry.xml is not None:
+                    request._count_hit(entry)
+                    docs[key] = _parse_response(entry.xml)
+
+        misses = [key for key in requests if key not in docs and key not in errors]
+        if misses:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pylast-info"
+            ) as executor:
+                futures = {
+                    executor.submit(requests[key].execute, True): key for key in misses
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    key = futures[future]
+                    try:
+                        docs[key] = future.result()
+                    except PyLastError as e:
+                        errors[key] = e
+
+        for key, obj in zip(keys, objs):
+            if key in docs:
+                obj._set_info(docs[key])
+
+        return [InfoResult(obj, errors.get(key)) for key, obj in zip(keys, objs)]
+
+    def get_artists_info(self, artist_names, max_workers: int = 4) -> list[InfoResult]:
+        """Fetches the info of many artists by name. See get_info_many()."""
+
+        return self.get_info_many(
+            [Artist(name, self) for name in artist_names], max_workers
+        )
+
+    def get_albums_info(self, albums, max_workers: int = 4) -> list[InfoResult]:
+        """Fetches the info of many albums, given as (artist, title) pairs.
+        See get_info_many()."""
+
+        return self.get_info_many(
+            [Album(artist, title, self) for artist, title in albums], max_workers
+        )
+
+    def get_tracks_info(self, tracks, max_workers: int = 4) -> list[InfoResult]:
+        """Fetches the info of many tracks, given as (artist, title) pairs.
+        See get_info_many()."""
+
+        return self.get_info_many(
+            [Track(artist, title, self) for artist, title in tracks], max_workers
+        )
+
+    def get_users_info(self, user_names, max_workers: int = 4) -> list[InfoResult]:
+        """Fetches the info of many users by name. See get_info_many()."""
 
-        doc = _Request(self, "album.getInfo", params).execute(True)
+        return self.get_info_many(
+            [User(name, self) for name in user_names], max_workers
+        )
+
+    def get_images(
+        self, objs, size: int = SIZE_EXTRA_LARGE, max_workers: int = 4
+    ) -> list[ImageResult]:
+        """Gets the images of many artists, albums, tracks and users at once:
+        album and track covers, and user avatars.
 
-        return Album(_extract(doc, "artist"), _extract(doc, "name"), self)
+        Objects from list and search responses usually come with their
+        images. The info of the others is fetched with get_info_many(), and
+        kept in each object's info.
+
+        * size: SIZE_SMALL, SIZE_MEDIUM, SIZE_LARGE, SIZE_EXTRA_LARGE or
+        SIZE_MEGA.
+
+        Returns an ImageResult per object, in order, with the image URL, or
+        None if there is no image of that size, and the error the object's
+        request failed with, if any.
+        """
+        objs = list(objs)
+        for obj in objs:
+            if not isinstance(obj, (Artist, _Opus, User)):
+                msg = "get_images() takes artists, albums, tracks and users"
+                raise ValueError(msg)
+
+        errors = {}
+        missing = [
+            obj for obj in objs if not obj.info.get("image") and obj.info_time is None
+        ]
+        if missing:
+            for result in self.get_info_many(missing, max_workers):
+                if result.error is not None:
+                    errors[id(result.item)] = result.error
+
+        results = []
+        for obj in objs:
+            images = obj.info.get("image") or []
+            url = images[size] if size < len(images) else None
+            results.append(ImageResult(obj, url or None, errors.get(id(obj))))
+        return results
+
+    def correct_many(self, objs, max_workers: int = 4) -> list[CorrectionResult]:
+        """Gets the corrected names of many artists and tracks at once.
+
+        Equal objects, and those whose correction is in the correction cache
+        if enabled, are asked for once, with up to max_workers requests at a
+        time, rate limited if enabled.
+
+        Returns a CorrectionResult per object, in order, with the corrected
+        name, or the error its request failed with.
+        """
+        objs = list(objs)
+        for obj in objs:
+            if not isinstance(obj, (Artist, Track)):
+                msg = "correct_many() takes artists and tracks"
+                raise ValueError(msg)
+
+        unique = {(type(obj), obj._get_identity()): obj for obj in reversed(objs)}
+        corrections: dict[tuple, str | None] = {}
+        errors: dict[tuple, PyLastError] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pylast-correction"
+        ) as executor:
+            futures = {
+                executor.submit(self._get_correction, obj): key
+                for key, obj in unique.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    corrections[key] = future.result()
+                except PyLastError as e:
+                    errors[key] = e
+
+        results = []
+        for obj in objs:
+            key = (type(obj), obj._get_identity())
+            results.append(CorrectionResult(obj, corrections.get(key), errors.get(key)))
+        return results
 
     def update_now_playing(
         self,
@@ -587,9 +1212,11 @@ class _Network:
                 or False if it was chosen by someone else (such as a radio
                 station or recommendation service). Assumes True if not
                 specified.
+
+        Returns a ScrobbleResult telling whether the scrobble was accepted.
         """
 
-        return self.scrobble_many(
+        (result,) = self.scrobble_many(
             (
                 {
                     "artist": artist,
@@ -606,24 +1233,52 @@ class _Network:
                 },
             )
         )
+        if result.error is not None:
+            raise result.error
+        return result
 
-    def scrobble_many(self, tracks) -> None:
+    def scrobble_many(self, tracks, max_workers: int = 1) -> list[ScrobbleResult]:
         """
-        Used to scrobble a batch of tracks at once. The parameter tracks is a
-        sequence of dicts per track containing the keyword arguments as if
+        Used to scrobble a batch of tracks at once. The parameter tracks is an
+        iterable of dicts per track containing the keyword arguments as if
         passed to the scrobble() method.
+
+        Tracks are sent 50 per request, with up to max_workers requests at a
+        time, rate limited if enabled.
+
+        Returns a ScrobbleResult per track, in order: whether it was accepted,
+        why it was ignored if not, and the error its request failed with, if
+        any, so that only the failed scrobbles need to be sent again.
+
+        Unlike in earlier versions, a failed request does not raise, and the
+        other batches are still sent. Errors of the session itself, such as
+        an invalid session key, are still raised, as every batch fails with
+        them.
         """
 
-        tracks_to_scrobble = tracks[:50]
-        if len(tracks) > 50:
-            remaining_tracks = tracks[50:]
+        tracks = iter(tracks)
+        batches = iter(lambda: list(itertools.islice(tracks, 50)), [])
+
+        results = []
+        if max_workers <= 1:
+            for batch in batches:
+                results.extend(self._scrobble_batch(batch))
         else:
-            remaining_tracks = None
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pylast-scrobble"
+            ) as executor:
+                for batch_results in executor.map(self._scrobble_batch, batches):
+                    results.extend(batch_results)
+
+        return results
+
+    def _scrobble_batch(self, tracks: list[dict]) -> list[ScrobbleResult]:
+        """Scrobbles up to 50 tracks with one request."""
 
         params = {}
-        for i in range(len(tracks_to_scrobble)):
-            params[f"artist[{i}]"] = tracks_to_scrobble[i]["artist"]
-            params[f"track[{i}]"] = tracks_to_scrobble[i]["title"]
+        for i in range(len(tracks)):
+            params[f"artist[{i}]"] = tracks[i]["artist"]
+            params[f"track[{i}]"] = tracks[i]["title"]
 
             additional_args = (
                 "timestamp",
@@ -644,21 +1299,45 @@ class _Network:
             }
 
             for arg in additional_args:
-                if (
-                    arg in tracks_to_scrobble[i]
-                    and tracks_to_scrobble[i][arg] is not None
-                ):
+                if arg in tracks[i] and tracks[i][arg] is not None:
                     if arg in args_map_to:
                         maps_to = args_map_to[arg]
                     else:
                         maps_to = arg
 
-                    params[f"{maps_to}[{i}]"] = tracks_to_scrobble[i][arg]
+                    params[f"{maps_to}[{i}]"] = tracks[i][arg]
 
-        _Request(self, "track.scrobble", params).execute()
+        try:
+            doc = _Request(self, "track.scrobble", params).execute()
+        except PyLastError as e:
+            if isinstance(e, WSError) and str(e.status) in _SESSION_ERROR_STATUSES:
+                raise
+            return [ScrobbleResult(track, False, None, None, e) for track in tracks]
+
+        nodes = doc.getElementsByTagName("scrobble")
+        results = []
+        for track, node in zip(tracks, nodes):
+            ignored = node.getElementsByTagName("ignoredMessage")
+            code = int(ignored[0].getAttribute("code") or 0) if ignored else 0
+            results.append(
+                ScrobbleResult(
+                    track,
+                    code == SCROBBLE_ACCEPTED,
+                    code,
+                    _extract(node, "ignoredMessage"),
+                    None,
+                )
+            )
 
-        if remaining_tracks:
-            self.scrobble_many(remaining_tracks)
+        if len(nodes) < len(tracks):
+            error = MalformedResponseError(
+                self, f"{len(nodes)} results for {len(tracks)} scrobbles"
+            )
+            results.extend(
+                ScrobbleResult(track, False, None, None, error)
+                for track in tracks[len(nodes) :]
+            )
+        return results
 
 
 class LastFMNetwork(_Network):
@@ -813,34 +1492,1518 @@ class LibreFMNetwork(_Network):
         )
 
 
-class _ShelfCacheBackend:
-    """Used as a backend for caching cacheable requests."""
+# Scrobble errors caused by the batch itself, which retrying cannot fix
+_REJECTED_SCROBBLE_STATUSES = {str(STATUS_INVALID_PARAMS), str(STATUS_INVALID_RESOURCE)}
+
+# Errors every scrobble request of a session fails with, raised at once
+_SESSION_ERROR_STATUSES = {
+    str(STATUS_AUTH_FAILED),
+    str(STATUS_INVALID_SK),
+    str(STATUS_INVALID_API_KEY),
+    str(STATUS_INVALID_SIGNATURE),
+    str(STATUS_API_KEY_SUSPENDED),
+}
+
+
+class ScrobbleQueue:
+    """A durable queue of scrobbles, sent to a network in the background.
+
+    Scrobbles are appended to a spool file and the calls return at once. A
+    sender thread sends them in batches of up to 50, retrying failures with a
+    growing delay, so no plays are lost to a blip. Batches the network
+    rejects as invalid are logged and dropped. The spool is read back on
+    start, so scrobbles not yet sent when the process stopped are sent by the
+    next queue on the same file.
+
+        queue = pylast.ScrobbleQueue(network, "scrobbles.spool")
+        queue.scrobble("Artist", "Title", int(time.time()))
+        ...
+        queue.close()
+
+    * file_path: The spool file, created if missing.
+    * retry_delay: Seconds to wait before retrying a failed batch, doubled on
+    each failure in a row up to max_retry_delay.
+    * compact_after: Rewrite the spool without the sent scrobbles once this
+    many have been sent, or when it is drained.
+    * sync: If True, fsync every write to the spool, so scrobbles also
+    survive a power failure, at the cost of a disk flush per call.
+    """
+
+    BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        network: _Network,
+        file_path,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 15 * 60,
+        compact_after: int = 1000,
+        sync: bool = False,
+    ) -> None:
+        self.network = network
+        self.file_path = os.fspath(file_path)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.compact_after = compact_after
+        self.sync = sync
+        self.pending: collections.deque[dict] = collections.deque()
+        self.sent = 0
+        self.closing = False
+        self.condition = threading.Condition()
+
+        self._load()
+        self.spool = open(self.file_path, "a", encoding="utf-8")
+        self.sender = threading.Thread(
+            target=self._send_all, name="pylast-scrobble-queue", daemon=True
+        )
+        self.sender.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self.condition:
+            return len(self.pending)
+
+    def scrobble(self, artist: str, title: str, timestamp: int, **kwargs) -> None:
+        """Queues a track-play. Takes the arguments of _Network.scrobble()."""
+
+        self.scrobble_many(
+            ({"artist": artist, "title": title, "timestamp": timestamp, **kwargs},)
+        )
+
+    def scrobble_many(self, tracks) -> None:
+        """Queues track-plays, given as dicts of the arguments of
+        _Network.scrobble()."""
+
+        tracks = [
+            {arg: value for arg, value in track.items() if value is not None}
+            for track in tracks
+        ]
+        for track in tracks:
+            missing = [
+                arg for arg in ("artist", "title", "timestamp") if arg not in track
+            ]
+            if missing:
+                msg = f"Scrobble is missing {', '.join(missing)}: {track}"
+                raise ValueError(msg)
+        lines = "".join(map(self._track_line, tracks))
+
+        with self.condition:
+            if self.closing:
+                msg = "The scrobble queue is closed"
+                raise PyLastError(msg)
+
+            self._write(lines)
+            self.pending.extend(tracks)
+            self.condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until every queued scrobble is sent, or for up to timeout
+        seconds. Returns whether the queue is empty."""
+
+        with self.condition:
+            return (
+                self.condition.wait_for(
+                    lambda: not self.pending or self.closing, timeout
+                )
+                and not self.pending
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stops the sender once its batch in flight is done, and closes the
+        spool. Scrobbles still queued stay in the spool for the next queue.
+        Call flush() first to send them now."""
+
+        with self.condition:
+            if self.closing:
+                return
+            self.closing = True
+            self.condition.notify_all()
+
+        self.sender.join(timeout)
+        with self.condition:
+            self.spool.close()
+
+    def _load(self) -> None:
+        try:
+            spool = open(self.file_path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+
+        with spool:
+            for line in spool:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash
+                    logger.warning("Skipping a damaged line in %s", self.file_path)
+                    continue
+
+                if "track" in record:
+                    self.pending.append(record["track"])
+                else:
+                    for _ in range(min(record["sent"], len(self.pending))):
+                        self.pending.popleft()
+
+        self._compact()
+
+    def _write(self, lines: str) -> None:
+        self.spool.write(lines)
+        self.spool.flush()
+        if self.sync:
+            os.fsync(self.spool.fileno())
+
+    def _compact(self) -> None:
+        """Rewrites the spool with only the scrobbles not yet sent."""
+
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for track in self.pending:
+                f.write(self._track_line(track))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.file_path)
+        self.sent = 0
+
+    def _send_all(self) -> None:
+        delay = self.retry_delay
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or self.closing)
+                if self.closing:
+                    return
+                batch = list(itertools.islice(self.pending, self.BATCH_SIZE))
+
+            # Scrobbles over the daily limit go back in the queue
+            kept: list[dict] = []
+            done: list[dict] = []
+            error: PyLastError | None = None
+            try:
+                self._send_batch(batch, kept, done)
+            except PyLastError as e:
+                error = e
+            except Exception:
+                # Such as a spool written by hand, which retrying cannot fix
+                logger.exception("Dropping %d scrobbles", len(batch) - len(done))
+                done = batch
+
+            with self.condition:
+                for _ in done:
+                    self.pending.popleft()
+                self.pending.extend(kept)
+                self.sent += len(done)
+                if self.spool.closed:
+                    return
+
+                if not self.pending or self.sent >= self.compact_after:
+                    self.spool.close()
+                    self._compact()
+                    self.spool = open(self.file_path, "a", encoding="utf-8")
+                elif done:
+                    self._write(
+                        "".join(map(self._track_line, kept))
+                        + json.dumps({"sent": len(done)})
+                        + "\n"
+                    )
+                self.condition.notify_all()
+
+            if error is not None:
+                logger.warning("Scrobbling failed, retrying in %ss: %s", delay, error)
+            elif kept:
+                logger.warning(
+                    "%d scrobbles are over the daily limit, retrying in %ss",
+                    len(kept),
+                    delay,
+                )
+            else:
+                delay = self.retry_delay
+                continue
+
+            with self.condition:
+                self.condition.wait_for(lambda: self.closing, delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    def _send_batch(
+        self, batch: list[dict], kept: list[dict], done: list[dict]
+    ) -> None:
+        """
+        Scrobbles batch, adding the tracks it is done with to done, and those
+        over the daily limit to kept as well. A batch rejected as a whole is
+        split in halves until each rejected track is alone, and dropped.
+        """
+        try:
+            results = list(self.network.scrobble_many(batch))
+            for result in results:
+                if result.error is not None:
+                    raise result.error
+        except WSError as e:
+            if str(e.status) not in _REJECTED_SCROBBLE_STATUSES:
+                raise
+            if len(batch) == 1:
+                logger.error("Dropping scrobble %s: %s", batch[0], e)
+                done.extend(batch)
+                return
+
+            middle = len(batch) // 2
+            self._send_batch(batch[:middle], kept, done)
+            self._send_batch(batch[middle:], kept, done)
+            return
+
+        kept.extend(
+            result.track
+            for result in results
+            if result.ignored_code == SCROBBLE_IGNORED_DAILY_LIMIT
+        )
+        done.extend(batch)
+
+    @staticmethod
+    def _track_line(track: dict) -> str:
+        return json.dumps({"track": track}, separators=(",", ":")) + "\n"
+
+
+@functools.cache
+def _import_zstd():
+    """Returns a (compress, decompress) pair for Zstandard, if installed.
+    Looked up once, as decompressing a cache hit needs it."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return (
+            lambda data, level: zstd.compress(data, level=level),
+            zstd.decompress,
+        )
+    except ImportError:
+        pass
+
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+
+    return (
+        lambda data, level: zstandard.ZstdCompressor(
+            level=3 if level is None else level
+        ).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+class _CacheCompressor:
+    """
+    Transparently compresses cached responses.
+
+    Responses shorter than the threshold are stored as they are. Compressed
+    values are bytes prefixed with a tag naming the codec, so caches written
+    with another setting (or without compression) stay readable.
+    """
+
+    CODECS = ("zlib", "zstd")
+
+    def __init__(
+        self, codec: str = "zlib", level: int | None = None, threshold: int = 512
+    ) -> None:
+        if codec not in self.CODECS:
+            msg = f"Unknown compression codec: {codec!r}"
+            raise ValueError(msg)
+        self._zstd = _import_zstd() if codec == "zstd" else None
+        if codec == "zstd" and self._zstd is None:
+            msg = "zstd compression requires Python 3.14+ or the zstandard package"
+            raise ValueError(msg)
+
+        self.codec = codec
+        self.level = level
+        self.threshold = threshold
+
+    def compress(self, xml_string: str) -> str | bytes:
+        if len(xml_string) < self.threshold:
+            return xml_string
+
+        data = xml_string.encode("utf-8")
+        if self._zstd is not None:
+            return b"S" + self._zstd[0](data, self.level)
+
+        return b"Z" + zlib.compress(data, -1 if self.level is None else self.level)
+
+    @staticmethod
+    def decompress(value: str | bytes | memoryview) -> str:
+        if isinstance(value, str):
+            return value
+
+        tag, data = value[:1], value[1:]
+        if tag == b"S":
+            zstd = _import_zstd()
+            if zstd is None:
+                msg = "Cache entry is zstd-compressed but zstd is not installed"
+                raise PyLastError(msg)
+            data = zstd[1](data)
+        elif tag == b"Z":
+            data = zlib.decompress(data)
+
+        return str(data, "utf-8")
+
+
+# Errors that only depend on the request, so replaying them is safe
+_NEGATIVE_CACHE_STATUSES = {str(STATUS_INVALID_PARAMS), str(STATUS_INVALID_RESOURCE)}
+
+# Bump whenever a record extractor changes the shape of its records, so
+# records cached by older versions are no longer found
+_RECORD_SCHEMA_VERSION = 2
+
+
+# The cached reads each write method makes out of date. A read has the write's
+# object parameters, plus the authenticated user's name as the given parameter.
+_CACHE_INVALIDATIONS: dict[str, list[tuple[str, str | None]]] = {
+    "track.love": [("track.getInfo", "username")],
+    "track.unlove": [("track.getInfo", "username")],
+    **{
+        f"{prefix}.{write}": [
+            (f"{prefix}.getTags", None),
+            (f"{prefix}.getTags", "user"),
+            (f"{prefix}.getTopTags", None),
+        ]
+        for prefix in ("album", "artist", "track")
+        for write in ("addTags", "removeTag")
+    },
+}
+
+
+_CACHE_EXPORT_HEADER = {"format": "pylast-cache", "version": 1}
+
+
+class _CachePolicy(typing.NamedTuple):
+    """How long cached responses of a web service method are used."""
+
+    ttl: float | None = None
+    max_stale: float | None = None
+
+
+class _RequestStats:
+    """Counts cache lookups, bytes and timings of requests, by method."""
+
+    COUNTERS = (
+        "hits",
+        "misses",
+        "expired",
+        "negative_hits",
+        "bytes_read",
+        "bytes_written",
+        "parses",
+        "parse_time",
+        "requests",
+        "network_time",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.methods: dict[str, collections.Counter] = {}
+
+    def __getstate__(self) -> dict:
+        return {"methods": self.snapshot_counters()}
+
+    def __setstate__(self, state: dict) -> None:
+        self.lock = threading.Lock()
+        self.methods = state["methods"]
+
+    def add(self, method: str, **counts: float) -> None:
+        with self.lock:
+            self.methods.setdefault(method, collections.Counter()).update(counts)
+
+    def snapshot_counters(self) -> dict[str, collections.Counter]:
+        with self.lock:
+            return {
+                method: counters.copy() for method, counters in self.methods.items()
+            }
+
+    def snapshot(self) -> dict[str, dict[str, float | None]]:
+        """Returns the counters by method, with the average parse time and
+        network latency in seconds, or None where nothing was timed:
+
+        * hits: Responses served from the cache, including stale ones.
+        * misses: Responses that were not cached, or had expired.
+        * expired: Cached responses found expired.
+        * negative_hits: Cached errors raised again.
+        * bytes_read, bytes_written: Size of the responses read from and
+        written to the cache.
+        * requests: Requests sent to the web service.
+        """
+        stats = {}
+        for method, counters in self.snapshot_counters().items():
+            method_stats: dict[str, float | None] = {
+                name: counters[name]
+                for name in self.COUNTERS
+                if name not in ("parses", "parse_time", "network_time")
+            }
+            method_stats["average_parse_time"] = (
+                counters["parse_time"] / counters["parses"]
+                if counters["parses"]
+                else None
+            )
+            method_stats["average_latency"] = (
+                counters["network_time"] / counters["requests"]
+                if counters["requests"]
+                else None
+            )
+            stats[method] = method_stats
+        return stats
+
+    def reset(self) -> None:
+        with self.lock:
+            self.methods.clear()
+
+
+class _CacheEntry(typing.NamedTuple):
+    """A cached response, or the error it failed with."""
+
+    xml: str | None
+    expires: float | None = None
+    error: tuple[str, str] | None = None
+
+    def is_expired(self, now: float | None = None) -> bool:
+        if self.expires is None:
+            return False
+        return self.expires <= (time.time() if now is None else now)
+
+
+# expires (NaN for never) and kind, followed by the data
+_ENTRY_HEADER = struct.Struct("<dB")
+_ENTRY_XML, _ENTRY_COMPRESSED_XML, _ENTRY_ERROR = range(3)
+
+
+def _encode_entry(entry: _CacheEntry, compressor: _CacheCompressor | None) -> bytes:
+    """Encodes a cache entry as bytes, for storage outside a shelf."""
+
+    expires = math.nan if entry.expires is None else entry.expires
+
+    if entry.error is not None or entry.xml is None:
+        kind = _ENTRY_ERROR
+        data = json.dumps(list(entry.error or ("", ""))).encode("utf-8")
+    else:
+        payload = compressor.compress(entry.xml) if compressor else entry.xml
+        if isinstance(payload, bytes):
+            kind, data = _ENTRY_COMPRESSED_XML, payload
+        else:
+            kind, data = _ENTRY_XML, payload.encode("utf-8")
+
+    return _ENTRY_HEADER.pack(expires, kind) + data
+
+
+def _decode_entry(value: bytes | memoryview) -> _CacheEntry:
+    expires, kind = _ENTRY_HEADER.unpack_from(value)
+    data = value[_ENTRY_HEADER.size :]
+
+    if kind == _ENTRY_ERROR:
+        status, details = json.loads(str(data, "utf-8"))
+        return _CacheEntry(None, _nan_to_none(expires), (status, details))
+    if kind == _ENTRY_COMPRESSED_XML:
+        return _CacheEntry(_CacheCompressor.decompress(data), _nan_to_none(expires))
+    return _CacheEntry(str(data, "utf-8"), _nan_to_none(expires))
+
+
+class _CacheBackend(abc.ABC):
+    """Base class for the backends used for caching cacheable requests.
+
+    A backend maps cache keys to _CacheEntry objects.
+    """
+
+    @abc.abstractmethod
+    def __contains__(self, key) -> bool: ...
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[str]: ...
+
+    @abc.abstractmethod
+    def get_entry(self, key) -> _CacheEntry | None:
+        """Returns the entry stored under key, or None if there is none."""
+
+    @abc.abstractmethod
+    def set_entry(self, key, entry: _CacheEntry) -> None: ...
+
+    @abc.abstractmethod
+    def delete_entry(self, key) -> None:
+        """Removes the entry stored under key, if there is one."""
+
+    def get_entries(self, keys: typing.Iterable[str]) -> dict[str, _CacheEntry]:
+        """Returns the entries stored under any of keys, by key."""
+        entries = {}
+        for key in keys:
+            entry = self.get_entry(key)
+            if entry is not None:
+                entries[key] = entry
+        return entries
+
+    def get_xml(self, key):
+        entry = self.get_entry(key)
+        if entry is None or entry.xml is None:
+            raise KeyError(key)
+        return entry.xml
+
+    def set_xml(self, key, xml_string) -> None:
+        self.set_entry(key, _CacheEntry(xml_string))
+
+    def get_document(self, key) -> minidom.Document:
+        """Returns the parsed XML DOM of a cached response."""
+        return _parse_response(self.get_xml(key))
+
+    def iter_entries(self) -> Iterator[tuple[str, _CacheEntry]]:
+        """Yields every (key, entry) pair, without counting them as used."""
+        for key in self:
+            entry = self.get_entry(key)
+            if entry is not None:
+                yield key, entry
+
+    def usage(self) -> dict[str, int | None]:
+        """Returns size and eviction counters, where the backend has them."""
+        return {}
+
+    def flush(self) -> None:
+        """Commits any buffered writes."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# Shelves still open at exit are closed, so buffered writes are not lost
+_open_shelves: weakref.WeakSet[_ShelfCacheBackend] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_shelves() -> None:
+    for backend in list(_open_shelves):
+        try:
+            backend.close()
+        except Exception:
+            logger.warning("Closing a cache shelf failed", exc_info=True)
+
+
+def _open_shelf(
+    file_path, flag: typing.Literal["r", "w", "c", "n"] = "c"
+) -> shelve.Shelf:
+    """
+    Opens a shelf that any thread can use, as long as only one does at a time.
+
+    dbm.sqlite3 (the default from Python 3.13) ties its connection to the
+    thread that opened it, so that connection is reopened without the check.
+    """
+    shelf = shelve.open(file_path, flag=flag)
+    db = shelf.dict  # type: ignore[attr-defined]
+    cx = _ShelfCacheBackend._sqlite_connection(db)
+    if cx is None:
+        return shelf
+
+    import sqlite3
+
+    path = next(
+        row[2] for row in cx.execute("PRAGMA database_list") if row[1] == "main"
+    )
+    mode = "ro" if flag == "r" else "rw"
+    db._cx = sqlite3.connect(
+        f"{pathlib.Path(path).as_uri()}?mode={mode}",
+        uri=True,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    cx.close()
+    return shelf
+
+
+class _ShelfCacheBackend(_CacheBackend):
+    """Used as a backend for caching cacheable requests.
+
+    With max_bytes set, the least recently ("lru") or least frequently ("lfu")
+    used entries are evicted to keep the stored responses within that many
+    bytes. Eviction is incremental: each write evicts at most a few entries,
+    and entries stored before the shelf was opened are discovered a few at a
+    time rather than by a scan of all keys (except with dbm.ndbm, see
+    _iter_stored_keys()).
+
+    With any of the write_buffer_* limits set, writes are buffered in memory
+    and committed to the shelf as a group, followed by a single sync, once the
+    buffer reaches that many entries or bytes, or has been held for that many
+    seconds (checked on each write), and on close. Buffered entries are served
+    from memory in the meantime. A crash loses at most the buffered writes; as
+    dbm writes each entry whole, entries are never left half-written, though
+    a crash during a commit may keep only part of that group.
+    """
+
+    EVICTION_POLICIES = ("lru", "lfu")
+    # At most this many entries are evicted, and stored keys examined, per write
+    EVICTION_BATCH = 8
+    CENSUS_BATCH = 64
+    # The size accounting is saved every this many writes, and on close
+    META_KEY = "pylast:meta"
+    META_SYNC_INTERVAL = 100
+
+    def __init__(
+        self,
+        file_path=None,
+        flag=None,
+        compressor: _CacheCompressor | None = None,
+        max_bytes: int | None = None,
+        eviction: str = "lru",
+        write_buffer_entries: int | None = None,
+        write_buffer_bytes: int | None = None,
+        write_buffer_seconds: float | None = None,
+    ) -> None:
+        if eviction not in self.EVICTION_POLICIES:
+            msg = f"Unknown eviction policy: {eviction!r}"
+            raise ValueError(msg)
 
-    def __init__(self, file_path=None, flag=None) -> None:
         if flag is not None:
-            self.shelf = shelve.open(file_path, flag=flag)
+            self.shelf = _open_shelf(file_path, flag=flag)
         else:
-            self.shelf = shelve.open(file_path)
-        self.cache_keys = set(self.shelf.keys())
+            self.shelf = _open_shelf(file_path)
+        self.compressor = compressor
+        self.lock = threading.RLock()
+
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+        meta = self.shelf.get(self.META_KEY)
+        # Shelves written before size accounting are counted by the census
+        self._size_known = meta is not None or self._is_empty()
+        self.size: int = meta["size"] if meta else 0
+        self._writes_since_sync = 0
+
+        # key -> [size, hits, tick], in least recently used order
+        self._usage: collections.OrderedDict[str, list[int]] = collections.OrderedDict()
+        self._lfu_heap: list[tuple[int, int, str]] = []
+        self._tick = 0
+        self._census: Iterator[str] | None = None
+        self._census_done = False
+
+        self.write_buffer_entries = write_buffer_entries
+        self.write_buffer_bytes = write_buffer_bytes
+        self.write_buffer_seconds = write_buffer_seconds
+        self._buffered = any(
+            limit is not None
+            for limit in (
+                write_buffer_entries,
+                write_buffer_bytes,
+                write_buffer_seconds,
+            )
+        )
+        self._pending: dict[str, typing.Any] = {}
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._closed = False
+        _open_shelves.add(self)
 
     def __contains__(self, key) -> bool:
-        return key in self.cache_keys
+        # Goes to the dbm index, so opening needs no scan of all keys
+        with self.lock:
+            return key in self._pending or key in self.shelf
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.shelf.keys())
+        with self.lock:
+            keys = set(self.shelf.keys()).union(self._pending)
+        return (key for key in keys if key != self.META_KEY)
 
-    def get_xml(self, key):
+    def get_entry(self, key) -> _CacheEntry | None:
+        try:
+            with self.lock:
+                value = self._read(key)
+                if self.max_bytes is not None:
+                    self._touch(key, self._value_size(value))
+        except KeyError:
+            return None
+        return self._decode(value)
+
+    def set_entry(self, key, entry: _CacheEntry) -> None:
+        value = self._encode(entry)
+        size = self._value_size(value)
+
+        with self.lock:
+            if key in self._usage:
+                old_size = self._usage[key][0]
+            elif key in self:
+                old_size = self._value_size(self._read(key))
+            else:
+                old_size = 0
+
+            self._write(key, value, size)
+            self.size += size - old_size
+
+            if not self._buffered:
+                self._writes_since_sync += 1
+                if self._writes_since_sync >= self.META_SYNC_INTERVAL:
+                    self._sync_meta()
+
+            if self.max_bytes is not None:
+                self._touch(key, size)
+                self._evict()
+
+    def delete_entry(self, key) -> None:
+        with self.lock:
+            if key in self._usage:
+                size = self._usage.pop(key)[0]
+            elif key in self:
+                size = self._value_size(self._read(key))
+            else:
+                return
+            self._remove(key)
+            self.size -= size
+
+    def iter_entries(self) -> Iterator[tuple[str, _CacheEntry]]:
+        for key in self:
+            try:
+                with self.lock:
+                    value = self._read(key)
+            except KeyError:
+                continue
+            yield key, self._decode(value)
+
+    def flush(self) -> None:
+        """Commits the buffered writes to the shelf."""
+
+        with self.lock:
+            if not self._pending:
+                return
+            for key, value in self._pending.items():
+                self.shelf[key] = value
+            self._pending.clear()
+            self._pending_bytes = 0
+            self._sync_meta()
+            self.shelf.sync()
+
+    def _read(self, key):
+        if key in self._pending:
+            return self._pending[key]
         return self.shelf[key]
 
-    def set_xml(self, key, xml_string) -> None:
-        self.cache_keys.add(key)
-        self.shelf[key] = xml_string
+    def _write(self, key, value, size: int) -> None:
+        if not self._buffered:
+            self.shelf[key] = value
+            return
+
+        if not self._pending:
+            self._pending_since = time.time()
+        self._pending[key] = value
+        self._pending_bytes += size
+
+        if (
+            (
+                self.write_buffer_entries is not None
+                and len(self._pending) >= self.write_buffer_entries
+            )
+            or (
+                self.write_buffer_bytes is not None
+                and self._pending_bytes >= self.write_buffer_bytes
+            )
+            or (
+                self.write_buffer_seconds is not None
+                and time.time() - self._pending_since >= self.write_buffer_seconds
+            )
+        ):
+            self.flush()
+
+    def _remove(self, key) -> None:
+        """Removes key from the buffer and the shelf, or raises KeyError."""
+
+        found = self._pending.pop(key, None) is not None
+        if key in self.shelf:
+            del self.shelf[key]
+            found = True
+        if not found:
+            raise KeyError(key)
+
+    def usage(self) -> dict[str, int | None]:
+        return {
+            "size": self.size,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+        }
+
+    def close(self) -> None:
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.flush()
+            self._sync_meta()
+            self.shelf.close()
+        _open_shelves.discard(self)
+
+    def _sync_meta(self) -> None:
+        if self._size_known:
+            self.shelf[self.META_KEY] = {"size": self.size}
+        self._writes_since_sync = 0
+
+    def _touch(self, key, size: int) -> None:
+        """Records an access to key, for choosing what to evict."""
+
+        self._tick += 1
+        usage = self._usage.get(key)
+        if usage is None:
+            usage = self._usage[key] = [size, 0, 0]
+        usage[0] = size
+        usage[1] += 1
+        usage[2] = self._tick
+        self._usage.move_to_end(key)
+
+        if self.eviction == "lfu":
+            heapq.heappush(self._lfu_heap, (usage[1], usage[2], key))
+            if len(self._lfu_heap) > 2 * len(self._usage) + 64:
+                self._lfu_heap = [(u[1], u[2], k) for k, u in self._usage.items()]
+                heapq.heapify(self._lfu_heap)
+
+    def _evict(self) -> None:
+        assert self.max_bytes is not None
+        if self._size_known and self.size <= self.max_bytes:
+            return
+
+        self._advance_census()
+
+        for _ in range(self.EVICTION_BATCH):
+            if self.size <= self.max_bytes:
+                break
+            key = self._pop_victim()
+            if key is None:
+                break
+
+            size = self._usage.pop(key)[0]
+            try:
+                self._remove(key)
+            except KeyError:
+                continue
+            self.size -= size
+            self.evictions += 1
+            self.evicted_bytes += size
+
+    def _pop_victim(self) -> str | None:
+        if self.eviction == "lru":
+            return next(iter(self._usage), None)
+
+        while self._lfu_heap:
+            hits, tick, key = heapq.heappop(self._lfu_heap)
+            usage = self._usage.get(key)
+            # Skip heap items made out of date by later accesses
+            if usage is not None and usage[1] == hits and usage[2] == tick:
+                return key
+        return None
+
+    def _advance_census(self) -> None:
+        """Discovers a few of the entries not accessed since opening."""
+
+        if self._census_done:
+            return
+        if self._census is None:
+            self._census = self._iter_stored_keys()
+
+        for _ in range(self.CENSUS_BATCH):
+            key = next(self._census, None)
+            if key is None:
+                self._census_done = True
+                self._size_known = True
+                return
+            if key == self.META_KEY or key in self._usage:
+                continue
+
+            try:
+                size = self._value_size(self._read(key))
+            except KeyError:
+                continue
+            if not self._size_known:
+                self.size += size
+
+            # Not used since opening, so first in line for eviction
+            self._usage[key] = [size, 0, 0]
+            self._usage.move_to_end(key, last=False)
+            if self.eviction == "lfu":
+                heapq.heappush(self._lfu_heap, (0, 0, key))
+
+    def _is_empty(self) -> bool:
+        db = self.shelf.dict  # type: ignore[attr-defined]
+        if hasattr(db, "firstkey"):
+            return db.firstkey() is None
+        cx = self._sqlite_connection(db)
+        if cx is not None:
+            # len() would be a COUNT(*) of the whole table
+            return cx.execute("SELECT 1 FROM Dict LIMIT 1").fetchone() is None
+        return len(db) == 0
+
+    def _iter_stored_keys(self) -> Iterator[str]:
+        """
+        Yields the stored keys without listing them all at once where the dbm
+        allows: dbm.gnu walks its keys, and dbm.sqlite3 (the default from
+        Python 3.13) is read CENSUS_BATCH keys per query. dbm.dumb keeps all
+        its keys in memory anyway, so they are copied from there. dbm.ndbm
+        has no way to walk its keys, so they are listed once.
+        """
+        db = self.shelf.dict  # type: ignore[attr-defined]
+        if hasattr(db, "firstkey"):
+            key = db.firstkey()
+            while key is not None:
+                yield key.decode("utf-8")
+                key = db.nextkey(key)
+            return
+
+        cx = self._sqlite_connection(db)
+        if cx is not None:
+            last = b""
+            while True:
+                rows = cx.execute(
+                    "SELECT key FROM Dict WHERE key > ? ORDER BY key LIMIT ?",
+                    (last, self.CENSUS_BATCH),
+                ).fetchall()
+                for (key,) in rows:
+                    yield bytes(key).decode("utf-8")
+                if len(rows) < self.CENSUS_BATCH:
+                    return
+                last = rows[-1][0]
+
+        yield from (key.decode("utf-8") for key in db.keys())
+
+    @staticmethod
+    def _sqlite_connection(db):
+        """Returns the connection of a dbm.sqlite3 database, or None."""
+
+        cx = getattr(db, "_cx", None)
+        if type(cx).__module__ == "sqlite3" and type(cx).__name__ == "Connection":
+            return cx
+        return None
+
+    @staticmethod
+    def _value_size(value) -> int:
+        if isinstance(value, tuple):
+            return len(value[0] or "") + 32
+        return len(value)
+
+    def _encode(self, entry: _CacheEntry):
+        payload: str | bytes | None = entry.xml
+        if entry.xml is not None and self.compressor is not None:
+            payload = self.compressor.compress(entry.xml)
+
+        # Plain entries are stored as just their payload, as they always were
+        if entry.expires is None and entry.error is None:
+            return payload
+        return (payload, entry.expires, entry.error)
+
+    @staticmethod
+    def _decode(value) -> _CacheEntry:
+        if not isinstance(value, tuple):
+            return _CacheEntry(_CacheCompressor.decompress(value))
+
+        payload, expires, error = value
+        if payload is not None:
+            payload = _CacheCompressor.decompress(payload)
+        return _CacheEntry(payload, expires, error)
 
     @classmethod
-    def create_shelf(cls) -> _ShelfCacheBackend:
+    def create_shelf(cls, **kwargs) -> _ShelfCacheBackend:
         file_descriptor, file_path = tempfile.mkstemp(prefix="pylast_tmp_")
         os.close(file_descriptor)
-        return cls(file_path=file_path, flag="n")
+        return cls(file_path=file_path, flag="n", **kwargs)
+
+
+class _SnapshotCacheBackend(_CacheBackend):
+    """
+    A compact, read-only cache snapshot, opened with mmap.
+
+    The file holds the entries' values one after another, then an index of
+    (key digest, offset, length) records sorted by digest, then the index's
+    offset and length. Lookups binary search the index in place, so the
+    operating system's page cache is shared by every process reading the same
+    snapshot and values are only copied when decoded.
+    """
+
+    MAGIC = b"PYLAST-SNAPSHOT1"
+    INDEX_RECORD = struct.Struct("<20sQI")
+    FOOTER = struct.Struct("<QQ")
+
+    def __init__(self, file_path) -> None:
+        with open(file_path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.mmap[: len(self.MAGIC)] != self.MAGIC:
+            self.mmap.close()
+            msg = f"Not a pylast cache snapshot: {file_path}"
+            raise PyLastError(msg)
+
+        self.index_offset, self.count = self.FOOTER.unpack_from(
+            self.mmap, len(self.mmap) - self.FOOTER.size
+        )
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.count):
+            digest, _offset, _length = self._record(i)
+            yield digest.hex()
+
+    def get_entry(self, key) -> _CacheEntry | None:
+        found = self._find(key)
+        if found is None:
+            return None
+
+        offset, length = found
+        data = memoryview(self.mmap)[offset : offset + length]
+        try:
+            return _decode_entry(data)
+        finally:
+            data.release()
+
+    def set_entry(self, key, entry: _CacheEntry) -> None:
+        msg = "Cache snapshots are read-only"
+        raise PyLastError(msg)
+
+    def delete_entry(self, key) -> None:
+        msg = "Cache snapshots are read-only"
+        raise PyLastError(msg)
+
+    def close(self) -> None:
+        self.mmap.close()
+
+    def _record(self, i: int) -> tuple[bytes, int, int]:
+        return self.INDEX_RECORD.unpack_from(
+            self.mmap, self.index_offset + i * self.INDEX_RECORD.size
+        )
+
+    def _find(self, key) -> tuple[int, int] | None:
+        digest = self._digest(key)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            found, offset, length = self._record(middle)
+            if found == digest:
+                return offset, length
+            if found < digest:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        # Cache keys are already SHA-1 hex digests
+        if len(key) == 40:
+            try:
+                return bytes.fromhex(key)
+            except ValueError:
+                pass
+        return hashlib.sha1(key.encode("utf-8")).digest()
+
+    @classmethod
+    def write(
+        cls,
+        file_path,
+        entries: typing.Iterable[tuple[str, _CacheEntry]],
+        compressor: _CacheCompressor | None = None,
+    ) -> int:
+        """Writes a snapshot of entries to file_path, replacing it atomically.
+        Returns the number of entries written."""
+
+        index = []
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(cls.MAGIC)
+            offset = len(cls.MAGIC)
+
+            for key, entry in entries:
+                value = _encode_entry(entry, compressor)
+                f.write(value)
+                index.append((cls._digest(key), offset, len(value)))
+                offset += len(value)
+
+            index.sort()
+            for record in index:
+                f.write(cls.INDEX_RECORD.pack(*record))
+            f.write(cls.FOOTER.pack(offset, len(index)))
+
+        os.replace(tmp_path, file_path)
+        return len(index)
+
+
+class _LayeredCacheBackend(_CacheBackend):
+    """
+    Serves reads from a read-only snapshot first, falling back to a writable
+    backend, which takes all writes.
+
+    Keys written or deleted through this backend are served by the writable
+    backend from then on.
+    """
+
+    def __init__(self, snapshot: _CacheBackend, backend: _CacheBackend) -> None:
+        self.snapshot = snapshot
+        self.backend = backend
+        self.overridden: set[str] = set()
+
+    def __contains__(self, key) -> bool:
+        if key in self.overridden:
+            return key in self.backend
+        return key in self.snapshot or key in self.backend
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.snapshot:
+            if key not in self.overridden and key not in self.backend:
+                yield key
+        yield from self.backend
+
+    def get_entry(self, key) -> _CacheEntry | None:
+        if key in self.overridden:
+            return self.backend.get_entry(key)
+
+        entry = self.snapshot.get_entry(key)
+        if entry is not None and not entry.is_expired():
+            return entry
+        return self.backend.get_entry(key) or entry
+
+    def set_entry(self, key, entry: _CacheEntry) -> None:
+        self.overridden.add(key)
+        self.backend.set_entry(key, entry)
+
+    def delete_entry(self, key) -> None:
+        self.overridden.add(key)
+        self.backend.delete_entry(key)
+
+    def usage(self) -> dict[str, int | None]:
+        return self.backend.usage()
+
+    def flush(self) -> None:
+        self.backend.flush()
+
+    def close(self) -> None:
+        self.snapshot.close()
+        self.backend.close()
+
+
+class _RedisCacheBackend(_CacheBackend):
+    """
+    Stores the cache on a server speaking the Redis protocol, so a fleet of
+    hosts can share one cache.
+
+    Entries are stored as they are in snapshots, under keys with a prefix.
+    Their expiry is left to pylast, so expired entries can still be served
+    stale; bound the server's memory with its own eviction policy.
+    Commands sent together, such as the lookups of get_entries(), are
+    pipelined over one connection.
+
+    While the server fails, a warning is logged for each failed lookup or
+    write, lookups are misses and writes are skipped, so requests are
+    downloaded rather than failing.
+    """
+
+    SCAN_COUNT = 500
+    MGET_BATCH = 500
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        prefix: str = "pylast:",
+        timeout: float | None = 5,
+        compressor: _CacheCompressor | None = None,
+        username: str | None = None,
+    ) -> None:
+        if username is not None and password is None:
+            msg = "A cache server username needs a password"
+            raise ValueError(msg)
+
+        self.address = (host, port)
+        self.db = db
+        self.username = username
+        self.password = password
+        self.prefix = prefix
+        self.timeout = timeout
+        self.compressor = compressor
+        self.lock = threading.Lock()
+        self.socket: socket.socket | None = None
+        self.reader: typing.BinaryIO | None = None
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> _RedisCacheBackend:
+        """Creates a backend from a
+        redis://[[username]:password@]host[:port][/db] URL."""
+
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            msg = f"Unsupported cache URL: {url}"
+            raise ValueError(msg)
+
+        return cls(
+            host=parts.hostname or "localhost",
+            port=parts.port or 6379,
+            db=int(parts.path.lstrip("/") or 0),
+            password=unquote(parts.password) if parts.password else None,
+            username=unquote(parts.username) if parts.username else None,
+            **kwargs,
+        )
+
+    def __contains__(self, key) -> bool:
+        return self._command("EXISTS", self.prefix + key) == 1
+
+    def __iter__(self) -> Iterator[str]:
+        cursor = b"0"
+        while True:
+            cursor, keys = self._command(
+                "SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", self.SCAN_COUNT
+            )
+            for key in keys:
+                yield str(key, "utf-8")[len(self.prefix) :]
+            if cursor == b"0":
+                break
+
+    def get_entry(self, key) -> _CacheEntry | None:
+        replies = self._try_pipeline([("GET", self.prefix + key)])
+        if not replies or replies[0] is None:
+            return None
+        return _decode_entry(replies[0])
+
+    def get_entries(self, keys: typing.Iterable[str]) -> dict[str, _CacheEntry]:
+        keys = list(dict.fromkeys(keys))
+        batches = [
+            keys[i : i + self.MGET_BATCH] for i in range(0, len(keys), self.MGET_BATCH)
+        ]
+        replies = self._try_pipeline(
+            [["MGET", *(self.prefix + key for key in batch)] for batch in batches]
+        )
+        if replies is None:
+            return {}
+
+        entries = {}
+        for batch, values in zip(batches, replies):
+            for key, value in zip(batch, values):
+                if value is not None:
+                    entries[key] = _decode_entry(value)
+        return entries
+
+    def set_entry(self, key, entry: _CacheEntry) -> None:
+        self._try_pipeline(
+            [("SET", self.prefix + key, _encode_entry(entry, self.compressor))]
+        )
+
+    def delete_entry(self, key) -> None:
+        self._try_pipeline([("DEL", self.prefix + key)])
+
+    def close(self) -> None:
+        with self.lock:
+            self._disconnect()
+
+    def _command(self, *args):
+        return self._pipeline([args])[0]
+
+    def _try_pipeline(self, commands: list) -> list | None:
+        """Like _pipeline(), but logs a failure and returns None."""
+
+        try:
+            return self._pipeline(commands)
+        except PyLastError as e:
+            logger.warning("Cache server request failed: %s", e)
+            return None
+
+    def _pipeline(self, commands: list) -> list:
+        """Sends commands in one go and returns their replies."""
+
+        if not commands:
+            return []
+
+        with self.lock:
+            try:
+                if self.socket is None:
+                    self._connect()
+                assert self.socket is not None
+                self.socket.sendall(b"".join(map(self._pack, commands)))
+                replies = [self._read_reply() for _ in commands]
+            except (OSError, EOFError) as e:
+                self._disconnect()
+                msg = f"Cache server error: {e}"
+                raise PyLastError(msg) from e
+
+        for reply in replies:
+            if isinstance(reply, PyLastError):
+                raise reply
+        return replies
+
+    def _connect(self) -> None:
+        self.socket = socket.create_connection(self.address, self.timeout)
+        self.reader = self.socket.makefile("rb")
+
+        setup: list[tuple] = []
+        if self.username is not None:
+            setup.append(("AUTH", self.username, self.password))
+        elif self.password is not None:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            self.socket.sendall(b"".join(map(self._pack, setup)))
+            for _ in setup:
+                reply = self._read_reply()
+                if isinstance(reply, PyLastError):
+                    self._disconnect()
+                    raise reply
+
+    def _disconnect(self) -> None:
+        if self.reader is not None:
+            self.reader.close()
+        if self.socket is not None:
+            self.socket.close()
+        self.socket = self.reader = None
+
+    @staticmethod
+    def _pack(command) -> bytes:
+        parts = [b"*%d\r\n" % len(command)]
+        for arg in command:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            elif not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read_reply(self):
+        assert self.reader is not None
+        line = self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            msg = "Connection closed by the cache server"
+            raise EOFError(msg)
+
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest
+        if kind == b"-":
+            return PyLastError(f"Cache server error: {str(rest, 'utf-8')}")
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            if len(data) < length + 2:
+                msg = "Connection closed by the cache server"
+                raise EOFError(msg)
+            return data[:-2]
+        if kind == b"*":
+            count = int(rest)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+
+        msg = f"Unexpected reply from the cache server: {line!r}"
+        raise OSError(msg)
+
+
+class _MemoryCacheBackend(_CacheBackend):
+    """
+    A size-bounded, in-process LRU tier in front of another backend.
+
+    It keeps already-parsed responses, so hits on hot keys skip both the
+    backend's I/O and XML parsing. The size of an entry is approximated by the
+    length of its response text.
+    """
+
+    def __init__(
+        self,
+        backend: _CacheBackend,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: collections.OrderedDict[
+            str, tuple[_CacheEntry, minidom.Document | None, int]
+        ] = collections.OrderedDict()
+        self.lock = threading.RLock()
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries or key in self.backend
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.backend)
+
+    def _lookup(self, key) -> tuple[_CacheEntry, minidom.Document | None] | None:
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            entry, doc, _size = self.entries[key]
+            return entry, doc
+
+    def get_entry(self, key) -> _CacheEntry | None:
+        if found := self._lookup(key):
+            return found[0]
+
+        entry = self.backend.get_entry(key)
+        if entry is not None:
+            self._store(key, entry, None)
+        return entry
+
+    def set_entry(self, key, entry: _CacheEntry) -> None:
+        self.backend.set_entry(key, entry)
+        with self.lock:
+            self._discard(key)
+
+    def delete_entry(self, key) -> None:
+        self.backend.delete_entry(key)
+        with self.lock:
+            self._discard(key)
+
+    def get_document(self, key) -> minidom.Document:
+        entry: _CacheEntry | None
+        if found := self._lookup(key):
+            entry, doc = found
+            if doc is not None:
+                return doc
+        else:
+            entry = self.backend.get_entry(key)
+
+        if entry is None or entry.xml is None:
+            raise KeyError(key)
+
+        doc = _parse_response(entry.xml)
+        self._store(key, entry, doc)
+        return doc
+
+    def usage(self) -> dict[str, int | None]:
+        return {
+            **self.backend.usage(),
+            "memory_entries": len(self.entries),
+            "memory_size": self.size,
+        }
+
+    def iter_entries(self) -> Iterator[tuple[str, _CacheEntry]]:
+        return self.backend.iter_entries()
+
+    def flush(self) -> None:
+        self.backend.flush()
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def _store(self, key, entry: _CacheEntry, doc: minidom.Document | None) -> None:
+        size = len(entry.xml or "")
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Would evict everything else and still not fit
+            return
+
+        with self.lock:
+            self._discard(key)
+            self.entries[key] = (entry, doc, size)
+            self.size += size
+
+            while (
+                self.max_entries is not None and len(self.entries) > self.max_entries
+            ) or (self.max_bytes is not None and self.size > self.max_bytes):
+                _key, (_entry, _doc, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def _discard(self, key) -> None:
+        if key in self.entries:
+            size = self.entries.pop(key)[2]
+            self.size -= size
 
 
 class _Request:
@@ -911,30 +3074,131 @@ class _Request:
         The cache key is a string of concatenated sorted names and values.
         """
 
-        keys = list(self.params.keys())
+        return self._make_cache_key(self.params)
+
+    @staticmethod
+    def _make_cache_key(params: dict[str, str]) -> str:
+        keys = list(params.keys())
         keys.sort()
 
-        cache_key = ""
+        cache_key = ""
+
+        for key in keys:
+            if key != "api_sig" and key != "api_key" and key != "sk":
+                cache_key += key + params[key]
+
+        return hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+
+    def _invalidate_cache(self) -> None:
+        """Evicts the cached reads made out of date by this write request."""
+
+        reads = _CACHE_INVALIDATIONS.get(self.params["method"], ())
+        params = {
+            key: value
+            for key, value in self.params.items()
+            if key not in ("api_key", "api_sig", "method", "sk", "tag", "tags")
+        }
+
+        for read_method, user_param in reads:
+            read_params = {**params, "method": read_method}
+            if user_param is not None:
+                if not self.network.username:
+                    continue
+                read_params[user_param] = self._convert_param(self.network.username)
+            cache_key = self._make_cache_key(read_params)
+            self.cache.delete_entry(cache_key)
+            self.cache.delete_entry(self._make_record_key(cache_key))
+
+    @staticmethod
+    def _make_record_key(cache_key: str) -> str:
+        record_key = f"records{_RECORD_SCHEMA_VERSION}{cache_key}"
+        return hashlib.sha1(record_key.encode("utf-8")).hexdigest()
+
+    def _get_cached_response(self) -> minidom.Document:
+        """Returns the XML DOM of the cached response."""
+
+        cache_key = self._get_cache_key()
+        entry = self.cache.get_entry(cache_key)
+        method = self.params["method"]
+
+        if entry is not None and entry.is_expired():
+            self.network.stats.add(method, expired=1)
+            if self._may_serve_stale(entry):
+                self._count_hit(entry)
+                doc = self._get_cached_document(cache_key, entry.xml)
+                self.network._refresh_cache_entry(self, cache_key)
+                return doc
+            entry = None
+
+        if entry is None:
+            self.network.stats.add(method, misses=1)
+            return self._get_cached_document(cache_key, self._update_cache(cache_key))
+        elif entry.error is not None:
+            self.network.stats.add(method, negative_hits=1)
+            raise WSError(self.network, *entry.error)
+        else:
+            self._count_hit(entry)
+
+        return self._get_cached_document(cache_key, entry.xml)
+
+    def _get_cached_document(self, cache_key: str, xml) -> minidom.Document:
+        """Returns the parsed cached response. xml, the response as read or
+        downloaded, is parsed instead if the entry has been evicted since."""
+
+        start = time.perf_counter()
+        try:
+            doc = self.cache.get_document(cache_key)
+        except KeyError:
+            doc = _parse_response(xml)
+        self.network.stats.add(
+            self.params["method"], parses=1, parse_time=time.perf_counter() - start
+        )
+        return doc
+
+    def _count_hit(self, entry: _CacheEntry) -> None:
+        self.network.stats.add(
+            self.params["method"], hits=1, bytes_read=len(entry.xml or "")
+        )
+
+    def _may_serve_stale(self, entry: _CacheEntry) -> bool:
+        """Returns True if an expired entry is within its staleness bound."""
 
-        for key in keys:
-            if key != "api_sig" and key != "api_key" and key != "sk":
-                cache_key += key + self.params[key]
+        policy = self.network.cache_policies.get(self.params["method"])
+        if policy is None or policy.max_stale is None or entry.error is not None:
+            return False
 
-        return hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+        assert entry.expires is not None
+        return time.time() - entry.expires <= policy.max_stale
 
-    def _get_cached_response(self):
-        """Returns a file object of the cached response."""
+    def _update_cache(self, cache_key: str) -> str:
+        """Downloads the response, stores it in the cache and returns it."""
 
-        if not self._is_cached():
+        try:
             response = self._download_response()
-            self.cache.set_xml(self._get_cache_key(), response)
+        except WSError as e:
+            self._cache_error(cache_key, e)
+            raise
+
+        policy = self.network.cache_policies.get(self.params["method"])
+        expires = None
+        if policy is not None and policy.ttl is not None:
+            expires = time.time() + policy.ttl
+
+        self.cache.set_entry(cache_key, _CacheEntry(response, expires))
+        self.network.stats.add(self.params["method"], bytes_written=len(response))
+        return response
 
-        return self.cache.get_xml(self._get_cache_key())
+    def _cache_error(self, cache_key: str, error: WSError) -> None:
+        """Caches a not-found style error, if negative caching is enabled."""
 
-    def _is_cached(self) -> bool:
-        """Returns True if the request is already in cache."""
+        ttl = self.network.cache_negative_ttl
+        if ttl is None or str(error.status) not in _NEGATIVE_CACHE_STATUSES:
+            return
 
-        return self._get_cache_key() in self.cache
+        self.cache.set_entry(
+            cache_key,
+            _CacheEntry(None, time.time() + ttl, (str(error.status), error.details)),
+        )
 
     def _download_response(self):
         """Returns a response body string from the server."""
@@ -956,10 +3220,17 @@ class _Request:
             mounts=self.network.proxy,
             timeout=timeout,
         ) as client:
+            start = time.perf_counter()
             try:
                 response = client.post(f"{host_subdir}{username}", data=params)
             except Exception as e:
                 raise NetworkError(self.network, e) from e
+            finally:
+                self.network.stats.add(
+                    self.params["method"],
+                    requests=1,
+                    network_time=time.perf_counter() - start,
+                )
 
             if response.status_code in (500, 502, 503, 504):
                 raise WSError(
@@ -977,11 +3248,50 @@ class _Request:
         """Returns the XML DOM response of the POST Request from the server"""
 
         if self.network.is_caching_enabled() and cacheable:
-            response = self._get_cached_response()
-        else:
-            response = self._download_response()
+            return self._get_cached_response()
+
+        response = self._download_response()
+        start = time.perf_counter()
+        doc = _parse_response(response)
+        self.network.stats.add(
+            self.params["method"], parses=1, parse_time=time.perf_counter() - start
+        )
+        if self.network.is_caching_enabled():
+            self._invalidate_cache()
+        return doc
 
-        return _parse_response(response)
+    def execute_records(
+        self,
+        extract: Callable[[minidom.Document], list[tuple]],
+        cacheable: bool = False,
+    ) -> list[tuple]:
+        """Returns the records extract() pulls out of the XML DOM response,
+        served from the record cache when enabled."""
+
+        if not (
+            cacheable
+            and self.network.is_caching_enabled()
+            and self.network.cache_records
+        ):
+            return extract(self.execute(cacheable))
+
+        cache_key = self._get_cache_key()
+        record_key = self._make_record_key(cache_key)
+        entry = self.cache.get_entry(record_key)
+        if entry is not None and entry.xml is not None and not entry.is_expired():
+            self._count_hit(entry)
+            return [tuple(record) for record in json.loads(entry.xml)]
+
+        records = extract(self._get_cached_response())
+        response = self.cache.get_entry(cache_key)
+        self.cache.set_entry(
+            record_key,
+            _CacheEntry(
+                json.dumps(records, separators=(",", ":")),
+                response.expires if response is not None else None,
+            ),
+        )
+        return records
 
     def _check_response_for_errors(self, response):
         """Checks the response for errors and raises one if any exists."""
@@ -1145,14 +3455,213 @@ class LovedTrack(typing.NamedTuple):
     timestamp: str
 
 
+class InfoResult(typing.NamedTuple):
+    item: Artist | Album | Track | User
+    error: PyLastError | None
+
+
+class ImageResult(typing.NamedTuple):
+    item: Artist | Album | Track | User
+    url: str | None
+    error: PyLastError | None
+
+
+class ScrobbleResult(typing.NamedTuple):
+    track: dict
+    accepted: bool
+    # SCROBBLE_ACCEPTED, a SCROBBLE_IGNORED_* value, or None if the request
+    # failed
+    ignored_code: int | None
+    ignored_message: str | None
+    error: PyLastError | None
+
+
+class CorrectionResult(typing.NamedTuple):
+    item: Artist | Track
+    correction: str | None
+    error: PyLastError | None
+
+
+class MbidResult(typing.NamedTuple):
+    mbid: str
+    item: Artist | Album | Track | None
+    error: PyLastError | None
+
+
+class _IdentityMap:
+    """Maps the identities of entities to shared, weakly referenced
+    instances."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.objects: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __reduce__(self):
+        # Pickles as an empty map
+        return (_IdentityMap, ())
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def intern(self, obj: _BaseObject) -> _BaseObject:
+        """Returns the shared instance equal to obj, or obj if it is the
+        first."""
+
+        key = (type(obj), getattr(obj, "username", None), obj._get_identity())
+        with self.lock:
+            shared = self.objects.setdefault(key, obj)
+
+        if shared is not obj and isinstance(obj, _Describable):
+            for field, value in obj.info.items():
+                if shared.info.get(field) is None:
+                    shared.info[field] = value
+
+        return shared
+
+
+class _CorrectionCache:
+    """An in-memory LRU cache of corrected artist and track names, keyed by
+    the identities of the objects asked about."""
+
+    def __init__(self, ttl: float | None, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.corrections: collections.OrderedDict[
+            tuple, tuple[str | None, float | None]
+        ] = collections.OrderedDict()
+
+    def __reduce__(self):
+        # Pickles as an empty cache
+        return (_CorrectionCache, (self.ttl, self.max_entries))
+
+    def __len__(self) -> int:
+        return len(self.corrections)
+
+    def get(self, identity: tuple) -> tuple[bool, str | None]:
+        """Returns whether a fresh correction is known, and what it is."""
+
+        with self.lock:
+            item = self.corrections.get(identity)
+            if item is None:
+                return False, None
+
+            correction, expires = item
+            if expires is not None and expires <= time.time():
+                del self.corrections[identity]
+                return False, None
+
+            self.corrections.move_to_end(identity)
+            return True, correction
+
+    def set(self, identity: tuple, correction: str | None) -> None:
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self.corrections[identity] = (correction, expires)
+            self.corrections.move_to_end(identity)
+            while len(self.corrections) > self.max_entries:
+                self.corrections.popitem(last=False)
+
+    @staticmethod
+    def make_key(identity: tuple) -> str:
+        """Returns the key a correction is kept under in the cache's storage."""
+
+        key = "correction\0" + "\0".join(identity)
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+_MBID_KINDS = ("artist", "album", "track")
+
+
+class _MbidIndex:
+    """
+    A bidirectional index between the MusicBrainz IDs of artists, albums and
+    tracks and their names, kept in a shelf file or in memory.
+    """
+
+    def __init__(self, file_path=None) -> None:
+        self.lock = threading.Lock()
+        self.shelf: typing.MutableMapping[str, typing.Any]
+        if file_path:
+            self.shelf = _open_shelf(file_path)
+        else:
+            self.shelf = {}
+
+    def __reduce__(self):
+        # Pickles as an empty, in-memory index
+        return (_MbidIndex, ())
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(1 for key in self.shelf if key.startswith("mbid:"))
+
+    def add(self, kind: str, names: tuple, mbid: str) -> None:
+        """Indexes the MBID of an entity, given as (artist,) or (artist, title)."""
+
+        mbid_key = f"mbid:{kind}:{mbid}"
+        names_key = self._names_key(kind, names)
+        with self.lock:
+            # Most MBIDs are seen again and again, so only write new ones
+            if self.shelf.get(names_key) != mbid or self.shelf.get(mbid_key) != names:
+                self.shelf[mbid_key] = names
+                self.shelf[names_key] = mbid
+
+    def get_names(self, kind: str, mbid: str) -> tuple | None:
+        with self.lock:
+            return self.shelf.get(f"mbid:{kind}:{mbid}")
+
+    def get_mbid(self, kind: str, names: tuple) -> str | None:
+        with self.lock:
+            return self.shelf.get(self._names_key(kind, names))
+
+    def close(self) -> None:
+        with self.lock:
+            if isinstance(self.shelf, shelve.Shelf):
+                self.shelf.close()
+
+    @staticmethod
+    def _names_key(kind: str, names: tuple) -> str:
+        return "name:" + "\0".join([kind, *(str(name).casefold() for name in names)])
+
+
+class _Interned(type):
+    """
+    Resolves new entities to the shared instance in their network's identity
+    map, when it has one.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        obj = super().__call__(*args, **kwargs)
+
+        identity_map = getattr(obj.network, "identity_map", None)
+        if isinstance(identity_map, _IdentityMap):
+            return identity_map.intern(obj)
+
+        return obj
+
+
 class _BaseObject:
     """An abstract webservices object."""
 
-    network = None
+    __slots__ = ("network", "ws_prefix", "_identity", "__weakref__")
 
     def __init__(self, network, ws_prefix) -> None:
         self.network = network
         self.ws_prefix = ws_prefix
+        self._identity: tuple | None = None
+
+    def __setstate__(self, state) -> None:
+        # Objects pickled before __slots__ have their state in a dict
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+
+        self._identity = None
+        for name, value in state.items():
+            try:
+                setattr(self, name, value)
+            except AttributeError:
+                # Dropped since, such as listener_count
+                pass
 
     def _request(self, method_name, cacheable: bool = False, params=None):
         if not params:
@@ -1160,29 +3669,42 @@ class _BaseObject:
 
         return _Request(self.network, method_name, params).execute(cacheable)
 
+    def _request_records(
+        self, method_name, extract, cacheable: bool = False, params=None
+    ):
+        if not params:
+            params = self._get_params()
+
+        return _Request(self.network, method_name, params).execute_records(
+            extract, cacheable
+        )
+
     def _get_params(self):
         """Returns the most common set of parameters between all objects."""
 
         return {}
 
-    def __hash__(self):
-        # Convert any ints (or whatever) into strings
-        values = map(str, self._get_params().values())
+    def _get_identity(self) -> tuple:
+        """
+        Returns the object's kind and casefolded names, which are equal for
+        equal objects. They are computed once, and again after a rename.
+        """
 
-        return hash(self.network) + hash(
-            str(type(self))
-            + "".join(list(self._get_params().keys()) + list(values)).lower()
-        )
+        if self._identity is None:
+            # Convert any ints (or whatever) into strings
+            self._identity = (
+                self.ws_prefix,
+                *(str(value).casefold() for value in self._get_params().values()),
+            )
+        return self._identity
+
+    def __hash__(self):
+        return hash(self.network) + hash(self._get_identity())
 
     def _extract_cdata_from_request(self, method_name, tag_name, params):
         doc = self._request(method_name, True, params)
 
-        first_child = doc.getElementsByTagName(tag_name)[0].firstChild
-
-        if first_child is None:
-            return None
-
-        return first_child.wholeText.strip()
+        return _extract_cdata(doc, tag_name)
 
     def _get_things(
         self,
@@ -1191,8 +3713,11 @@ class _BaseObject:
         params=None,
         cacheable: bool = True,
         stream: bool = False,
+        stats: bool = False,
     ):
-        """Returns a list of the most played thing_types by this thing."""
+        """Returns a list of the most played thing_types by this thing.
+        stats: Whether the play counts are network-wide, so they can fill in
+        the things' info."""
 
         def _stream_get_things():
             limit = params.get("limit", 50)
@@ -1208,53 +3733,113 @@ class _BaseObject:
                 title = _extract(node, "name")
                 artist = _extract(node, "name", 1)
                 playcount = _number(_extract(node, "playcount"))
+                info = _extract_info(node, stats)
 
-                yield TopItem(thing_type(artist, title, self.network), playcount)
+                yield TopItem(
+                    thing_type(artist, title, self.network, info=info), playcount
+                )
 
         return _stream_get_things() if stream else list(_stream_get_things())
 
+
+class _Describable(_BaseObject):
+    """Common functions for classes with getInfo info."""
+
+    __slots__ = ("info", "info_time")
+
+    info: dict[str, typing.Any]
+    info_time: float | None
+
+    def __setstate__(self, state) -> None:
+        self.info = {}
+        self.info_time = None
+        super().__setstate__(state)
+
+    def refresh(self) -> None:
+        """
+        Fetches the object's info again, bypassing the cache.
+        """
+        if TYPE_CHECKING:
+            assert self.network is not None
+
+        request = _Request(
+            self.network, self.ws_prefix + ".getInfo", self._get_params()
+        )
+        if self.network.is_caching_enabled():
+            request.cache.delete_entry(request._get_cache_key())
+
+        self._set_info(request.execute(True))
+
+    def _get_info(self, field):
+        """
+        Returns a field of the object's info, fetching the getInfo response
+        if the field is missing and it wasn't fetched yet, or the info is
+        older than the network's info_max_age.
+        """
+
+        if TYPE_CHECKING:
+            assert self.network is not None
+
+        max_age = self.network.info_max_age
+        loaded = self.info_time is not None
+        if (not loaded and self.info.get(field) is None) or (
+            loaded and max_age is not None and time.time() - self.info_time > max_age
+        ):
+            self._set_info(self._request(self.ws_prefix + ".getInfo", True))
+
+        return self.info.get(field)
+
+    def _set_info(self, doc) -> None:
+        if TYPE_CHECKING:
+            assert self.network is not None
+
+        self.info.update(self._parse_info(doc))
+        self.info_time = time.time()
+        self.network._record_mbid(self)
+
+    def _parse_info(self, doc) -> dict:
+        """Returns the fields of a getInfo response."""
+
+        return {}
+
     def get_wiki_published_date(self):
         """
         Returns the date on which the wiki was published.
-        Only for Album/Track.
         """
         return self.get_wiki("published")
 
     def get_wiki_summary(self):
         """
         Returns the summary of the wiki.
-        Only for Album/Track.
         """
         return self.get_wiki("summary")
 
     def get_wiki_content(self):
         """
         Returns the content of the wiki.
-        Only for Album/Track.
         """
         return self.get_wiki("content")
 
     def get_wiki(self, section):
         """
         Returns a section of the wiki.
-        Only for Album/Track.
         section can be "content", "summary" or
             "published" (for published date)
         """
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
+        wiki = self._get_info("wiki")
 
-        if len(doc.getElementsByTagName("wiki")) == 0:
+        if wiki is None:
             return
 
-        node = doc.getElementsByTagName("wiki")[0]
-
-        return _extract(node, section)
+        return wiki.get(section)
 
 
 class _Chartable(_BaseObject):
     """Common functions for classes with charts."""
 
+    __slots__ = ()
+
     def __init__(self, network, ws_prefix) -> None:
         super().__init__(network=network, ws_prefix=ws_prefix)
 
@@ -1327,32 +3912,36 @@ class _Chartable(_BaseObject):
         return seq
 
 
+# The most tags an addTags request takes
+_MAX_TAGS_PER_REQUEST = 10
+
+
 class _Taggable(_BaseObject):
     """Common functions for classes with tags."""
 
+    __slots__ = ()
+
     def __init__(self, network, ws_prefix) -> None:
         super().__init__(network=network, ws_prefix=ws_prefix)
 
     def add_tags(self, tags) -> None:
-        """Adds one or several tags.
+        """Adds one or several tags, up to 10 per request.
         * tags: A sequence of tag names or Tag objects.
         """
 
-        for tag in tags:
-            self.add_tag(tag)
+        names = _tag_names(tags)
+        for i in range(0, len(names), _MAX_TAGS_PER_REQUEST):
+            params = self._get_params()
+            params["tags"] = ",".join(names[i : i + _MAX_TAGS_PER_REQUEST])
+
+            self._request(self.ws_prefix + ".addTags", False, params)
 
     def add_tag(self, tag) -> None:
         """Adds one tag.
         * tag: a tag name or a Tag object.
         """
 
-        if isinstance(tag, Tag):
-            tag = tag.get_name()
-
-        params = self._get_params()
-        params["tags"] = tag
-
-        self._request(self.ws_prefix + ".addTags", False, params)
+        self.add_tags([tag])
 
     def remove_tag(self, tag) -> None:
         """Remove a user's tag from this object."""
@@ -1365,13 +3954,21 @@ class _Taggable(_BaseObject):
 
         self._request(self.ws_prefix + ".removeTag", False, params)
 
-    def get_tags(self):
-        """Returns a list of the tags set by the user to this object."""
+    def get_tags(self, cacheable: bool = False):
+        """Returns a list of the tags set by the user to this object.
+
+        Cached tags are evicted when they are changed through this network.
+        """
+
+        if TYPE_CHECKING:
+            assert self.network is not None
 
-        # Uncacheable because it can be dynamically changed by the user.
         params = self._get_params()
+        if cacheable and self.network.username:
+            # Key the cache by user, as the session key is not part of it
+            params["user"] = self.network.username
 
-        doc = self._request(self.ws_prefix + ".getTags", False, params)
+        doc = self._request(self.ws_prefix + ".getTags", cacheable, params)
         tag_names = _extract_all(doc, "name")
         tags = []
         for tag in tag_names:
@@ -1379,52 +3976,42 @@ class _Taggable(_BaseObject):
 
         return tags
 
-    def remove_tags(self, tags) -> None:
+    def remove_tags(self, tags, max_workers: int = 4) -> None:
         """Removes one or several tags from this object.
+        The API removes one tag per request, so up to max_workers of them are
+        sent at a time, rate limited if enabled.
         * tags: a sequence of tag names or Tag objects.
         """
 
-        for tag in tags:
-            self.remove_tag(tag)
+        names = _tag_names(tags)
+        if len(names) <= 1:
+            for name in names:
+                self.remove_tag(name)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pylast-tags"
+        ) as executor:
+            # Consume the results to raise the first error
+            list(executor.map(self.remove_tag, names))
 
     def clear_tags(self) -> None:
         """Clears all the user-set tags."""
 
-        self.remove_tags(*(self.get_tags()))
+        self.remove_tags(self.get_tags())
 
     def set_tags(self, tags) -> None:
         """Sets this object's tags to only those tags.
         * tags: a sequence of tag names or Tag objects.
         """
 
-        c_old_tags = []
-        old_tags = []
-        c_new_tags = []
-        new_tags = []
-
-        to_remove = []
-        to_add = []
+        old_tags = {tag.get_name().lower(): tag.get_name() for tag in self.get_tags()}
+        new_tags = {name.lower(): name for name in _tag_names(tags)}
 
-        tags_on_server = self.get_tags()
-
-        for tag in tags_on_server:
-            c_old_tags.append(tag.get_name().lower())
-            old_tags.append(tag.get_name())
-
-        for tag in tags:
-            c_new_tags.append(tag.lower())
-            new_tags.append(tag)
-
-        for i in range(len(old_tags)):
-            if c_old_tags[i] not in c_new_tags:
-                to_remove.append(old_tags[i])
-
-        for i in range(len(new_tags)):
-            if c_new_tags[i] not in c_old_tags:
-                to_add.append(new_tags[i])
-
-        self.remove_tags(to_remove)
-        self.add_tags(to_add)
+        self.remove_tags(
+            [name for key, name in old_tags.items() if key not in new_tags]
+        )
+        self.add_tags([name for key, name in new_tags.items() if key not in old_tags])
 
     def get_top_tags(self, limit: int | None = None) -> list[TopItem]:
         """Returns a list of the most frequently used Tags on this object."""
@@ -1520,12 +4107,10 @@ class NetworkError(PyLastError):
         return f"NetworkError: {self.underlying_error}"
 
 
-class _Opus(_Taggable):
+class _Opus(_Taggable, _Describable):
     """An album or track."""
 
-    artist = None
-    title = None
-    username = None
+    __slots__ = ("artist", "title", "username")
 
     __hash__ = _BaseObject.__hash__
 
@@ -1553,6 +4138,9 @@ class _Opus(_Taggable):
         self.title = title
         self.username = username or network.username  # Default to current user
         self.info = info
+        self.info_time = None
+        if "mbid" in info:
+            network._record_mbid(self)
 
     def __repr__(self) -> str:
         if TYPE_CHECKING:
@@ -1573,11 +4161,7 @@ class _Opus(_Taggable):
     def __eq__(self, other):
         if type(self) is not type(other):
             return False
-        a = self.get_title().lower()
-        b = other.get_title().lower()
-        c = self.get_artist().get_name().lower()
-        d = other.get_artist().get_name().lower()
-        return (a == b) and (c == d)
+        return self._get_identity() == other._get_identity()
 
     def __ne__(self, other) -> bool:
         return not self == other
@@ -1602,18 +4186,13 @@ class _Opus(_Taggable):
             SIZE_MEDIUM
             SIZE_SMALL
         """
-        if "image" not in self.info:
-            self.info["image"] = _extract_all(
-                self._request(self.ws_prefix + ".getInfo", cacheable=True), "image"
-            )
-        return self.info["image"][size]
+        return self._get_info("image")[size]
 
     def get_title(self, properly_capitalized: bool = False):
         """Returns the album or track title."""
         if properly_capitalized:
-            self.title = _extract(
-                self._request(self.ws_prefix + ".getInfo", True), "name"
-            )
+            self.title = self._get_info("name")
+            self._identity = None
 
         return self.title
 
@@ -1625,11 +4204,7 @@ class _Opus(_Taggable):
     def get_playcount(self) -> float:
         """Returns the number of plays on the network"""
 
-        return _number(
-            _extract(
-                self._request(self.ws_prefix + ".getInfo", cacheable=True), "playcount"
-            )
-        )
+        return _number(self._get_info("playcount"))
 
     def get_userplaycount(self):
         """Returns the number of plays by a given username"""
@@ -1646,24 +4221,41 @@ class _Opus(_Taggable):
     def get_listener_count(self) -> float:
         """Returns the number of listeners on the network"""
 
-        return _number(
-            _extract(
-                self._request(self.ws_prefix + ".getInfo", cacheable=True), "listeners"
-            )
-        )
+        return _number(self._get_info("listeners"))
 
     def get_mbid(self) -> str | None:
         """Returns the MusicBrainz ID of the album or track."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", cacheable=True)
+        if TYPE_CHECKING:
+            assert self.network is not None
 
+        return self.network._lookup_mbid(self) or self._get_info("mbid")
+
+    def _parse_info(self, doc) -> dict:
         try:
             lfm = doc.getElementsByTagName("lfm")[0]
             opus = next(self._get_children_by_tag_name(lfm, self.ws_prefix))
             mbid = next(self._get_children_by_tag_name(opus, "mbid"))
-            return mbid.firstChild.nodeValue if mbid.firstChild else None
+            mbid = mbid.firstChild.nodeValue if mbid.firstChild else None
         except StopIteration:
-            return None
+            mbid = None
+
+        wiki = None
+        if doc.getElementsByTagName("wiki"):
+            node = doc.getElementsByTagName("wiki")[0]
+            wiki = {
+                section: _extract(node, section)
+                for section in ("published", "summary", "content")
+            }
+
+        return {
+            "name": _extract(doc, "name"),
+            "mbid": mbid,
+            "image": _extract_all(doc, "image"),
+            "playcount": _extract(doc, "playcount"),
+            "listeners": _extract(doc, "listeners"),
+            "wiki": wiki,
+        }
 
     def _get_children_by_tag_name(self, node, tag_name):
         for child in node.childNodes:
@@ -1673,9 +4265,11 @@ class _Opus(_Taggable):
                 yield child
 
 
-class Album(_Opus):
+class Album(_Opus, metaclass=_Interned):
     """An album."""
 
+    __slots__ = ()
+
     __hash__ = _Opus.__hash__  # type: ignore[assignment]
 
     def __init__(self, artist, title, network, username=None, info=None) -> None:
@@ -1684,9 +4278,18 @@ class Album(_Opus):
     def get_tracks(self) -> list[Track]:
         """Returns the list of Tracks on this album."""
 
-        return _extract_tracks(
-            self._request(self.ws_prefix + ".getInfo", cacheable=True), self.network
-        )
+        return [
+            Track(artist, title, self.network)
+            for artist, title in self._get_info("tracks")
+        ]
+
+    def _parse_info(self, doc) -> dict:
+        info = super()._parse_info(doc)
+        info["tracks"] = [
+            (_extract(node, "name", 1), _extract(node, "name"))
+            for node in doc.getElementsByTagName("track")
+        ]
+        return info
 
     def get_url(self, domain_name: int = DOMAIN_ENGLISH):
         """Returns the URL of the album or track page on the network.
@@ -1719,11 +4322,10 @@ class Album(_Opus):
         }
 
 
-class Artist(_Taggable):
+class Artist(_Taggable, _Describable, metaclass=_Interned):
     """An artist."""
 
-    name = None
-    username = None
+    __slots__ = ("name", "username")
 
     __hash__ = _BaseObject.__hash__
 
@@ -1741,6 +4343,9 @@ class Artist(_Taggable):
         self.name = name
         self.username = username or network.username  # Default to current user
         self.info = info
+        self.info_time = None
+        if "mbid" in info:
+            network._record_mbid(self)
 
     def __repr__(self) -> str:
         return f"pylast.Artist({repr(self.get_name())}, {repr(self.network)})"
@@ -1750,7 +4355,7 @@ class Artist(_Taggable):
 
     def __eq__(self, other):
         if type(self) is type(other):
-            return self.get_name().lower() == other.get_name().lower()
+            return self._get_identity() == other._get_identity()
         else:
             return False
 
@@ -1766,23 +4371,35 @@ class Artist(_Taggable):
         overwriting the given one."""
 
         if properly_capitalized:
-            self.name = _extract(
-                self._request(self.ws_prefix + ".getInfo", True), "name"
-            )
+            self.name = self._get_info("name")
+            self._identity = None
 
         return self.name
 
+    def get_image(self, size: int = SIZE_EXTRA_LARGE):
+        """
+        Returns a URI to the artist's image
+        size can be one of:
+            SIZE_MEGA
+            SIZE_EXTRA_LARGE
+            SIZE_LARGE
+            SIZE_MEDIUM
+            SIZE_SMALL
+        """
+        return self._get_info("image")[size]
+
     def get_correction(self):
         """Returns the corrected artist name."""
 
-        return _extract(self._request(self.ws_prefix + ".getCorrection"), "name")
+        if TYPE_CHECKING:
+            assert self.network is not None
+
+        return self.network._get_correction(self)
 
     def get_playcount(self):
         """Returns the number of plays on the network."""
 
-        return _number(
-            _extract(self._request(self.ws_prefix + ".getInfo", True), "playcount")
-        )
+        return _number(self._get_info("playcount"))
 
     def get_userplaycount(self):
         """Returns the number of plays by a given username"""
@@ -1799,20 +4416,15 @@ class Artist(_Taggable):
     def get_mbid(self):
         """Returns the MusicBrainz ID of this artist."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
+        if TYPE_CHECKING:
+            assert self.network is not None
 
-        return _extract(doc, "mbid")
+        return self.network._lookup_mbid(self) or self._get_info("mbid")
 
     def get_listener_count(self):
         """Returns the number of listeners on the network."""
 
-        if hasattr(self, "listener_count"):
-            return self.listener_count
-        else:
-            self.listener_count = _number(
-                _extract(self._request(self.ws_prefix + ".getInfo", True), "listeners")
-            )
-            return self.listener_count
+        return _number(self._get_info("listeners"))
 
     def get_bio(self, section, language=None):
         """
@@ -1820,11 +4432,11 @@ class Artist(_Taggable):
         section can be "content", "summary" or
             "published" (for published date)
         """
-        if language:
-            params = self._get_params()
-            params["lang"] = language
-        else:
-            params = None
+        if not language:
+            return self._get_info("bio").get(section)
+
+        params = self._get_params()
+        params["lang"] = language
 
         try:
             bio = self._extract_cdata_from_request(
@@ -1835,6 +4447,23 @@ class Artist(_Taggable):
 
         return bio
 
+    def _parse_info(self, doc) -> dict:
+        bio = {}
+        for section in ("published", "summary", "content"):
+            try:
+                bio[section] = _extract_cdata(doc, section)
+            except IndexError:
+                bio[section] = None
+
+        return {
+            "name": _extract(doc, "name"),
+            "mbid": _extract(doc, "mbid"),
+            "image": _extract_all(doc, "image"),
+            "playcount": _extract(doc, "playcount"),
+            "listeners": _extract(doc, "listeners"),
+            "bio": bio,
+        }
+
     def get_bio_published_date(self):
         """Returns the date on which the artist's biography was published."""
         return self.get_bio("published")
@@ -1856,14 +4485,12 @@ class Artist(_Taggable):
 
         doc = self._request(self.ws_prefix + ".getSimilar", True, params)
 
-        names = _extract_all(doc, "name")
-        matches = _extract_all(doc, "match")
-
         artists = []
-        for i in range(len(names)):
-            artists.append(
-                SimilarItem(Artist(names[i], self.network), _number(matches[i]))
+        for node in doc.getElementsByTagName("artist"):
+            artist = Artist(
+                _extract(node, "name"), self.network, info=_extract_info(node)
             )
+            artists.append(SimilarItem(artist, _number(_extract(node, "match"))))
 
         return artists
 
@@ -1873,7 +4500,9 @@ class Artist(_Taggable):
         if limit:
             params["limit"] = limit
 
-        return self._get_things("getTopAlbums", Album, params, cacheable, stream=stream)
+        return self._get_things(
+            "getTopAlbums", Album, params, cacheable, stream=stream, stats=True
+        )
 
     def get_top_tracks(self, limit=None, cacheable: bool = True, stream: bool = False):
         """Returns a list of the most played Tracks by this artist."""
@@ -1881,7 +4510,9 @@ class Artist(_Taggable):
         if limit:
             params["limit"] = limit
 
-        return self._get_things("getTopTracks", Track, params, cacheable, stream=stream)
+        return self._get_things(
+            "getTopTracks", Track, params, cacheable, stream=stream, stats=True
+        )
 
     def get_url(self, domain_name=DOMAIN_ENGLISH):
         """Returns the URL of the artist page on the network.
@@ -1909,7 +4540,7 @@ class Artist(_Taggable):
 class Country(_BaseObject):
     """A country at Last.fm."""
 
-    name = None
+    __slots__ = ("name",)
 
     __hash__ = _BaseObject.__hash__
 
@@ -1926,7 +4557,7 @@ class Country(_BaseObject):
 
     def __eq__(self, other):
         if type(self) is type(other):
-            return self.get_name().lower() == other.get_name().lower()
+            return self._get_identity() == other._get_identity()
         else:
             return False
 
@@ -1947,9 +4578,11 @@ class Country(_BaseObject):
         if limit:
             params["limit"] = limit
 
-        doc = self._request("geo.getTopArtists", cacheable, params)
+        records = self._request_records(
+            "geo.getTopArtists", _top_artist_records, cacheable, params
+        )
 
-        return _extract_top_artists(doc, self.network)
+        return _top_artists_from_records(records, self.network)
 
     def get_top_tracks(self, limit=None, cacheable: bool = True, stream: bool = False):
         """Returns a sequence of the most played tracks"""
@@ -1986,7 +4619,7 @@ class Country(_BaseObject):
 class Library(_BaseObject):
     """A user's Last.fm library."""
 
-    user = None
+    __slots__ = ("user",)
 
     __hash__ = _BaseObject.__hash__
 
@@ -2033,10 +4666,10 @@ class Library(_BaseObject):
         return _get_artists() if stream else list(_get_artists())
 
 
-class Tag(_Chartable):
+class Tag(_Chartable, _Describable, metaclass=_Interned):
     """A Last.fm object tag."""
 
-    name = None
+    __slots__ = ("name",)
 
     __hash__ = _BaseObject.__hash__
 
@@ -2044,6 +4677,8 @@ class Tag(_Chartable):
         super().__init__(network=network, ws_prefix="tag")
 
         self.name = name
+        self.info = {}
+        self.info_time = None
 
     def __repr__(self) -> str:
         return f"pylast.Tag({repr(self.name)}, {repr(self.network)})"
@@ -2053,7 +4688,7 @@ class Tag(_Chartable):
 
     def __eq__(self, other):
         if type(self) is type(other):
-            return self.get_name().lower() == other.get_name().lower()
+            return self._get_identity() == other._get_identity()
         else:
             return False
 
@@ -2067,21 +4702,33 @@ class Tag(_Chartable):
         """Returns the name of the tag."""
 
         if properly_capitalized:
-            self.name = _extract(
-                self._request(self.ws_prefix + ".getInfo", True), "name"
-            )
+            self.name = self._get_info("name")
+            self._identity = None
 
         return self.name
 
+    def _parse_info(self, doc) -> dict:
+        wiki = None
+        if doc.getElementsByTagName("wiki"):
+            node = doc.getElementsByTagName("wiki")[0]
+            wiki = {
+                section: _extract(node, section)
+                for section in ("published", "summary", "content")
+            }
+
+        return {"name": _extract(doc, "name"), "wiki": wiki}
+
     def get_top_albums(self, limit=None, cacheable: bool = True):
         """Returns a list of the top albums."""
         params = self._get_params()
         if limit:
             params["limit"] = limit
 
-        doc = self._request(self.ws_prefix + ".getTopAlbums", cacheable, params)
+        records = self._request_records(
+            self.ws_prefix + ".getTopAlbums", _top_album_records, cacheable, params
+        )
 
-        return _extract_top_albums(doc, self.network)
+        return _top_albums_from_records(records, self.network)
 
     def get_top_tracks(self, limit=None, cacheable: bool = True, stream: bool = False):
         """Returns a list of the most played Tracks for this tag."""
@@ -2098,9 +4745,11 @@ class Tag(_Chartable):
         if limit:
             params["limit"] = limit
 
-        doc = self._request(self.ws_prefix + ".getTopArtists", cacheable, params)
+        records = self._request_records(
+            self.ws_prefix + ".getTopArtists", _top_artist_records, cacheable, params
+        )
 
-        return _extract_top_artists(doc, self.network)
+        return _top_artists_from_records(records, self.network)
 
     def get_url(self, domain_name=DOMAIN_ENGLISH):
         """Returns the URL of the tag page on the network.
@@ -2124,10 +4773,10 @@ class Tag(_Chartable):
         return self.network._get_url(domain_name, "tag") % {"name": name}
 
 
-class Track(_Opus):
+class Track(_Opus, metaclass=_Interned):
     """A Last.fm track."""
 
-    listener_count: float | None = None
+    __slots__ = ()
 
     __hash__ = _Opus.__hash__  # type: ignore[assignment]
 
@@ -2137,14 +4786,15 @@ class Track(_Opus):
     def get_correction(self):
         """Returns the corrected track name."""
 
-        return _extract(self._request(self.ws_prefix + ".getCorrection"), "name")
+        if TYPE_CHECKING:
+            assert self.network is not None
+
+        return self.network._get_correction(self)
 
     def get_duration(self):
         """Returns the track duration."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        return _number(_extract(doc, "duration"))
+        return _number(self._get_info("duration"))
 
     def get_userloved(self):
         """Whether the user loved this track"""
@@ -2161,18 +4811,24 @@ class Track(_Opus):
 
     def get_album(self):
         """Returns the album object of this track."""
-        if "album" in self.info and self.info["album"] is not None:
-            return Album(self.artist, self.info["album"], self.network)
+        title = self._get_info("album")
+        if title is None:
+            return
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
+        artist = self.info.get("album_artist") or self.artist
+        return Album(artist, title, self.network)
 
-        albums = doc.getElementsByTagName("album")
+    def _parse_info(self, doc) -> dict:
+        info = super()._parse_info(doc)
+        info["duration"] = _extract(doc, "duration")
+        info["album"] = info["album_artist"] = None
 
-        if len(albums) == 0:
-            return
+        albums = doc.getElementsByTagName("album")
+        if albums:
+            info["album"] = _extract(albums[0], "title")
+            info["album_artist"] = _extract(albums[0], "artist")
 
-        node = doc.getElementsByTagName("album")[0]
-        return Album(_extract(node, "artist"), _extract(node, "title"), self.network)
+        return info
 
     def love(self) -> None:
         """Adds the track to the user's loved tracks."""
@@ -2201,8 +4857,11 @@ class Track(_Opus):
             title = _extract(node, "name")
             artist = _extract(node, "name", 1)
             match = _number(_extract(node, "match"))
+            info = _extract_info(node, stats=True)
 
-            seq.append(SimilarItem(Track(artist, title, self.network), match))
+            seq.append(
+                SimilarItem(Track(artist, title, self.network, info=info), match)
+            )
 
         return seq
 
@@ -2233,10 +4892,10 @@ class Track(_Opus):
         }
 
 
-class User(_Chartable):
+class User(_Chartable, _Describable):
     """A Last.fm user."""
 
-    name = None
+    __slots__ = ("name",)
 
     __hash__ = _BaseObject.__hash__
 
@@ -2244,6 +4903,8 @@ class User(_Chartable):
         super().__init__(network=network, ws_prefix="user")
 
         self.name = user_name
+        self.info = {}
+        self.info_time = None
 
     def __repr__(self) -> str:
         return f"pylast.User({repr(self.name)}, {repr(self.network)})"
@@ -2281,12 +4942,26 @@ class User(_Chartable):
         """Returns the user name."""
 
         if properly_capitalized:
-            self.name = _extract(
-                self._request(self.ws_prefix + ".getInfo", True), "name"
-            )
+            self.name = self._get_info("name")
+            self._identity = None
 
         return self.name
 
+    def _parse_info(self, doc) -> dict:
+        registered = doc.getElementsByTagName("registered")
+
+        return {
+            "name": _extract(doc, "name"),
+            "country": _extract(doc, "country"),
+            "subscriber": _extract(doc, "subscriber"),
+            "playcount": _extract(doc, "playcount"),
+            "registered": _extract(doc, "registered"),
+            "unixtime_registered": (
+                registered[0].getAttribute("unixtime") if registered else None
+            ),
+            "image": _extract_all(doc, "image"),
+        }
+
     def get_friends(
         self, limit: int = 50, cacheable: bool = False, stream: bool = False
     ):
@@ -2423,9 +5098,7 @@ class User(_Chartable):
     def get_country(self) -> Country | None:
         """Returns the name of the country of the user."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        country = _extract(doc, "country")
+        country = self._get_info("country")
 
         if country is None or country == "None":
             return None
@@ -2435,30 +5108,22 @@ class User(_Chartable):
     def is_subscriber(self) -> bool:
         """Returns whether the user is a subscriber or not. True or False."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        return _extract(doc, "subscriber") == "1"
+        return self._get_info("subscriber") == "1"
 
     def get_playcount(self) -> float:
         """Returns the user's playcount so far."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        return _number(_extract(doc, "playcount"))
+        return _number(self._get_info("playcount"))
 
     def get_registered(self) -> str:
         """Returns the user's registration date."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        return _extract(doc, "registered")
+        return self._get_info("registered")
 
     def get_unixtime_registered(self) -> int:
         """Returns the user's registration date as a Unix timestamp."""
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        return int(doc.getElementsByTagName("registered")[0].getAttribute("unixtime"))
+        return int(self._get_info("unixtime_registered"))
 
     def get_tagged_albums(
         self, tag: str, limit: int | None = None, cacheable: bool = True
@@ -2518,9 +5183,11 @@ class User(_Chartable):
         if limit:
             params["limit"] = limit
 
-        doc = self._request(self.ws_prefix + ".getTopAlbums", cacheable, params)
+        records = self._request_records(
+            self.ws_prefix + ".getTopAlbums", _top_album_records, cacheable, params
+        )
 
-        return _extract_top_albums(doc, self.network)
+        return _top_albums_from_records(records, self.network)
 
     def get_top_artists(self, period=PERIOD_OVERALL, limit=None):
         """Returns the top artists played by a user.
@@ -2538,9 +5205,11 @@ class User(_Chartable):
         if limit:
             params["limit"] = limit
 
-        doc = self._request(self.ws_prefix + ".getTopArtists", True, params)
+        records = self._request_records(
+            self.ws_prefix + ".getTopArtists", _top_artist_records, True, params
+        )
 
-        return _extract_top_artists(doc, self.network)
+        return _top_artists_from_records(records, self.network)
 
     def get_top_tags(self, limit=None, cacheable: bool = True) -> list[TopItem]:
         """
@@ -2623,9 +5292,7 @@ class User(_Chartable):
             SIZE_SMALL
         """
 
-        doc = self._request(self.ws_prefix + ".getInfo", True)
-
-        return _extract_all(doc, "image")[size]
+        return self._get_info("image")[size]
 
     def get_url(self, domain_name=DOMAIN_ENGLISH):
         """Returns the URL of the user page on the network.
@@ -2655,6 +5322,8 @@ class User(_Chartable):
 
 
 class AuthenticatedUser(User):
+    __slots__ = ()
+
     def __init__(self, network) -> None:
         super().__init__(user_name=network.username, network=network)
 
@@ -2671,6 +5340,7 @@ class AuthenticatedUser(User):
                 cacheable=True
             )
             self.name = _extract(doc, "name")
+            self._identity = None
         return self.name
 
 
@@ -2737,7 +5407,7 @@ class AlbumSearch(_Search):
                     _extract(node, "artist"),
                     _extract(node, "name"),
                     self.network,
-                    info={"image": _extract_all(node, "image")},
+                    info=_extract_info(node),
                 )
             )
 
@@ -2762,9 +5432,8 @@ class ArtistSearch(_Search):
             artist = Artist(
                 _extract(node, "name"),
                 self.network,
-                info={"image": _extract_all(node, "image")},
+                info=_extract_info(node, stats=True),
             )
-            artist.listener_count = _number(_extract(node, "listeners"))
             seq.append(artist)
 
         return seq
@@ -2794,9 +5463,8 @@ class TrackSearch(_Search):
                 _extract(node, "artist"),
                 _extract(node, "name"),
                 self.network,
-                info={"image": _extract_all(node, "image")},
+                info=_extract_info(node, stats=True),
             )
-            track.listener_count = _number(_extract(node, "listeners"))
             seq.append(track)
 
         return seq
@@ -2890,6 +5558,18 @@ def _extract(node, name, index: int = 0):
         return None
 
 
+def _extract_cdata(node, name):
+    """Extracts the text of the first element called name, which may be
+    CDATA. Raises IndexError if there is none."""
+
+    first_child = node.getElementsByTagName(name)[0].firstChild
+
+    if first_child is None:
+        return None
+
+    return first_child.wholeText.strip()
+
+
 def _extract_all(node, name, limit_count=None):
     """Extracts all the values from the xml string. returning a list."""
 
@@ -2904,36 +5584,88 @@ def _extract_all(node, name, limit_count=None):
     return seq
 
 
-def _extract_top_artists(doc: minidom.Document, network) -> list[TopItem]:
-    # TODO Maybe include the _request here too?
+def _tag_names(tags) -> list[str]:
+    """Returns the names of tags given as a tag name or a sequence of tag
+    names or Tag objects."""
+
+    if isinstance(tags, (str, Tag)):
+        tags = [tags]
+
+    return [tag.get_name() if isinstance(tag, Tag) else tag for tag in tags]
+
+
+def _extract_info(node, stats: bool = False) -> dict:
+    """
+    Extracts the fields of an item in a list response that its getInfo
+    response has too, to fill in the item's info.
+    Play and listener counts are only extracted with stats=True, for lists of
+    network-wide counts: user, country and tag lists carry their own.
+    """
+
+    names = ("mbid", "url", "playcount", "listeners") if stats else ("mbid", "url")
+
+    info: dict[str, typing.Any] = {}
+    for child in node.childNodes:
+        if child.nodeType == Node.ELEMENT_NODE and child.tagName in names:
+            if child.firstChild and child.firstChild.data.strip():
+                info.setdefault(
+                    child.tagName, html.unescape(child.firstChild.data.strip())
+                )
+
+    images = _extract_all(node, "image")
+    if any(images):
+        info["image"] = images
+
+    return info
+
+
+def _top_artist_records(doc: minidom.Document, stats: bool = False) -> list[tuple]:
     seq = []
     for node in doc.getElementsByTagName("artist"):
         name = _extract(node, "name")
         playcount = _extract(node, "playcount")
+        info = _extract_info(node, stats)
 
-        seq.append(TopItem(Artist(name, network), playcount))
+        seq.append((name, playcount, info))
 
     return seq
 
 
-def _extract_top_albums(doc: minidom.Document, network) -> list[TopItem]:
-    # TODO Maybe include the _request here too?
+def _global_top_artist_records(doc: minidom.Document) -> list[tuple]:
+    return _top_artist_records(doc, stats=True)
+
+
+def _top_artists_from_records(records: list[tuple], network) -> list[TopItem]:
+    return [
+        TopItem(Artist(name, network, info=info), playcount)
+        for name, playcount, info in records
+    ]
+
+
+def _top_album_records(doc: minidom.Document) -> list[tuple]:
     seq = []
     for node in doc.getElementsByTagName("album"):
         name = _extract(node, "name")
         artist = _extract(node, "name", 1)
         playcount = _extract(node, "playcount")
-        info = {"image": _extract_all(node, "image")}
+        info = _extract_info(node)
 
-        seq.append(TopItem(Album(artist, name, network, info=info), playcount))
+        seq.append((name, artist, playcount, info))
 
     return seq
 
 
+def _top_albums_from_records(records: list[tuple], network) -> list[TopItem]:
+    return [
+        TopItem(Album(artist, name, network, info=info), playcount)
+        for name, artist, playcount, info in records
+    ]
+
+
 def _extract_artists(doc: minidom.Document, network) -> list[Artist]:
     seq = []
     for node in doc.getElementsByTagName("artist"):
-        seq.append(Artist(_extract(node, "name"), network))
+        seq.append(Artist(_extract(node, "name"), network, info=_extract_info(node)))
     return seq
 
 
@@ -2942,7 +5674,7 @@ def _extract_albums(doc: minidom.Document, network) -> list[Album]:
     for node in doc.getElementsByTagName("album"):
         name = _extract(node, "name")
         artist = _extract(node, "name", 1)
-        seq.append(Album(artist, name, network))
+        seq.append(Album(artist, name, network, info=_extract_info(node)))
     return seq
 
 
@@ -2951,7 +5683,7 @@ def _extract_tracks(doc: minidom.Document, network) -> list[Track]:
     for node in doc.getElementsByTagName("track"):
         name = _extract(node, "name")
         artist = _extract(node, "name", 1)
-        seq.append(Track(artist, name, network))
+        seq.append(Track(artist, name, network, info=_extract_info(node)))
     return seq
 
 
@@ -2986,6 +5718,10 @@ def _parse_response(response: str) -> minidom.Document:
     return doc
 
 
+def _nan_to_none(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
 def _remove_invalid_xml_chars(string: str) -> str:
     return re.sub(
         r"[^\u0009\u000A\u000D\u0020-\uD7FF\uE000-\uFFFD\u10000-\u10FFF]+", "", string
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import os
+import sqlite3
+from collections.abc import MutableMapping
+from unittest.mock import Mock, patch
 
 import pytest
 
+import pylast
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from typing import Any
@@ -30,3 +35,75 @@ def vcr_config() -> dict[str, Any]:
         "filter_post_data_parameters": ["api_key", "api_sig", "password", "sk", "user"],
         "before_record_response": scrub_response,
     }
+
+
+NOT_FOUND_BODY = (
+    b'<?xml version="1.0"?><lfm status="failed">'
+    b'<error code="6">The artist you supplied could not be found</error></lfm>'
+)
+
+
+def fake_response(body: bytes) -> Mock:
+    """Returns a successful response with body, for patching
+    httpx2.Client.post."""
+    return Mock(status_code=200, read=Mock(return_value=body))
+
+
+def make_network(**kwargs) -> pylast.LastFMNetwork:
+    """Returns a Last.fm network with fake credentials."""
+    return pylast.LastFMNetwork(api_key="k", api_secret="s", **kwargs)
+
+
+def scrobble_track(i: int) -> dict:
+    """Returns the scrobble() arguments of a made-up track."""
+    return {"artist": "Test Artist", "title": f"Title {i}", "timestamp": 1000 + i}
+
+
+class SqliteDbm(MutableMapping):
+    """Stands in for a dbm.sqlite3 database, which Python < 3.13 lacks. Like
+    the real one, its connection only works in the thread that opened it."""
+
+    def __init__(self, path) -> None:
+        self._cx = sqlite3.connect(os.fspath(path), isolation_level=None)
+        self._cx.execute(
+            "CREATE TABLE IF NOT EXISTS Dict (key BLOB UNIQUE NOT NULL, value BLOB)"
+        )
+
+    def __getitem__(self, key) -> bytes:
+        row = self._cx.execute(
+            "SELECT value FROM Dict WHERE key = ?", (_as_bytes(key),)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return bytes(row[0])
+
+    def __setitem__(self, key, value) -> None:
+        self._cx.execute(
+            "REPLACE INTO Dict VALUES (?, ?)", (_as_bytes(key), _as_bytes(value))
+        )
+
+    def __delitem__(self, key) -> None:
+        cursor = self._cx.execute("DELETE FROM Dict WHERE key = ?", (_as_bytes(key),))
+        if not cursor.rowcount:
+            raise KeyError(key)
+
+    def __iter__(self):
+        rows = self._cx.execute("SELECT key FROM Dict").fetchall()
+        return (bytes(key) for (key,) in rows)
+
+    def __len__(self) -> int:
+        return self._cx.execute("SELECT COUNT(*) FROM Dict").fetchone()[0]
+
+    def close(self) -> None:
+        self._cx.close()
+
+
+def _as_bytes(value) -> bytes:
+    return value.encode() if isinstance(value, str) else value
+
+
+@pytest.fixture
+def sqlite_dbm():
+    """Makes shelves open SqliteDbm databases."""
+    with patch("dbm.open", lambda path, flag="c", mode=0o666: SqliteDbm(path)):
+        yield
@@ -0,0 +1,1082 @@
+from __future__ import annotations
+
+import gzip
+import os
+import shelve
+import socket
+import socketserver
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import pylast
+
+from .conftest import NOT_FOUND_BODY, SqliteDbm, fake_response, make_network
+
+
+def _body(name: str = "Test Artist") -> bytes:
+    return (
+        '<?xml version="1.0"?>'
+        f'<lfm status="ok"><artist><name>{name}</name>'
+        "<stats><listeners>10</listeners><playcount>100</playcount></stats>"
+        "</artist></lfm>"
+    ).encode()
+
+
+def _artist(network: pylast.LastFMNetwork) -> pylast.Artist:
+    # A new object each time, so getters go to the cache, not its info
+    return pylast.Artist("Test Artist", network)
+
+
+def test_memory_tier_skips_backend_and_parsing_on_hit(tmp_path) -> None:
+    network = make_network()
+    network.enable_caching(str(tmp_path / "cache"), memory_max_entries=10)
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        assert _artist(network).get_playcount() == 100
+
+    backend = network.cache_backend
+    assert isinstance(backend, pylast._MemoryCacheBackend)
+    with (
+        patch.object(backend.backend, "get_entry") as get_entry,
+        patch("pylast._parse_response") as parse,
+    ):
+        assert _artist(network).get_playcount() == 100
+        assert _artist(network).get_listener_count() == 10
+
+    assert post.call_count == 1
+    get_entry.assert_not_called()
+    parse.assert_not_called()
+
+
+def test_memory_tier_evicts_least_recently_used_by_count() -> None:
+    backend = pylast._MemoryCacheBackend(
+        pylast._ShelfCacheBackend.create_shelf(), max_entries=2
+    )
+    for key in ("a", "b", "c"):
+        backend.set_xml(key, _body(key).decode())
+
+    backend.get_document("a")
+    backend.get_document("b")
+    backend.get_document("a")
+    backend.get_document("c")
+
+    assert list(backend.entries) == ["a", "c"]
+    assert "b" in backend  # still in the persistent backend
+
+
+def test_memory_tier_evicts_by_bytes() -> None:
+    xml = _body().decode()
+    backend = pylast._MemoryCacheBackend(
+        pylast._ShelfCacheBackend.create_shelf(), max_bytes=len(xml) * 2
+    )
+    for key in ("a", "b", "c"):
+        backend.set_xml(key, xml)
+        backend.get_document(key)
+
+    assert list(backend.entries) == ["b", "c"]
+    assert backend.size == len(xml) * 2
+
+
+def test_memory_tier_drops_entry_when_overwritten() -> None:
+    backend = pylast._MemoryCacheBackend(
+        pylast._ShelfCacheBackend.create_shelf(), max_entries=10
+    )
+    backend.set_xml("a", _body("Old").decode())
+    backend.get_document("a")
+
+    backend.set_xml("a", _body("New").decode())
+
+    assert pylast._extract(backend.get_document("a"), "name") == "New"
+
+
+def test_compressed_entries_round_trip_and_shrink(tmp_path) -> None:
+    xml = _body("A" * 5000).decode()
+    compressed = pylast._ShelfCacheBackend(
+        str(tmp_path / "compressed"), compressor=pylast._CacheCompressor()
+    )
+    plain = pylast._ShelfCacheBackend(str(tmp_path / "plain"))
+
+    compressed.set_xml("key", xml)
+    plain.set_xml("key", xml)
+
+    assert compressed.get_xml("key") == xml
+    assert isinstance(compressed.shelf["key"], bytes)
+    assert len(compressed.shelf["key"]) < len(plain.shelf["key"]) / 10
+
+
+def test_compression_threshold_keeps_small_entries_raw() -> None:
+    compressor = pylast._CacheCompressor(threshold=10_000)
+    xml = _body().decode()
+
+    assert compressor.compress(xml) == xml
+    assert pylast._CacheCompressor.decompress(xml) == xml
+
+
+def test_uncompressed_entries_stay_readable_with_compression_enabled(
+    tmp_path,
+) -> None:
+    file_path = str(tmp_path / "cache")
+    xml = _body("A" * 5000).decode()
+    pylast._ShelfCacheBackend(file_path).set_xml("key", xml)
+
+    backend = pylast._ShelfCacheBackend(
+        file_path, compressor=pylast._CacheCompressor(level=9)
+    )
+
+    assert backend.get_xml("key") == xml
+
+
+def test_unknown_compression_codec() -> None:
+    with pytest.raises(ValueError, match="Unknown compression codec"):
+        make_network().enable_caching(compression="lzma")
+
+
+@pytest.mark.skipif(pylast._import_zstd() is None, reason="zstd is not installed")
+def test_zstd_compression_round_trip() -> None:
+    compressor = pylast._CacheCompressor("zstd", threshold=0)
+    xml = _body().decode()
+
+    assert pylast._CacheCompressor.decompress(compressor.compress(xml)) == xml
+
+
+def test_negative_caching_replays_not_found_error() -> None:
+    network = make_network()
+    network.enable_caching(negative_ttl=60)
+    artist = pylast.Artist("Tset Artsit", network)
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(NOT_FOUND_BODY)
+    ) as post:
+        for _ in range(3):
+            with pytest.raises(pylast.WSError) as exc_info:
+                artist.get_playcount()
+            assert exc_info.value.get_id() == "6"
+            assert str(exc_info.value) == "The artist you supplied could not be found"
+
+    assert post.call_count == 1
+
+
+def test_negative_cache_entries_expire() -> None:
+    network = make_network()
+    network.enable_caching(negative_ttl=60)
+    artist = pylast.Artist("Test Artist", network)
+
+    with patch("httpx2.Client.post", return_value=fake_response(NOT_FOUND_BODY)):
+        with pytest.raises(pylast.WSError):
+            artist.get_playcount()
+
+    with (
+        patch("time.time", return_value=pylast.time.time() + 61),
+        patch("httpx2.Client.post", return_value=fake_response(_body())) as post,
+    ):
+        assert artist.get_playcount() == 100
+
+    assert post.call_count == 1
+
+
+def test_errors_are_not_cached_by_default() -> None:
+    network = make_network()
+    network.enable_caching()
+    artist = pylast.Artist("Tset Artsit", network)
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(NOT_FOUND_BODY)
+    ) as post:
+        for _ in range(2):
+            with pytest.raises(pylast.WSError):
+                artist.get_playcount()
+
+    assert post.call_count == 2
+
+
+def test_negative_entries_survive_reopening_the_shelf(tmp_path) -> None:
+    file_path = str(tmp_path / "cache")
+    entry = pylast._CacheEntry(None, 2e9, ("7", "Invalid resource specified"))
+    pylast._ShelfCacheBackend(file_path).set_entry("key", entry)
+
+    assert pylast._ShelfCacheBackend(file_path).get_entry("key") == entry
+
+
+def _wait_for_refreshes(network: pylast._Network) -> None:
+    assert network._cache_refresh_executor is not None
+    network._cache_refresh_executor.shutdown(wait=True)
+    network._cache_refresh_executor = None
+
+
+def test_cache_policy_ttl_expires_entries() -> None:
+    network = make_network()
+    network.enable_caching()
+    network.set_cache_policy("artist.getInfo", ttl=60)
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        _artist(network).get_playcount()
+        _artist(network).get_playcount()
+        assert post.call_count == 1
+
+        with patch("time.time", return_value=pylast.time.time() + 61):
+            _artist(network).get_playcount()
+
+        assert post.call_count == 2
+
+
+def test_stale_while_revalidate_serves_stale_and_refreshes() -> None:
+    network = make_network()
+    network.enable_caching()
+    network.set_cache_policy("artist.getInfo", ttl=60, max_stale=600)
+    updated = _body().replace(b"<playcount>100<", b"<playcount>101<")
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())):
+        assert _artist(network).get_playcount() == 100
+
+    later = pylast.time.time() + 120
+    with (
+        patch("time.time", return_value=later),
+        patch("httpx2.Client.post", return_value=fake_response(updated)) as post,
+    ):
+        assert _artist(network).get_playcount() == 100
+        _wait_for_refreshes(network)
+        assert post.call_count == 1
+
+        assert _artist(network).get_playcount() == 101
+        assert post.call_count == 1
+
+
+def test_stale_while_revalidate_refreshes_each_key_once() -> None:
+    network = make_network()
+    network.enable_caching()
+    network.set_cache_policy("artist.getInfo", ttl=60, max_stale=600)
+    release = threading.Event()
+
+    def slow_post(*args, **kwargs):
+        release.wait(5)
+        return fake_response(_body())
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())):
+        _artist(network).get_playcount()
+
+    with (
+        patch("time.time", return_value=pylast.time.time() + 120),
+        patch("httpx2.Client.post", side_effect=slow_post) as post,
+    ):
+        for _ in range(5):
+            assert _artist(network).get_playcount() == 100
+        release.set()
+        _wait_for_refreshes(network)
+
+    assert post.call_count == 1
+
+
+@pytest.mark.usefixtures("sqlite_dbm")
+def test_stale_entries_are_refreshed_in_a_sqlite_dbm_shelf(tmp_path) -> None:
+    network = make_network()
+    network.enable_caching(str(tmp_path / "cache"))
+    network.set_cache_policy("artist.getInfo", ttl=60, max_stale=600)
+    updated = _body().replace(b"<playcount>100<", b"<playcount>101<")
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())):
+        _artist(network).get_playcount()
+
+    with (
+        patch("time.time", return_value=pylast.time.time() + 120),
+        patch("httpx2.Client.post", return_value=fake_response(updated)) as post,
+        patch.object(pylast.logger, "warning") as warning,
+    ):
+        assert _artist(network).get_playcount() == 100
+        _wait_for_refreshes(network)
+        assert _artist(network).get_playcount() == 101
+
+    assert post.call_count == 1
+    warning.assert_not_called()
+    network.disable_caching()
+
+
+def test_disable_caching_shuts_down_refreshes() -> None:
+    network = make_network()
+    network.enable_caching()
+    network.set_cache_policy("artist.getInfo", ttl=60, max_stale=600)
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        _artist(network).get_playcount()
+        with patch("time.time", return_value=pylast.time.time() + 120):
+            _artist(network).get_playcount()
+        executor = network._cache_refresh_executor
+        assert executor is not None
+
+        network.disable_caching()
+
+    assert network._cache_refresh_executor is None
+    assert post.call_count == 2
+    with pytest.raises(RuntimeError, match="shutdown"):
+        executor.submit(print)
+
+
+def test_stale_entries_beyond_max_stale_are_fetched() -> None:
+    network = make_network()
+    network.enable_caching()
+    network.set_cache_policy("artist.getInfo", ttl=60, max_stale=600)
+    updated = _body().replace(b"<playcount>100<", b"<playcount>101<")
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())):
+        _artist(network).get_playcount()
+
+    with (
+        patch("time.time", return_value=pylast.time.time() + 1000),
+        patch("httpx2.Client.post", return_value=fake_response(updated)),
+    ):
+        assert _artist(network).get_playcount() == 101
+
+    assert network._cache_refresh_executor is None
+
+
+def test_opening_a_shelf_does_not_scan_keys(tmp_path) -> None:
+    file_path = str(tmp_path / "cache")
+    backend = pylast._ShelfCacheBackend(file_path)
+    backend.set_xml("key", _body().decode())
+    backend.shelf.close()
+
+    with patch.object(shelve.Shelf, "keys", side_effect=AssertionError("scanned")):
+        backend = pylast._ShelfCacheBackend(file_path)
+
+        assert "key" in backend
+        assert "other" not in backend
+        assert backend.get_xml("key") == _body().decode()
+        assert backend.get_entry("other") is None
+
+
+def _fill(backend: pylast._ShelfCacheBackend, keys, size: int = 1000) -> None:
+    for key in keys:
+        backend.set_xml(key, "x" * size)
+
+
+def test_eviction_keeps_cache_within_byte_budget() -> None:
+    backend = pylast._ShelfCacheBackend.create_shelf(max_bytes=5000)
+
+    _fill(backend, "abcdefgh")
+
+    assert backend.size <= 5000
+    assert backend.usage() == {
+        "size": 5000,
+        "max_bytes": 5000,
+        "evictions": 3,
+        "evicted_bytes": 3000,
+    }
+    assert sorted(backend) == ["d", "e", "f", "g", "h"]
+
+
+def test_lru_eviction_keeps_recently_read_entries() -> None:
+    backend = pylast._ShelfCacheBackend.create_shelf(max_bytes=3000)
+    _fill(backend, "abc")
+
+    backend.get_entry("a")
+    _fill(backend, "d")
+
+    assert sorted(backend) == ["a", "c", "d"]
+
+
+def test_lfu_eviction_keeps_frequently_read_entries() -> None:
+    backend = pylast._ShelfCacheBackend.create_shelf(max_bytes=3000, eviction="lfu")
+    _fill(backend, "abc")
+
+    for _ in range(3):
+        backend.get_entry("b")
+    backend.get_entry("c")
+    _fill(backend, "de")
+
+    assert sorted(backend) == ["b", "c", "e"]
+
+
+def test_eviction_finds_entries_stored_before_opening(tmp_path) -> None:
+    file_path = str(tmp_path / "cache")
+    backend = pylast._ShelfCacheBackend(file_path)
+    _fill(backend, "abcd")
+    backend.close()
+
+    backend = pylast._ShelfCacheBackend(file_path, max_bytes=3000)
+    assert backend.size == 4000
+    _fill(backend, "e")
+
+    assert backend.size <= 3000
+    assert "e" in backend
+    assert backend.evictions == 2
+
+
+def test_eviction_counts_shelves_without_size_accounting(tmp_path) -> None:
+    file_path = str(tmp_path / "cache")
+    with shelve.open(file_path) as shelf:
+        for key in "abcd":
+            shelf[key] = "x" * 1000
+
+    backend = pylast._ShelfCacheBackend(file_path, max_bytes=3000)
+    _fill(backend, "e")
+
+    assert backend.size == 3000
+    assert len(list(backend)) == 3
+    assert "e" in backend
+
+
+def test_network_exposes_cache_usage() -> None:
+    network = make_network()
+    assert network.get_cache_usage() == {}
+
+    network.enable_caching(max_bytes=10_000, memory_max_entries=10)
+
+    assert network.get_cache_usage() == {
+        "size": 0,
+        "max_bytes": 10_000,
+        "evictions": 0,
+        "evicted_bytes": 0,
+        "memory_entries": 0,
+        "memory_size": 0,
+    }
+
+
+def test_response_larger_than_max_bytes_is_returned_uncached() -> None:
+    network = make_network()
+    network.enable_caching(max_bytes=10)
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        assert _artist(network).get_playcount() == 100
+        assert _artist(network).get_playcount() == 100
+
+    assert post.call_count == 2
+    assert network.get_cache_usage()["evictions"] == 2
+
+
+def test_entry_evicted_after_it_is_read_is_still_returned() -> None:
+    network = make_network()
+    network.enable_caching()
+    backend = network.cache_backend
+    get_entry = backend.get_entry
+
+    def get_entry_then_evict(key):
+        entry = get_entry(key)
+        backend.delete_entry(key)
+        return entry
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        _artist(network).get_playcount()
+        with patch.object(backend, "get_entry", side_effect=get_entry_then_evict):
+            assert _artist(network).get_playcount() == 100
+
+    assert post.call_count == 1
+
+
+def test_unknown_eviction_policy() -> None:
+    with pytest.raises(ValueError, match="Unknown eviction policy"):
+        make_network().enable_caching(eviction="random")
+
+
+OK_BODY = b'<?xml version="1.0"?><lfm status="ok"></lfm>'
+
+
+def _loved_body(loved: int) -> bytes:
+    return (
+        '<?xml version="1.0"?><lfm status="ok"><track><name>T</name>'
+        f"<userloved>{loved}</userloved></track></lfm>"
+    ).encode()
+
+
+def _tags_body(*names: str) -> bytes:
+    tags = "".join(f"<tag><name>{name}</name></tag>" for name in names)
+    return f'<?xml version="1.0"?><lfm status="ok"><tags>{tags}</tags></lfm>'.encode()
+
+
+def _authenticatedmake_network() -> pylast.LastFMNetwork:
+    network = pylast.LastFMNetwork(
+        api_key="k", api_secret="s", session_key="sk", username="alice"
+    )
+    network.enable_caching()
+    return network
+
+
+def test_love_evicts_cached_userloved() -> None:
+    network = _authenticatedmake_network()
+    track = pylast.Track("Test Artist", "test title", network)
+    responses = [_loved_body(0), OK_BODY, _loved_body(1)]
+
+    with patch("httpx2.Client.post", side_effect=[fake_response(r) for r in responses]):
+        assert track.get_userloved() is False
+        assert track.get_userloved() is False
+        track.love()
+        assert track.get_userloved() is True
+
+
+def test_tag_writes_evict_cached_tags() -> None:
+    network = _authenticatedmake_network()
+    artist = pylast.Artist("Test Artist", network)
+    responses = [_tags_body("rock"), OK_BODY, _tags_body("rock", "jazz"), OK_BODY]
+
+    with patch(
+        "httpx2.Client.post", side_effect=[fake_response(r) for r in responses]
+    ) as post:
+        assert artist.get_tags(cacheable=True) == [pylast.Tag("rock", network)]
+        assert artist.get_tags(cacheable=True) == [pylast.Tag("rock", network)]
+        artist.add_tag("jazz")
+        assert len(artist.get_tags(cacheable=True)) == 2
+        assert len(artist.get_tags(cacheable=True)) == 2
+        artist.remove_tag("jazz")
+
+    assert post.call_count == 4
+    assert not list(network.cache_backend)
+
+
+def test_writes_leave_unrelated_cache_entries() -> None:
+    network = _authenticatedmake_network()
+    artist = pylast.Artist("Test Artist", network)
+
+    with patch(
+        "httpx2.Client.post",
+        side_effect=[fake_response(_body()), fake_response(OK_BODY)],
+    ) as post:
+        assert artist.get_playcount() == 100
+        artist.add_tag("jazz")
+        assert artist.get_playcount() == 100
+
+    assert post.call_count == 2
+
+
+def test_buffered_writes_commit_as_a_group_by_count(tmp_path) -> None:
+    backend = pylast._ShelfCacheBackend(str(tmp_path / "cache"), write_buffer_entries=3)
+
+    with patch.object(backend.shelf, "sync", wraps=backend.shelf.sync) as sync:
+        _fill(backend, "ab")
+        assert "a" not in backend.shelf
+        assert backend.get_xml("a") == "x" * 1000
+        assert "b" in backend
+
+        _fill(backend, "c")
+
+    assert sync.call_count == 1
+    assert not backend._pending
+    assert all(key in backend.shelf for key in "abc")
+
+
+def test_buffered_writes_commit_by_bytes_and_age(tmp_path) -> None:
+    by_bytes = pylast._ShelfCacheBackend(
+        str(tmp_path / "bytes"), write_buffer_bytes=2500
+    )
+    _fill(by_bytes, "ab")
+    assert len(by_bytes._pending) == 2
+    _fill(by_bytes, "c")
+    assert not by_bytes._pending
+
+    by_age = pylast._ShelfCacheBackend(str(tmp_path / "age"), write_buffer_seconds=10)
+    _fill(by_age, "a")
+    with patch("time.time", return_value=pylast.time.time() + 11):
+        _fill(by_age, "b")
+    assert not by_age._pending
+
+
+def test_buffered_writes_are_committed_on_close(tmp_path) -> None:
+    file_path = str(tmp_path / "cache")
+    network = make_network()
+    network.enable_caching(file_path, write_buffer_entries=100)
+    network.cache_backend.set_xml("a", "x" * 1000)
+
+    network.disable_caching()
+
+    assert pylast._ShelfCacheBackend(file_path).get_xml("a") == "x" * 1000
+
+
+def test_buffered_writes_are_committed_when_caching_is_enabled_again(
+    tmp_path,
+) -> None:
+    file_path = str(tmp_path / "cache")
+    network = make_network()
+    network.enable_caching(file_path, write_buffer_entries=100)
+    network.cache_backend.set_xml("a", "x" * 1000)
+
+    network.enable_caching(file_path, write_buffer_entries=100)
+
+    assert network.cache_backend.get_xml("a") == "x" * 1000
+
+
+def test_buffered_writes_are_committed_at_exit(tmp_path) -> None:
+    file_path = str(tmp_path / "cache")
+    backend = pylast._ShelfCacheBackend(file_path, write_buffer_entries=100)
+    backend.set_xml("a", "x" * 1000)
+
+    pylast._close_open_shelves()
+
+    assert backend not in pylast._open_shelves
+    assert pylast._ShelfCacheBackend(file_path).get_xml("a") == "x" * 1000
+
+
+def test_buffered_writes_can_be_deleted_and_evicted(tmp_path) -> None:
+    backend = pylast._ShelfCacheBackend(
+        str(tmp_path / "cache"), max_bytes=2000, write_buffer_entries=100
+    )
+    _fill(backend, "abc")
+    backend.delete_entry("c")
+
+    assert sorted(backend) == ["b"]
+    assert backend.size == 1000
+
+
+def test_export_and_import_cache(tmp_path) -> None:
+    source = make_network()
+    source.enable_caching()
+    backend = source.cache_backend
+    backend.set_xml("plain", _body().decode())
+    backend.set_entry("expiring", pylast._CacheEntry(_body().decode(), 2e9))
+    backend.set_entry("missing", pylast._CacheEntry(None, 2e9, ("6", "Not found")))
+    export_path = tmp_path / "cache.jsonl.gz"
+
+    assert source.export_cache(export_path) == 3
+
+    target = make_network()
+    target.enable_caching()
+    target.cache_backend.set_xml("plain", "<lfm/>")
+    assert target.import_cache(export_path) == 2
+
+    assert target.cache_backend.get_xml("plain") == "<lfm/>"
+    assert target.cache_backend.get_entry("expiring") == backend.get_entry("expiring")
+    assert target.cache_backend.get_entry("missing") == pylast._CacheEntry(
+        None, 2e9, ("6", "Not found")
+    )
+    assert target.import_cache(export_path) == 0
+
+
+def test_export_does_not_count_entries_as_used() -> None:
+    network = make_network()
+    network.enable_caching(max_bytes=3000, compression=None)
+    _fill(network.cache_backend, "abc")
+
+    network.export_cache(os.devnull)
+    _fill(network.cache_backend, "d")
+
+    assert sorted(network.cache_backend) == ["b", "c", "d"]
+
+
+def test_import_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "other.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"something": "else"}\n')
+    network = make_network()
+    network.enable_caching()
+
+    with pytest.raises(pylast.PyLastError, match="Not a pylast cache export"):
+        network.import_cache(path)
+
+
+def test_export_requires_caching(tmp_path) -> None:
+    with pytest.raises(pylast.PyLastError, match="Caching is not enabled"):
+        make_network().export_cache(tmp_path / "cache.jsonl.gz")
+
+
+def test_cache_snapshot_serves_reads(tmp_path) -> None:
+    key = "0123456789abcdef0123456789abcdef01234567"
+    source = make_network()
+    source.enable_caching()
+    source.cache_backend.set_xml(key, _body().decode())
+    source.cache_backend.set_entry("short", pylast._CacheEntry("<lfm/>", 2e9))
+    source.cache_backend.set_entry(
+        "missing", pylast._CacheEntry(None, 2e9, ("6", "Not found"))
+    )
+    snapshot_path = tmp_path / "cache.snapshot"
+
+    assert source.write_cache_snapshot(snapshot_path) == 3
+
+    snapshot = pylast._SnapshotCacheBackend(snapshot_path)
+    assert key in snapshot
+    assert "other" not in snapshot
+    assert snapshot.get_xml(key) == _body().decode()
+    assert snapshot.get_entry("short") == pylast._CacheEntry("<lfm/>", 2e9)
+    assert snapshot.get_entry("missing") == pylast._CacheEntry(
+        None, 2e9, ("6", "Not found")
+    )
+    with pytest.raises(pylast.PyLastError, match="read-only"):
+        snapshot.set_xml(key, "<lfm/>")
+    snapshot.close()
+
+
+def test_cache_snapshot_tier_takes_no_writes(tmp_path) -> None:
+    a, b, c = ("a" * 40, "b" * 40, "c" * 40)
+    snapshot_path = tmp_path / "cache.snapshot"
+    source = make_network()
+    source.enable_caching()
+    source.cache_backend.set_xml(a, "<a/>")
+    source.cache_backend.set_xml(b, "<b/>")
+    source.write_cache_snapshot(snapshot_path, compression=None)
+
+    network = make_network()
+    network.enable_caching(snapshot_path=snapshot_path)
+    backend = network.cache_backend
+    backend.set_xml(b, "<new/>")
+    backend.delete_entry(a)
+    backend.set_xml(c, "<c/>")
+
+    assert a not in backend
+    assert backend.get_xml(b) == "<new/>"
+    assert sorted(backend) == [b, c]
+    assert pylast._SnapshotCacheBackend(snapshot_path).get_xml(a) == "<a/>"
+
+
+def test_cache_snapshot_falls_back_when_expired(tmp_path) -> None:
+    snapshot_path = tmp_path / "cache.snapshot"
+    pylast._SnapshotCacheBackend.write(
+        snapshot_path, [("a", pylast._CacheEntry("<old/>", 1.0))]
+    )
+    network = make_network()
+    network.enable_caching(snapshot_path=snapshot_path)
+
+    assert network.cache_backend.get_entry("a") == pylast._CacheEntry("<old/>", 1.0)
+    network.cache_backend.backend.set_xml("a", "<new/>")
+    assert network.cache_backend.get_xml("a") == "<new/>"
+
+
+def test_cache_snapshot_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "other"
+    path.write_bytes(b"something else entirely")
+
+    with pytest.raises(pylast.PyLastError, match="Not a pylast cache snapshot"):
+        pylast._SnapshotCacheBackend(path)
+
+
+TOP_ALBUMS_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><topalbums>'
+    b"<album><name>Album</name><playcount>12</playcount>"
+    b"<artist><name>Test Artist</name></artist>"
+    b'<image size="small">https://example.com/s.png</image></album>'
+    b"</topalbums></lfm>"
+)
+
+
+def test_record_cache_skips_parsing_on_hit() -> None:
+    network = make_network()
+    network.enable_caching(records=True)
+    user = pylast.User("alice", network)
+
+    with patch("httpx2.Client.post", return_value=fake_response(TOP_ALBUMS_BODY)):
+        first = user.get_top_albums()
+    with patch("pylast._parse_response") as parse:
+        second = user.get_top_albums()
+
+    parse.assert_not_called()
+    assert first == second
+    album, playcount = second[0]
+    assert (album.title, str(album.artist), playcount) == (
+        "Album",
+        "Test Artist",
+        "12",
+    )
+    assert album.info["image"] == ["https://example.com/s.png"]
+
+
+def test_record_cache_is_versioned() -> None:
+    network = make_network()
+    network.enable_caching(records=True)
+    user = pylast.User("alice", network)
+    with patch("httpx2.Client.post", return_value=fake_response(TOP_ALBUMS_BODY)):
+        user.get_top_albums()
+
+    with (
+        patch("pylast._RECORD_SCHEMA_VERSION", pylast._RECORD_SCHEMA_VERSION + 1),
+        patch("pylast._parse_response", wraps=pylast._parse_response) as parse,
+    ):
+        assert user.get_top_albums()[0].weight == "12"
+
+    parse.assert_called_once()
+
+
+def test_record_cache_expires_with_response() -> None:
+    network = make_network()
+    network.enable_caching(records=True)
+    network.set_cache_policy("user.getTopAlbums", ttl=60)
+    user = pylast.User("alice", network)
+
+    with (
+        patch("time.time", return_value=1000.0),
+        patch("httpx2.Client.post", return_value=fake_response(TOP_ALBUMS_BODY)),
+    ):
+        user.get_top_albums()
+    with (
+        patch("time.time", return_value=2000.0),
+        patch(
+            "httpx2.Client.post", return_value=fake_response(TOP_ALBUMS_BODY)
+        ) as post,
+    ):
+        user.get_top_albums()
+
+    assert post.call_count == 1
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough of the Redis protocol for the cache backend."""
+
+    def handle(self) -> None:
+        while line := self.rfile.readline():
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            self.server.commands.append(args)
+            self.wfile.write(self._reply(args))
+
+    def _reply(self, args) -> bytes:
+        data = self.server.data
+        command, args = args[0].upper(), args[1:]
+        if command in (b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if command == b"SET":
+            data[args[0]] = args[1]
+            return b"+OK\r\n"
+        if command == b"GET":
+            return self._bulk(data.get(args[0]))
+        if command == b"MGET":
+            return b"*%d\r\n" % len(args) + b"".join(
+                self._bulk(data.get(key)) for key in args
+            )
+        if command in (b"DEL", b"EXISTS"):
+            found = args[0] in data
+            if command == b"DEL":
+                data.pop(args[0], None)
+            return b":%d\r\n" % found
+        if command == b"SCAN":
+            prefix = args[2].rstrip(b"*")
+            keys = [key for key in data if key.startswith(prefix)]
+            return b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys) + b"".join(
+                self._bulk(key) for key in keys
+            )
+        return b"-ERR unknown command\r\n"
+
+    @staticmethod
+    def _bulk(value: bytes | None) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+@pytest.fixture
+def redis_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _FakeRedisHandler)
+    server.daemon_threads = True
+    server.data = {}
+    server.commands = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+local_network_only = pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+
+
+def _redis_url(server) -> str:
+    host, port = server.server_address
+    return f"redis://:secret@{host}:{port}/2"
+
+
+@local_network_only
+def test_redis_cache_is_shared_between_networks(redis_server) -> None:
+    first = make_network()
+    first.enable_caching(redis_url=_redis_url(redis_server))
+    second = make_network()
+    second.enable_caching(redis_url=_redis_url(redis_server))
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        assert pylast.Artist("Test Artist", first).get_playcount() == 100
+        assert pylast.Artist("Test Artist", second).get_playcount() == 100
+
+    assert post.call_count == 1
+    assert redis_server.commands[:2] == [[b"AUTH", b"secret"], [b"SELECT", b"2"]]
+    first.disable_caching()
+    second.disable_caching()
+
+
+@local_network_only
+def test_redis_cache_stores_entries(redis_server) -> None:
+    backend = pylast._RedisCacheBackend.from_url(_redis_url(redis_server))
+    backend.set_entry("a", pylast._CacheEntry("<a/>", 2e9))
+    backend.set_entry("b", pylast._CacheEntry(None, 2e9, ("6", "Not found")))
+    backend.set_xml("c", "<c/>")
+    backend.delete_entry("c")
+
+    assert "a" in backend
+    assert "c" not in backend
+    assert sorted(backend) == ["a", "b"]
+    assert backend.get_entry("b") == pylast._CacheEntry(None, 2e9, ("6", "Not found"))
+    assert backend.get_entry("c") is None
+    assert set(redis_server.data) == {b"pylast:a", b"pylast:b"}
+    backend.close()
+
+
+@local_network_only
+def test_redis_cache_pipelines_multi_get(redis_server) -> None:
+    backend = pylast._RedisCacheBackend.from_url(_redis_url(redis_server))
+    backend.MGET_BATCH = 2
+    for key in "abc":
+        backend.set_xml(key, f"<{key}/>")
+    redis_server.commands.clear()
+
+    entries = backend.get_entries(["a", "b", "missing", "c", "a"])
+
+    assert {key: entry.xml for key, entry in entries.items()} == {
+        "a": "<a/>",
+        "b": "<b/>",
+        "c": "<c/>",
+    }
+    assert [command[0] for command in redis_server.commands] == [b"MGET", b"MGET"]
+    backend.close()
+
+
+@local_network_only
+def test_redis_cache_reports_server_errors(redis_server) -> None:
+    backend = pylast._RedisCacheBackend.from_url(_redis_url(redis_server))
+
+    with pytest.raises(pylast.PyLastError, match="unknown command"):
+        backend._command("FLUSHALL")
+    assert backend.get_entry("a") is None  # the connection is still usable
+    backend.close()
+
+
+@local_network_only
+def test_redis_cache_url_with_a_username(redis_server) -> None:
+    host, port = redis_server.server_address
+    backend = pylast._RedisCacheBackend.from_url(f"redis://pylast:secret@{host}:{port}")
+
+    assert backend.get_entry("a") is None
+    assert redis_server.commands[0] == [b"AUTH", b"pylast", b"secret"]
+    backend.close()
+
+    with pytest.raises(ValueError, match="needs a password"):
+        pylast._RedisCacheBackend.from_url(f"redis://pylast@{host}:{port}")
+
+
+@local_network_only
+def test_unreachable_redis_cache_falls_back_to_downloading(caplog) -> None:
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        host, port = unused.getsockname()
+    network = make_network()
+    network.enable_caching(redis_url=f"redis://{host}:{port}")
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        assert _artist(network).get_playcount() == 100
+        assert network.get_artists_info(["A", "B"])[0].error is None
+
+    assert post.call_count == 3
+    assert "Cache server request failed" in caplog.text
+    network.disable_caching()
+
+
+def test_redis_cache_url_and_file_path_are_exclusive(tmp_path) -> None:
+    with pytest.raises(ValueError, match="either file_path or redis_url"):
+        make_network().enable_caching(str(tmp_path / "cache"), redis_url="redis://x")
+
+
+def test_stats_count_cache_lookups_by_method() -> None:
+    network = make_network()
+    network.enable_caching(negative_ttl=60)
+    network.set_cache_policy("artist.getInfo", ttl=60)
+
+    with (
+        patch("time.time", return_value=1000.0),
+        patch("httpx2.Client.post", return_value=fake_response(_body())),
+    ):
+        _artist(network).get_playcount()
+        _artist(network).get_playcount()
+    with (
+        patch("time.time", return_value=2000.0),
+        patch("httpx2.Client.post", return_value=fake_response(NOT_FOUND_BODY)),
+    ):
+        for _ in range(2):
+            with pytest.raises(pylast.WSError):
+                _artist(network).get_playcount()
+
+    stats = network.get_stats()["artist.getInfo"]
+    assert {name: stats[name] for name in ("hits", "misses", "expired")} == {
+        "hits": 1,
+        "misses": 2,
+        "expired": 1,
+    }
+    assert stats["negative_hits"] == 1
+    assert stats["requests"] == 2
+    assert stats["bytes_read"] == stats["bytes_written"] == len(_body())
+    assert stats["average_parse_time"] is not None
+    assert stats["average_latency"] is not None
+
+
+def test_stats_reset() -> None:
+    network = make_network()
+    with patch("httpx2.Client.post", return_value=fake_response(_body())):
+        pylast.Artist("Test Artist", network).get_playcount()
+
+    stats = network.get_stats()["artist.getInfo"]
+    assert (stats["hits"], stats["misses"], stats["requests"]) == (0, 0, 1)
+
+    network.stats.reset()
+    assert network.get_stats() == {}
+
+
+def test_zstd_is_looked_up_once() -> None:
+    pylast._import_zstd()
+
+    with patch("builtins.__import__") as import_:
+        pylast._import_zstd()
+
+    import_.assert_not_called()
+
+
+class _FakeSqliteDbm:
+    """Stands in for a dbm.sqlite3 database, which Python < 3.13 lacks."""
+
+    def __init__(self, keys) -> None:
+        self._cx = sqlite3.connect(":memory:")
+        self._cx.execute("CREATE TABLE Dict (key BLOB UNIQUE NOT NULL, value BLOB)")
+        self._cx.executemany(
+            "INSERT INTO Dict VALUES (?, x'')", [(key.encode(),) for key in keys]
+        )
+
+    def keys(self):
+        msg = "Lists all the keys"
+        raise AssertionError(msg)
+
+    def __len__(self) -> int:
+        msg = "Counts all the keys"
+        raise AssertionError(msg)
+
+
+def test_census_pages_through_sqlite_dbm(tmp_path) -> None:
+    backend = pylast._ShelfCacheBackend(str(tmp_path / "cache"))
+    db = backend.shelf.dict
+    keys = [f"{i:040x}" for i in range(150)]
+
+    backend.shelf.dict = _FakeSqliteDbm(keys)
+    assert list(backend._iter_stored_keys()) == keys
+    assert not backend._is_empty()
+
+    backend.shelf.dict = _FakeSqliteDbm([])
+    assert backend._is_empty()
+
+    backend.shelf.dict = db
+    backend.close()
+
+
+@pytest.mark.usefixtures("sqlite_dbm")
+def test_sqlite_dbm_shelf_works_from_worker_threads(tmp_path) -> None:
+    network = make_network()
+    network.enable_caching(str(tmp_path / "cache"))
+    db = network.cache_backend.shelf.dict
+    assert isinstance(db, SqliteDbm)
+
+    with patch("httpx2.Client.post", return_value=fake_response(_body())) as post:
+        results = network.get_artists_info(["A", "B", "C", "D"], max_workers=4)
+        assert [result.error for result in results] == [None] * 4
+        network.get_artists_info(["A", "B", "C", "D"], max_workers=4)
+
+    assert post.call_count == 4
+    network.disable_caching()
+
+
+def test_incomplete_cache_backend_fails_when_created() -> None:
+    class IncompleteBackend(pylast._CacheBackend):
+        def get_entry(self, key) -> None:
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompleteBackend()  # type: ignore[abstract]
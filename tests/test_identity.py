@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import base64
+import gc
+import pickle
+from unittest.mock import patch
+
+import pylast
+
+from .conftest import make_network
+
+
+def test_identity_map_shares_equal_instances() -> None:
+    network = make_network()
+    network.enable_identity_map()
+
+    track = pylast.Track("Test Artist", "Test Title", network)
+
+    assert pylast.Track("test artist", "TEST TITLE", network) is track
+    assert pylast.Artist("TEST ARTIST", network) is track.artist
+    assert pylast.Track("Test Artist", "Other Title", network) is not track
+    assert pylast.Album("Test Artist", "Test Title", network) is not track
+    assert pylast.Tag("Rock", network) is pylast.Tag("rock", network)
+
+
+def test_identity_map_merges_info() -> None:
+    network = make_network()
+    network.enable_identity_map()
+    artist = pylast.Artist("Test Artist", network, info={"mbid": "a1b2"})
+
+    same = pylast.Artist("Test Artist", network, info={"mbid": "x", "url": "u"})
+
+    assert same is artist
+    assert artist.info == {"mbid": "a1b2", "url": "u"}
+
+
+def test_identity_map_is_weak() -> None:
+    network = make_network()
+    network.enable_identity_map()
+    pylast.Artist("Test Artist", network)
+    gc.collect()
+
+    assert len(network.identity_map) == 0
+
+
+def test_identity_map_is_optional() -> None:
+    network = make_network()
+
+    assert pylast.Artist("Test Artist", network) is not pylast.Artist(
+        "Test Artist", network
+    )
+
+    network.enable_identity_map()
+    network.disable_identity_map()
+    assert pylast.Artist("Test Artist", network) is not pylast.Artist(
+        "Test Artist", network
+    )
+
+
+def test_identity_map_survives_pickling() -> None:
+    network = make_network()
+    network.enable_identity_map()
+    artist = pylast.Artist("Test Artist", network)
+
+    network = pickle.loads(pickle.dumps(network))
+
+    assert isinstance(network.identity_map, pylast._IdentityMap)
+    assert pylast.Artist("Test Artist", network) is not artist
+
+
+def test_entities_have_no_instance_dict() -> None:
+    network = make_network()
+    user = pylast.User("alice", network)
+    entities = [
+        pylast.Artist("Test Artist", network),
+        pylast.Album("Test Artist", "Test Album", network),
+        pylast.Track("Test Artist", "Test Title", network),
+        pylast.Tag("rock", network),
+        pylast.Country("Italy", network),
+        pylast.Library(user, network),
+        user,
+    ]
+
+    for entity in entities:
+        assert not hasattr(entity, "__dict__"), type(entity)
+        assert repr(pickle.loads(pickle.dumps(entity))) == repr(entity)
+
+
+def test_identity_key_is_computed_once() -> None:
+    network = make_network()
+    track = pylast.Track("Test Artist", "Test Title", network)
+    same = pylast.Track("TEST ARTIST", "test title", network)
+    hash(track), hash(same)
+
+    with patch.object(pylast.Track, "_get_params") as get_params:
+        assert track == same
+        assert hash(track) == hash(same)
+        assert len({track, same}) == 1
+
+    get_params.assert_not_called()
+
+
+def test_identity_key_is_recomputed_on_rename() -> None:
+    network = make_network()
+    artist = pylast.Artist("Test Artist", network)
+    hash(artist)
+
+    with patch.object(pylast.Artist, "_get_info", return_value="Other Artist"):
+        artist.get_name(properly_capitalized=True)
+
+    assert artist == pylast.Artist("other artist", network)
+    assert artist != pylast.Artist("Test Artist", network)
+
+
+# [Artist (with an mbid), Track, Tag, User], pickled by pylast before __slots__
+UNSLOTTED_PICKLE = (
+    "gASVyQMAAAAAAABdlCiMBnB5bGFzdJSMBkFydGlzdJSTlCmBlH2UKIwHbmV0d29ya5RoAYwNTGFz"
+    "dEZNTmV0d29ya5STlCmBlH2UKIwEbmFtZZSMB0xhc3QuZm2UjAhob21lcGFnZZSME2h0dHBzOi8v"
+    "d3d3Lmxhc3QuZm2UjAl3c19zZXJ2ZXKUjBV3cy5hdWRpb3Njcm9iYmxlci5jb22UjAUvMi4wL5SG"
+    "lIwHYXBpX2tleZSMAWuUjAphcGlfc2VjcmV0lIwBc5SMC3Nlc3Npb25fa2V5lIwAlIwIdXNlcm5h"
+    "bWWUaBiMDXBhc3N3b3JkX2hhc2iUaBiMDGRvbWFpbl9uYW1lc5R9lChLAIwLd3d3Lmxhc3QuZm2U"
+    "SwGMDnd3dy5sYXN0LmZtL2RllEsCjA53d3cubGFzdC5mbS9lc5RLA4wOd3d3Lmxhc3QuZm0vZnKU"
+    "SwSMDnd3dy5sYXN0LmZtL2l0lEsFjA53d3cubGFzdC5mbS9wbJRLBowOd3d3Lmxhc3QuZm0vcHSU"
+    "SweMDnd3dy5sYXN0LmZtL3N2lEsIjA53d3cubGFzdC5mbS90cpRLCYwOd3d3Lmxhc3QuZm0vcnWU"
+    "SwqMDnd3dy5sYXN0LmZtL2phlEsLjA53d3cubGFzdC5mbS96aJR1jAR1cmxzlH2UKIwFYWxidW2U"
+    "jBptdXNpYy8lKGFydGlzdClzLyUoYWxidW0pc5SMBmFydGlzdJSMEG11c2ljLyUoYXJ0aXN0KXOU"
+    "jAdjb3VudHJ5lIwWcGxhY2UvJShjb3VudHJ5X25hbWUpc5SMA3RhZ5SMDHRhZy8lKG5hbWUpc5SM"
+    "BXRyYWNrlIwcbXVzaWMvJShhcnRpc3Qpcy9fLyUodGl0bGUpc5SMBHVzZXKUjA11c2VyLyUobmFt"
+    "ZSlzlHWMBXByb3h5lE6MDWNhY2hlX2JhY2tlbmSUTowObGFzdF9jYWxsX3RpbWWURwAAAAAAAAAA"
+    "jApsaW1pdF9yYXRllIl1YowJd3NfcHJlZml4lGgtaAuMC1Rlc3QgQXJ0aXN0lGgZaBiMBGluZm+U"
+    "fZSMBG1iaWSUjARhMWIylHN1YmgBjAVUcmFja5STlCmBlH2UKGgGaAloO2gzaC1oAymBlH2UKGgG"
+    "aAloO2gtaAtoPGgZaBhoPX2UdWKMBXRpdGxllIwKVGVzdCBUaXRsZZRoGWgYaD19lHViaAGMA1Rh"
+    "Z5STlCmBlH2UKGgGaAloO2gxaAuMBHJvY2uUdWJoAYwEVXNlcpSTlCmBlH2UKGgGaAloO2g1aAuM"
+    "BWFsaWNllHViZS4="
+)
+
+
+def test_objects_pickled_before_slots_load() -> None:
+    artist, track, tag, user = pickle.loads(base64.b64decode(UNSLOTTED_PICKLE))
+
+    assert artist == pylast.Artist("Test Artist", artist.network)
+    assert artist.info == {"mbid": "a1b2"}
+    assert artist.info_time is None
+    assert track == pylast.Track("Test Artist", "Test Title", track.network)
+    assert tag == pylast.Tag("rock", tag.network)
+    assert tag.info == {}
+    assert user.get_name() == "alice"
+    assert isinstance(artist.network.stats, pylast._RequestStats)
+    assert artist.network.identity_map is None
@@ -0,0 +1,491 @@
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+import pylast
+
+from .conftest import NOT_FOUND_BODY, fake_response, make_network
+
+ARTIST_INFO_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><artist><name>Test Artist</name>'
+    b"<mbid>a1b2</mbid>"
+    b'<image size="small">https://example.com/s.png</image>'
+    b"<stats><listeners>10</listeners><playcount>100</playcount></stats>"
+    b"<bio><published>01 Jan 2020</published><summary>Short</summary>"
+    b"<content>Long</content></bio></artist></lfm>"
+)
+
+TRACK_INFO_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><track><name>Test Title</name>'
+    b"<mbid>c3d4</mbid><duration>180000</duration>"
+    b"<listeners>5</listeners><playcount>50</playcount>"
+    b"<artist><name>Test Artist</name></artist>"
+    b"<album><artist>Test Artist</artist><title>Test Album</title>"
+    b'<image size="small">https://example.com/a.png</image></album>'
+    b"<wiki><summary>About</summary></wiki></track></lfm>"
+)
+
+
+def test_artist_getters_share_one_get_info() -> None:
+    artist = pylast.Artist("Test Artist", make_network())
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(ARTIST_INFO_BODY)
+    ) as post:
+        assert artist.get_playcount() == 100
+        assert artist.get_listener_count() == 10
+        assert artist.get_mbid() == "a1b2"
+        assert artist.get_bio_summary() == "Short"
+        assert artist.get_bio_content() == "Long"
+
+    assert post.call_count == 1
+    assert artist.info["playcount"] == "100"
+
+
+def test_track_getters_share_one_get_info() -> None:
+    track = pylast.Track("Test Artist", "Test Title", make_network())
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(TRACK_INFO_BODY)
+    ) as post:
+        assert track.get_duration() == 180000
+        assert track.get_album() == pylast.Album(
+            "Test Artist", "Test Album", track.network
+        )
+        assert track.get_playcount() == 50
+        assert track.get_mbid() == "c3d4"
+        assert track.get_wiki_summary() == "About"
+        assert track.get_cover_image(pylast.SIZE_SMALL) == "https://example.com/a.png"
+
+    assert post.call_count == 1
+
+
+def test_info_passed_in_is_used_first() -> None:
+    track = pylast.Track(
+        "Test Artist", "Test Title", make_network(), info={"album": "Other Album"}
+    )
+
+    with patch("httpx2.Client.post") as post:
+        assert track.get_album().get_title() == "Other Album"
+
+    post.assert_not_called()
+
+
+def test_refresh_fetches_info_again() -> None:
+    network = make_network()
+    network.enable_caching()
+    artist = pylast.Artist("Test Artist", network)
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(ARTIST_INFO_BODY)
+    ) as post:
+        artist.get_playcount()
+        artist.refresh()
+        artist.get_playcount()
+
+    assert post.call_count == 2
+
+
+def test_info_max_age() -> None:
+    network = make_network()
+    network.info_max_age = 60
+    artist = pylast.Artist("Test Artist", network)
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(ARTIST_INFO_BODY)
+    ) as post:
+        with patch("time.time", return_value=1000.0):
+            artist.get_playcount()
+            artist.get_mbid()
+        with patch("time.time", return_value=1061.0):
+            artist.get_playcount()
+
+    assert post.call_count == 2
+
+
+SIMILAR_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><similarartists artist="X">'
+    b"<artist><name>Similar</name><mbid>e5f6</mbid><match>0.5</match>"
+    b"<url>https://www.last.fm/music/Similar</url>"
+    b'<image size="small">https://example.com/sim.png</image></artist>'
+    b"</similarartists></lfm>"
+)
+
+USER_TOP_ARTISTS_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><topartists user="alice">'
+    b"<artist><name>Test Artist</name><playcount>7</playcount><mbid>a1b2</mbid>"
+    b"<url>https://www.last.fm/music/Test+Artist</url></artist>"
+    b"</topartists></lfm>"
+)
+
+CHART_TOP_ARTISTS_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><artists>'
+    b"<artist><name>Test Artist</name><playcount>100</playcount>"
+    b"<listeners>10</listeners><mbid>a1b2</mbid></artist>"
+    b"</artists></lfm>"
+)
+
+
+def test_similar_artists_are_hydrated() -> None:
+    network = make_network()
+    artist = pylast.Artist("X", network)
+
+    with patch("httpx2.Client.post", return_value=fake_response(SIMILAR_BODY)) as post:
+        (similar,) = artist.get_similar()
+        assert similar.match == 0.5
+        assert similar.item.get_mbid() == "e5f6"
+        assert similar.item.info["image"] == ["https://example.com/sim.png"]
+
+    assert post.call_count == 1
+
+
+def test_user_lists_do_not_hydrate_play_counts() -> None:
+    user = pylast.User("alice", make_network())
+
+    with patch("httpx2.Client.post", return_value=fake_response(USER_TOP_ARTISTS_BODY)):
+        (top_item,) = user.get_top_artists()
+
+    assert top_item.weight == "7"
+    assert top_item.item.info == {
+        "mbid": "a1b2",
+        "url": "https://www.last.fm/music/Test+Artist",
+    }
+
+
+def test_chart_lists_hydrate_play_counts() -> None:
+    network = make_network()
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(CHART_TOP_ARTISTS_BODY)
+    ) as post:
+        (top_item,) = network.get_top_artists()
+        assert top_item.item.get_playcount() == 100
+        assert top_item.item.get_listener_count() == 10
+
+    assert post.call_count == 1
+
+
+def _artist_info_response(url, data) -> Mock:
+    if data["artist"] == "Missing":
+        return fake_response(NOT_FOUND_BODY)
+    return fake_response(ARTIST_INFO_BODY.replace(b"Test Artist", b"X"))
+
+
+def test_get_info_many_fetches_each_artist_once() -> None:
+    network = make_network()
+    artists = [
+        pylast.Artist("A", network),
+        pylast.Artist("Missing", network),
+        pylast.Artist("a", network),
+        pylast.Artist("B", network),
+    ]
+
+    with patch("httpx2.Client.post", side_effect=_artist_info_response) as post:
+        results = network.get_info_many(artists)
+        assert [artist.get_playcount() for artist in (artists[0], artists[2])] == [
+            100,
+            100,
+        ]
+
+    assert post.call_count == 3
+    assert [result.item for result in results] == artists
+    assert [result.error for result in results][::2] == [None, None]
+    assert isinstance(results[1].error, pylast.WSError)
+    assert results[1].error.status == "6"
+
+
+def test_get_info_many_checks_the_cache_in_bulk() -> None:
+    network = make_network()
+    network.enable_caching(negative_ttl=60)
+    with patch("httpx2.Client.post", side_effect=_artist_info_response):
+        network.get_artists_info(["A", "Missing"])
+
+    with (
+        patch.object(
+            network.cache_backend,
+            "get_entries",
+            wraps=network.cache_backend.get_entries,
+        ) as get_entries,
+        patch("httpx2.Client.post", side_effect=_artist_info_response) as post,
+    ):
+        results = network.get_artists_info(["A", "Missing", "B"])
+
+    get_entries.assert_called_once()
+    assert post.call_count == 1
+    assert results[0].item.info["playcount"] == "100"
+    assert isinstance(results[1].error, pylast.WSError)
+    assert results[2].error is None
+
+
+ALBUM_INFO_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><album><name>Test Album</name>'
+    b"<artist>Test Artist</artist><url>https://www.last.fm/music/x</url>"
+    b"</album></lfm>"
+)
+
+
+def test_mbid_index_is_filled_from_responses(tmp_path) -> None:
+    network = make_network()
+    network.enable_mbid_index(str(tmp_path / "mbids"))
+
+    with patch("httpx2.Client.post", return_value=fake_response(SIMILAR_BODY)):
+        pylast.Artist("X", network).get_similar()
+    with patch("httpx2.Client.post") as post:
+        similar = network.get_artist_by_mbid("e5f6")
+        assert pylast.Artist("similar", network).get_mbid() == "e5f6"
+
+    post.assert_not_called()
+    assert similar == pylast.Artist("Similar", network)
+
+    network.disable_mbid_index()
+    network.enable_mbid_index(str(tmp_path / "mbids"))
+    assert network.mbid_index.get_names("artist", "e5f6") == ("Similar",)
+
+
+def test_get_by_mbid_keeps_the_mbid() -> None:
+    network = make_network()
+    network.enable_mbid_index()
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(ALBUM_INFO_BODY)
+    ) as post:
+        album = network.get_album_by_mbid("g7h8")
+        assert album.get_mbid() == "g7h8"
+        assert network.get_album_by_mbid("g7h8") == album
+
+    assert post.call_count == 1
+
+
+def _artist_by_mbid_response(url, data) -> Mock:
+    if data["mbid"] == "missing":
+        return fake_response(NOT_FOUND_BODY)
+    body = ARTIST_INFO_BODY.replace(b"a1b2", data["mbid"].encode())
+    return fake_response(body.replace(b"Test Artist", data["mbid"].encode()))
+
+
+def test_resolve_mbids_fetches_only_unknown_ids() -> None:
+    network = make_network()
+    network.enable_mbid_index()
+    pylast.Artist("Known", network, info={"mbid": "known"})
+
+    with patch("httpx2.Client.post", side_effect=_artist_by_mbid_response) as post:
+        results = network.resolve_mbids(["known", "new", "missing", "new"])
+
+    assert post.call_count == 2
+    assert [result.mbid for result in results] == ["known", "new", "missing", "new"]
+    assert results[0].item == pylast.Artist("Known", network)
+    assert results[1].item == results[3].item == pylast.Artist("new", network)
+    assert results[2].item is None
+    assert isinstance(results[2].error, pylast.WSError)
+
+
+@pytest.mark.usefixtures("sqlite_dbm")
+def test_resolve_mbids_indexes_into_a_sqlite_dbm_shelf(tmp_path) -> None:
+    network = make_network()
+    network.enable_mbid_index(str(tmp_path / "mbids"))
+
+    with patch("httpx2.Client.post", side_effect=_artist_by_mbid_response):
+        results = network.resolve_mbids(["a", "b", "c", "d"])
+
+    assert [result.error for result in results] == [None] * 4
+    assert network.mbid_index.get_names("artist", "c") == ("c",)
+    network.disable_mbid_index()
+
+
+def test_resolve_mbids_checks_the_kind() -> None:
+    with pytest.raises(ValueError, match="Unknown kind"):
+        make_network().resolve_mbids(["a1b2"], kind="tag")
+
+
+CORRECTION_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><corrections><correction index="0">'
+    b"<artist><name>Guns N' Roses</name></artist></correction></corrections></lfm>"
+)
+
+
+def test_correction_cache_asks_once_per_casefolded_name() -> None:
+    network = make_network()
+    network.enable_correction_cache()
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(CORRECTION_BODY)
+    ) as post:
+        corrections = [
+            pylast.Artist(name, network).get_correction()
+            for name in ("guns and roses", "GUNS AND ROSES", "Guns and Roses")
+        ]
+
+    assert corrections == ["Guns N' Roses"] * 3
+    assert post.call_count == 1
+
+
+def test_correction_cache_is_kept_in_the_cache_storage() -> None:
+    network = make_network()
+    network.enable_caching()
+    network.enable_correction_cache(memory_max_entries=1)
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(CORRECTION_BODY)
+    ) as post:
+        pylast.Artist("guns and roses", network).get_correction()
+        pylast.Artist("other", network).get_correction()
+        correction = pylast.Artist("Guns And Roses", network).get_correction()
+
+    assert correction == "Guns N' Roses"
+    assert post.call_count == 2
+    assert len(network.correction_cache) == 1
+
+
+def test_correction_cache_expires() -> None:
+    network = make_network()
+    network.enable_correction_cache(ttl=60)
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(CORRECTION_BODY)
+    ) as post:
+        with patch("time.time", return_value=1000.0):
+            pylast.Artist("guns and roses", network).get_correction()
+        with patch("time.time", return_value=1061.0):
+            pylast.Artist("guns and roses", network).get_correction()
+
+    assert post.call_count == 2
+
+
+def test_correct_many() -> None:
+    network = make_network()
+    network.enable_correction_cache()
+    artists = [
+        pylast.Artist("guns and roses", network),
+        pylast.Artist("Missing", network),
+        pylast.Artist("Guns and Roses", network),
+    ]
+
+    def response(url, data) -> Mock:
+        if data["artist"] == "Missing":
+            return fake_response(NOT_FOUND_BODY)
+        return fake_response(CORRECTION_BODY)
+
+    with patch("httpx2.Client.post", side_effect=response) as post:
+        results = network.correct_many(artists)
+
+    assert post.call_count == 2
+    assert [result.item for result in results] == artists
+    assert [result.correction for result in results] == [
+        "Guns N' Roses",
+        None,
+        "Guns N' Roses",
+    ]
+    assert isinstance(results[1].error, pylast.WSError)
+
+
+ALBUM_SEARCH_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><results><albummatches>'
+    b"<album><name>Listed</name><artist>Test Artist</artist>"
+    b'<image size="small">https://example.com/listed-s.png</image>'
+    b'<image size="medium">https://example.com/listed-m.png</image>'
+    b"</album></albummatches></results></lfm>"
+)
+
+
+ALBUM_WITH_IMAGE_BODY = ALBUM_INFO_BODY.replace(
+    b"</album>", b'<image size="small">https://example.com/a.png</image></album>'
+)
+
+
+def test_get_images_fetches_only_missing_images() -> None:
+    network = make_network()
+    with patch("httpx2.Client.post", return_value=fake_response(ALBUM_SEARCH_BODY)):
+        (listed,) = network.search_for_album("Listed").get_next_page()
+
+    def response(url, data) -> Mock:
+        if data["album"] == "Missing":
+            return fake_response(NOT_FOUND_BODY)
+        return fake_response(ALBUM_WITH_IMAGE_BODY)
+
+    albums = [
+        listed,
+        pylast.Album("Test Artist", "Unlisted", network),
+        pylast.Album("Test Artist", "Missing", network),
+        pylast.Album("test artist", "unlisted", network),
+    ]
+    with patch("httpx2.Client.post", side_effect=response) as post:
+        results = network.get_images(albums, pylast.SIZE_SMALL)
+        large = network.get_images(albums[:2], pylast.SIZE_LARGE)
+
+    assert post.call_count == 2
+    assert [result.url for result in results] == [
+        "https://example.com/listed-s.png",
+        "https://example.com/a.png",
+        None,
+        "https://example.com/a.png",
+    ]
+    assert isinstance(results[2].error, pylast.WSError)
+    assert [result.url for result in large] == [None, None]
+
+
+def test_artist_get_image() -> None:
+    artist = pylast.Artist("Test Artist", make_network())
+
+    with patch("httpx2.Client.post", return_value=fake_response(ARTIST_INFO_BODY)):
+        assert artist.get_image(pylast.SIZE_SMALL) == "https://example.com/s.png"
+
+
+TAG_INFO_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><tag><name>Rock</name>'
+    b"<wiki><summary>Rock music</summary></wiki></tag></lfm>"
+)
+
+
+def test_tag_wiki() -> None:
+    tag = pylast.Tag("rock", make_network())
+
+    with patch("httpx2.Client.post", return_value=fake_response(TAG_INFO_BODY)) as post:
+        assert tag.get_wiki_summary() == "Rock music"
+        assert tag.get_wiki_content() is None
+        assert tag.get_name(properly_capitalized=True) == "Rock"
+        tag.refresh()
+
+    assert post.call_count == 2
+
+
+def test_fields_missing_from_get_info_are_not_fetched_again() -> None:
+    artist = pylast.Artist("Test Artist", make_network())
+
+    with patch(
+        "httpx2.Client.post", return_value=fake_response(ARTIST_INFO_BODY)
+    ) as post:
+        assert artist.get_wiki_summary() is None
+        assert artist.get_wiki_summary() is None
+
+    assert post.call_count == 1
+
+
+def test_only_objects_with_info_have_info_methods() -> None:
+    assert not hasattr(pylast.Country("Italy", make_network()), "refresh")
+
+
+class _CountingDict(dict):
+    writes = 0
+
+    def __setitem__(self, key, value) -> None:
+        self.writes += 1
+        super().__setitem__(key, value)
+
+
+def test_mbid_index_writes_only_new_mbids() -> None:
+    network = make_network()
+    network.enable_mbid_index()
+    network.mbid_index.shelf = shelf = _CountingDict()
+
+    pylast.Artist("Test Artist", network, info={"mbid": "a1b2"})
+    assert shelf.writes == 2
+
+    pylast.Artist("Test Artist", network, info={"mbid": "a1b2"})
+    with patch("httpx2.Client.post") as post:
+        artist = network.get_artist_by_mbid("a1b2")
+
+    post.assert_not_called()
+    assert artist.get_mbid() == "a1b2"
+    assert shelf.writes == 2
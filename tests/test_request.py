@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -50,3 +52,22 @@ def test_cacheable_request_with_username_param_hits_cache_on_second_call() -> No
         album.get_userplaycount()
 
     assert post.call_count == 1
+
+
+def test_rate_limited_calls_from_many_threads_are_spaced_out() -> None:
+    network = pylast.LastFMNetwork(api_key="k", api_secret="s")
+    times: list[float] = []
+
+    def call() -> None:
+        network._delay_call()
+        times.append(time.time())
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    times.sort()
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert min(gaps) > pylast.DELAY_TIME / 2
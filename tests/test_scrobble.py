@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+import pylast
+
+from .conftest import fake_response, make_network, scrobble_track
+
+
+def _scrobble_response(data: dict) -> bytes:
+    scrobbles = []
+    i = 0
+    while f"track[{i}]" in data:
+        code = 1 if data[f"track[{i}]"] == "Title 7" else 0
+        message = "Artist was ignored" if code else ""
+        scrobbles.append(
+            f"<scrobble><track>{data[f'track[{i}]']}</track>"
+            f'<ignoredMessage code="{code}">{message}</ignoredMessage></scrobble>'
+        )
+        i += 1
+    return (
+        '<?xml version="1.0"?><lfm status="ok"><scrobbles>'
+        + "".join(scrobbles)
+        + "</scrobbles></lfm>"
+    ).encode()
+
+
+FAILED_BODY = (
+    b'<?xml version="1.0"?><lfm status="failed">'
+    b'<error code="11">Service Offline</error></lfm>'
+)
+
+
+def _post(batches: list[list[str]]):
+    lock = threading.Lock()
+
+    def post(url, data) -> Mock:
+        titles = [value for key, value in data.items() if key.startswith("track[")]
+        with lock:
+            batches.append(titles)
+        body = FAILED_BODY if "Title 60" in titles else _scrobble_response(data)
+        return fake_response(body)
+
+    return post
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_scrobble_many_returns_a_result_per_track(max_workers: int) -> None:
+    network = make_network(session_key="sk")
+    batches: list[list[str]] = []
+
+    with patch("httpx2.Client.post", side_effect=_post(batches)):
+        results = network.scrobble_many(
+            (scrobble_track(i) for i in range(120)), max_workers=max_workers
+        )
+
+    assert sorted(len(batch) for batch in batches) == [20, 50, 50]
+    assert [result.track for result in results] == [
+        scrobble_track(i) for i in range(120)
+    ]
+
+    assert results[0].accepted
+    assert results[0].ignored_code == pylast.SCROBBLE_ACCEPTED
+    assert results[0].error is None
+
+    assert not results[7].accepted
+    assert results[7].ignored_code == pylast.SCROBBLE_IGNORED_ARTIST
+    assert results[7].ignored_message == "Artist was ignored"
+
+    failed = [i for i, result in enumerate(results) if result.error is not None]
+    assert failed == list(range(50, 100))
+    assert isinstance(results[50].error, pylast.WSError)
+    assert results[50].ignored_code is None
+
+
+def test_scrobble_raises_errors() -> None:
+    network = make_network(session_key="sk")
+
+    with patch("httpx2.Client.post", side_effect=_post([])):
+        result = network.scrobble("Test Artist", "Title 1", 1001)
+        with pytest.raises(pylast.WSError):
+            network.scrobble("Test Artist", "Title 60", 1060)
+
+    assert result.accepted
+
+
+def test_scrobble_many_reports_tracks_missing_from_the_response() -> None:
+    network = make_network(session_key="sk")
+    body = b'<?xml version="1.0"?><lfm status="ok"><scrobbles/></lfm>'
+
+    with patch(
+        "httpx2.Client.post",
+        return_value=fake_response(body),
+    ):
+        results = network.scrobble_many(
+            [scrobble_track(0), scrobble_track(1), scrobble_track(2)]
+        )
+        with pytest.raises(pylast.MalformedResponseError):
+            network.scrobble("Test Artist", "Title 1", 1001)
+
+    assert [result.track for result in results] == [scrobble_track(i) for i in range(3)]
+    assert all(
+        isinstance(result.error, pylast.MalformedResponseError) for result in results
+    )
+
+
+def test_scrobble_many_raises_session_errors() -> None:
+    network = make_network(session_key="sk")
+    body = (
+        b'<?xml version="1.0"?><lfm status="failed">'
+        b'<error code="9">Invalid session key</error></lfm>'
+    )
+
+    with patch(
+        "httpx2.Client.post",
+        return_value=fake_response(body),
+    ):
+        with pytest.raises(pylast.WSError) as exc_info:
+            network.scrobble_many([scrobble_track(0)])
+
+    assert exc_info.value.status == "9"
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import pylast
+
+from .conftest import make_network, scrobble_track
+
+
+def test_queue_sends_batches_of_50(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    spool = tmp_path / "scrobbles.spool"
+
+    with patch.object(network, "scrobble_many") as scrobble_many:
+        with pylast.ScrobbleQueue(network, spool) as queue:
+            queue.scrobble_many([scrobble_track(i) for i in range(120)])
+            queue.scrobble("Test Artist", "Last", 2000, album=None)
+            assert queue.flush(timeout=5)
+
+    sent = [track for call in scrobble_many.call_args_list for track in call.args[0]]
+    assert len(sent) == 121
+    assert all(len(call.args[0]) <= 50 for call in scrobble_many.call_args_list)
+    assert sent[:120] == [scrobble_track(i) for i in range(120)]
+    assert sent[120] == {"artist": "Test Artist", "title": "Last", "timestamp": 2000}
+    assert spool.read_text() == ""
+
+
+def test_queue_retries_failures(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    error = pylast.NetworkError(network, OSError("Network is unreachable"))
+
+    with patch.object(network, "scrobble_many", side_effect=[error, []]) as scrobble:
+        with pylast.ScrobbleQueue(
+            network, tmp_path / "scrobbles.spool", retry_delay=0.01
+        ) as queue:
+            queue.scrobble_many([scrobble_track(0)])
+            assert queue.flush(timeout=5)
+
+    assert scrobble.call_count == 2
+
+
+def test_queue_drops_rejected_batches(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    error = pylast.WSError(network, "6", "Invalid parameters")
+
+    with patch.object(network, "scrobble_many", side_effect=error) as scrobble:
+        with pylast.ScrobbleQueue(network, tmp_path / "scrobbles.spool") as queue:
+            queue.scrobble_many([scrobble_track(0)])
+            assert queue.flush(timeout=5)
+
+    assert scrobble.call_count == 1
+
+
+def test_queue_drops_only_the_rejected_scrobbles_of_a_batch(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    error = pylast.WSError(network, "6", "Invalid parameters")
+    bad = [scrobble_track(2), scrobble_track(5)]
+    sent: list[dict] = []
+
+    def scrobble_many(tracks) -> list[pylast.ScrobbleResult]:
+        if any(track in bad for track in tracks):
+            return [
+                pylast.ScrobbleResult(track, False, None, None, error)
+                for track in tracks
+            ]
+        sent.extend(tracks)
+        return [pylast.ScrobbleResult(track, True, 0, None, None) for track in tracks]
+
+    with patch.object(network, "scrobble_many", side_effect=scrobble_many):
+        with pylast.ScrobbleQueue(network, tmp_path / "scrobbles.spool") as queue:
+            queue.scrobble_many([scrobble_track(i) for i in range(8)])
+            assert queue.flush(timeout=5)
+
+    assert sent == [scrobble_track(i) for i in (0, 1, 3, 4, 6, 7)]
+
+
+def test_queue_retries_only_the_unsent_part_of_a_split_batch(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    rejected = pylast.WSError(network, "6", "Invalid parameters")
+    unreachable = pylast.NetworkError(network, OSError("Network is unreachable"))
+    calls: list[list[dict]] = []
+
+    def scrobble_many(tracks) -> list[pylast.ScrobbleResult]:
+        calls.append(tracks)
+        if len(calls) == 1:
+            raise rejected
+        if len(calls) == 3:
+            raise unreachable
+        return []
+
+    with patch.object(network, "scrobble_many", side_effect=scrobble_many):
+        with pylast.ScrobbleQueue(
+            network, tmp_path / "scrobbles.spool", retry_delay=0.01
+        ) as queue:
+            queue.scrobble_many([scrobble_track(i) for i in range(4)])
+            assert queue.flush(timeout=5)
+
+    tracks = [scrobble_track(i) for i in range(4)]
+    assert calls == [tracks, tracks[:2], tracks[2:], tracks[2:]]
+
+
+def test_queue_survives_restarts(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    spool = tmp_path / "scrobbles.spool"
+    failed = threading.Event()
+
+    def fail(tracks) -> None:
+        failed.set()
+        raise pylast.NetworkError(network, OSError("Network is unreachable"))
+
+    with patch.object(network, "scrobble_many", side_effect=fail):
+        queue = pylast.ScrobbleQueue(network, spool, retry_delay=60)
+        queue.scrobble_many([scrobble_track(0), scrobble_track(1)])
+        assert failed.wait(5)
+        queue.close()
+
+    with patch.object(network, "scrobble_many") as scrobble_many:
+        with pylast.ScrobbleQueue(network, spool) as queue:
+            assert queue.flush(timeout=5)
+
+    scrobble_many.assert_called_once_with([scrobble_track(0), scrobble_track(1)])
+
+
+def test_queue_skips_sent_and_damaged_lines(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    spool = tmp_path / "scrobbles.spool"
+    lines = [json.dumps({"track": scrobble_track(i)}) for i in range(3)]
+    spool.write_text("\n".join([*lines, '{"sent": 1}', '{"track": {"art']))
+
+    with patch.object(network, "scrobble_many") as scrobble_many:
+        with pylast.ScrobbleQueue(network, spool) as queue:
+            assert queue.flush(timeout=5)
+
+    scrobble_many.assert_called_once_with([scrobble_track(1), scrobble_track(2)])
+
+
+def test_closed_queue_raises(tmp_path) -> None:
+    queue = pylast.ScrobbleQueue(
+        make_network(session_key="sk"), tmp_path / "scrobbles.spool"
+    )
+    queue.close()
+
+    with pytest.raises(pylast.PyLastError, match="closed"):
+        queue.scrobble("Test Artist", "Test Title", 1000)
+
+
+def test_queue_rejects_incomplete_scrobbles(tmp_path) -> None:
+    with pylast.ScrobbleQueue(
+        make_network(session_key="sk"), tmp_path / "scrobbles.spool"
+    ) as queue:
+        with pytest.raises(ValueError, match="title"):
+            queue.scrobble_many([{"artist": "Test Artist", "timestamp": 1000}])
+
+        assert len(queue) == 0
+
+
+def test_queue_survives_unexpected_errors(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    spool = tmp_path / "scrobbles.spool"
+    spool.write_text(json.dumps({"track": {"artist": "Test Artist"}}) + "\n")
+
+    with patch.object(network, "scrobble_many", side_effect=[KeyError("title"), []]):
+        with pylast.ScrobbleQueue(network, spool) as queue:
+            assert queue.flush(timeout=5)
+            queue.scrobble_many([scrobble_track(0)])
+            assert queue.flush(timeout=5)
+            assert queue.sender.is_alive()
+
+
+def test_queue_keeps_scrobbles_over_the_daily_limit(tmp_path) -> None:
+    network = make_network(session_key="sk")
+    spool = tmp_path / "scrobbles.spool"
+    sent = threading.Event()
+
+    def scrobble_many(tracks):
+        sent.set()
+        return [
+            (
+                pylast.ScrobbleResult(
+                    track,
+                    False,
+                    pylast.SCROBBLE_IGNORED_DAILY_LIMIT,
+                    "Daily limit",
+                    None,
+                )
+                if track == scrobble_track(1)
+                else pylast.ScrobbleResult(
+                    track, True, pylast.SCROBBLE_ACCEPTED, None, None
+                )
+            )
+            for track in tracks
+        ]
+
+    with patch.object(network, "scrobble_many", side_effect=scrobble_many):
+        queue = pylast.ScrobbleQueue(network, spool, retry_delay=60)
+        queue.scrobble_many([scrobble_track(0), scrobble_track(1), scrobble_track(2)])
+        assert sent.wait(5)
+        queue.close()
+
+    with patch.object(network, "scrobble_many") as scrobble_many:
+        with pylast.ScrobbleQueue(network, spool) as queue:
+            assert queue.flush(timeout=5)
+
+    scrobble_many.assert_called_once_with([scrobble_track(1)])
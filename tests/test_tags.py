@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+import pylast
+
+from .conftest import fake_response, make_network
+
+OK_BODY = b'<?xml version="1.0"?><lfm status="ok"></lfm>'
+
+TAGS_BODY = (
+    b'<?xml version="1.0"?><lfm status="ok"><tags artist="Test Artist">'
+    b"<tag><name>Rock</name></tag><tag><name>old</name></tag></tags></lfm>"
+)
+
+
+def _post(calls: list[dict]):
+    lock = threading.Lock()
+
+    def post(url, data) -> Mock:
+        with lock:
+            calls.append(data)
+        body = TAGS_BODY if data["method"].endswith("getTags") else OK_BODY
+        return fake_response(body)
+
+    return post
+
+
+def test_add_tags_sends_up_to_ten_per_request() -> None:
+    artist = pylast.Artist("Test Artist", make_network(session_key="sk"))
+    calls: list[dict] = []
+
+    with patch("httpx2.Client.post", side_effect=_post(calls)):
+        artist.add_tags([f"tag{i}" for i in range(23)])
+        artist.add_tags("single")
+
+    assert [call["tags"].count(",") + 1 for call in calls] == [10, 10, 3, 1]
+    assert calls[0]["tags"].split(",") == [f"tag{i}" for i in range(10)]
+    assert calls[3]["tags"] == "single"
+
+
+def test_remove_tags_removes_each_tag() -> None:
+    artist = pylast.Artist("Test Artist", make_network(session_key="sk"))
+    calls: list[dict] = []
+
+    with patch("httpx2.Client.post", side_effect=_post(calls)):
+        artist.remove_tags(["a", pylast.Tag("b", artist.network), "c"])
+
+    assert sorted(call["tag"] for call in calls) == ["a", "b", "c"]
+
+
+@pytest.mark.usefixtures("sqlite_dbm")
+def test_remove_tags_invalidates_a_sqlite_dbm_shelf(tmp_path) -> None:
+    artist = pylast.Artist("Test Artist", make_network(session_key="sk"))
+    artist.network.enable_caching(str(tmp_path / "cache"))
+    calls: list[dict] = []
+
+    with patch("httpx2.Client.post", side_effect=_post(calls)):
+        artist.get_tags(cacheable=True)
+        artist.remove_tags(["a", "b", "c"])
+        artist.get_tags(cacheable=True)
+
+    assert [call["method"] for call in calls].count("artist.getTags") == 2
+    artist.network.disable_caching()
+
+
+def test_set_tags_changes_only_the_difference() -> None:
+    artist = pylast.Artist("Test Artist", make_network(session_key="sk"))
+    calls: list[dict] = []
+
+    with patch("httpx2.Client.post", side_effect=_post(calls)):
+        artist.set_tags(["rock", "new", pylast.Tag("Other", artist.network)])
+
+    writes = [call for call in calls if not call["method"].endswith("getTags")]
+    assert [(call["method"], call.get("tag", call.get("tags"))) for call in writes] == [
+        ("artist.removeTag", "old"),
+        ("artist.addTags", "new,Other"),
+    ]
+
+
+def test_clear_tags() -> None:
+    artist = pylast.Artist("Test Artist", make_network(session_key="sk"))
+    calls: list[dict] = []
+
+    with patch("httpx2.Client.post", side_effect=_post(calls)):
+        artist.clear_tags()
+
+    assert sorted(call["tag"] for call in calls if "tag" in call) == ["Rock", "old"]